@@ -5,15 +5,42 @@ This file is loaded by Nuke on startup (placed in ~/.nuke or NUKE_PATH).
 It performs minimal bootstrapping: adds the VfxPipe path to sys.path and
 triggers the main initialization.
 
+If a precompiled bundle built by scripts/build_bundle.py exists for the
+running Python version (dist/VfxPipe-cpXY.zip, or the archive named by the
+VFXPIPE_BUNDLE environment variable), it is used instead of the source tree.
+
 Installation:
     Set NUKE_PATH environment variable to include the DCC_plugins/nuke directory,
     or copy/symlink this file to your ~/.nuke directory.
 """
 
+import os
 import sys
 from pathlib import Path
 
 
+def find_bundle(root_dir):
+    """
+    Find the precompiled VfxPipe archive for the running Python version.
+
+    Args:
+        root_dir: Repository root containing the dist/ directory
+
+    Returns:
+        Path to the archive, or None if no usable archive exists
+    """
+    override = os.environ.get("VFXPIPE_BUNDLE")
+    if override:
+        bundle = Path(override).expanduser()
+        if bundle.is_file():
+            return bundle
+        print(f"[VfxPipe] WARNING: VFXPIPE_BUNDLE not found: {bundle}")
+        return None
+
+    bundle = root_dir / "dist" / f"VfxPipe-cp{sys.version_info[0]}{sys.version_info[1]}.zip"
+    return bundle if bundle.is_file() else None
+
+
 def bootstrap_vfxpipe():
     """Add VfxPipe to sys.path and trigger initialization."""
     # Get the root directory (two levels up from this file)
@@ -21,8 +48,13 @@ def bootstrap_vfxpipe():
     plugin_dir = Path(__file__).parent.resolve()
     root_dir = plugin_dir.parent.parent
 
+    # Prefer the single-archive bundle, fall back to the source tree
+    bundle = find_bundle(root_dir)
+    root_path = str(bundle) if bundle else str(root_dir)
+    if bundle:
+        print(f"[VfxPipe] Loading from bundle: {bundle}")
+
     # Add root to sys.path if not already present
-    root_path = str(root_dir)
     if root_path not in sys.path:
         sys.path.insert(0, root_path)
 
@@ -0,0 +1,390 @@
+"""
+VfxPipe Main-Thread Dispatch and Transactions
+
+Worker threads may only touch nodes and knobs from Nuke's main thread, and
+every nuke.executeInMainThread() round-trip waits behind the Qt event loop.
+
+submit() schedules a call on the main thread and returns a MainThreadFuture.
+The future completes when the call has actually finished, supports timeouts
+and cancellation (until the call starts), and records how long the call
+waited in the event loop queue separately from how long it ran.
+
+A Transaction collects an ordered batch of knob reads, writes, button
+executes and plain calls, runs the whole batch in a single main-thread hop
+and returns every result at once. Arguments are captured when an operation
+is added, so loops can queue operations without the late-binding pitfalls
+of lambdas.
+
+Examples:
+    >>> future = submit(node["trackFeatures"].execute)
+    >>> future.result(timeout=600)
+    >>> future.queue_wait, future.run_time
+    (0.03, 41.2)
+
+    >>> tx = Transaction()
+    >>> tx.set(node, "minLengthThreshold", 5)
+    >>> tx.execute(node, "doUpdateSolve")
+    >>> tx.read("rmse", node, "solveRMSE")
+    >>> results = tx.run()
+    >>> results["rmse"]
+    0.41
+"""
+
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from typing import Any, Callable, Dict, Optional
+
+
+class TransactionError(Exception):
+    """
+    Raised when an operation of a transaction fails on the main thread.
+
+    Operations after the failing one are not run.
+
+    Attributes:
+        index: Position of the failing operation in the transaction
+        operation: Description of the failing operation
+        results: Results of the operations that completed before it
+        error: Original exception
+    """
+
+    def __init__(self, index: int, operation: str, results: Dict[str, Any], error: BaseException):
+        super().__init__(f"Operation {index} ({operation}) failed: {error}")
+        self.index = index
+        self.operation = operation
+        self.results = results
+        self.error = error
+
+
+def _resolve_node(node):
+    """Accept a node or a node name; names are looked up on the main thread."""
+    if isinstance(node, str):
+        import nuke
+        resolved = nuke.toNode(node)
+        if resolved is None:
+            raise ValueError(f"Node '{node}' not found")
+        return resolved
+    return node
+
+
+def _node_label(node) -> str:
+    if isinstance(node, str):
+        return node
+    try:
+        return node.name()
+    except Exception:
+        return repr(node)
+
+
+def is_main_thread() -> bool:
+    """
+    Check if the calling thread is Nuke's main thread.
+
+    Returns:
+        True on the main thread
+    """
+    return threading.current_thread() is threading.main_thread()
+
+
+class MainThreadFuture(Future):
+    """
+    Future of a call scheduled on the main thread.
+
+    Timestamps are time.perf_counter() values and stay None until the
+    corresponding step happened.
+
+    Attributes:
+        label: Description of the call, used in logs and errors
+        queued_at: When the call was submitted
+        started_at: When the main thread started running it
+        finished_at: When it returned or raised
+    """
+
+    def __init__(self, label: str = ""):
+        super().__init__()
+        self.label = label
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        """Seconds spent waiting for the main thread, None if not started."""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.queued_at
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds spent running on the main thread, None if not finished."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def wait(self, timeout: Optional[float] = None, cancel_on_timeout: bool = True):
+        """
+        Wait for the result, cancelling the call if it times out.
+
+        A call that already started cannot be cancelled; it keeps running
+        and only the wait is abandoned.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+            cancel_on_timeout: Cancel the call if it has not started yet
+
+        Returns:
+            Result of the call
+
+        Raises:
+            concurrent.futures.TimeoutError: If the timeout expired
+            concurrent.futures.CancelledError: If the call was cancelled
+        """
+        try:
+            return self.result(timeout)
+        except TimeoutError:
+            if cancel_on_timeout:
+                self.cancel()
+            raise
+
+
+def _run_future(future: MainThreadFuture, func: Callable, args, kwargs):
+    """Run a submitted call on the main thread and complete its future."""
+    if not future.set_running_or_notify_cancel():
+        return
+    future.started_at = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    except BaseException as e:
+        future.finished_at = time.perf_counter()
+        future.set_exception(e)
+    else:
+        future.finished_at = time.perf_counter()
+        future.set_result(result)
+
+
+class MainThreadDispatcher:
+    """
+    Schedules calls on the main thread and keeps track of the pending ones.
+
+    Each worker can own a dispatcher so that cancelling the worker cancels
+    the main-thread calls it queued but that did not start yet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def submit(self, func: Callable, *args, **kwargs) -> MainThreadFuture:
+        """
+        Schedule a call on the main thread.
+
+        Runs inline when called from the main thread, since waiting there
+        for the event loop would deadlock.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            MainThreadFuture of the call
+        """
+        future = MainThreadFuture(getattr(func, '__name__', repr(func)))
+        if is_main_thread():
+            _run_future(future, func, args, kwargs)
+            return future
+
+        import nuke
+
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        nuke.executeInMainThread(_run_future, args=(future, func, args, kwargs))
+        return future
+
+    def call(self, func: Callable, *args, timeout: Optional[float] = None, **kwargs):
+        """
+        Run a call on the main thread and wait for its result.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            timeout: Maximum seconds to wait; a call that has not started
+                     by then is cancelled
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of the call
+        """
+        return self.submit(func, *args, **kwargs).wait(timeout)
+
+    def cancel_pending(self) -> int:
+        """
+        Cancel every submitted call that has not started yet.
+
+        Returns:
+            Number of calls cancelled
+        """
+        with self._lock:
+            pending = list(self._pending)
+        return sum(1 for future in pending if future.cancel())
+
+    def pending_count(self) -> int:
+        """Number of submitted calls that have not completed."""
+        with self._lock:
+            return len(self._pending)
+
+    def _discard(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+
+# Shared dispatcher used by submit() and Transaction.run()
+_dispatcher = MainThreadDispatcher()
+
+
+def submit(func: Callable, *args, **kwargs) -> MainThreadFuture:
+    """
+    Schedule a call on the main thread with the shared dispatcher.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        MainThreadFuture of the call
+    """
+    return _dispatcher.submit(func, *args, **kwargs)
+
+
+class Transaction:
+    """
+    Ordered batch of main-thread operations run in one hop.
+
+    Reads and calls store their result under a key; writes and executes
+    return nothing. Methods return the transaction so calls can be chained.
+    """
+
+    def __init__(self):
+        self._operations = []
+
+    def __len__(self):
+        return len(self._operations)
+
+    def read(self, key: str, node, knob: str, method: str = "value", *args) -> "Transaction":
+        """
+        Read a knob value.
+
+        Args:
+            key: Name of the result
+            node: Node or node name
+            knob: Knob name
+            method: Knob method returning the value ("value", "getValue", ...)
+            *args: Arguments passed to the method
+        """
+        def op():
+            return getattr(_resolve_node(node)[knob], method)(*args)
+        return self._add(op, key, f"read {_node_label(node)}.{knob}")
+
+    def set(self, node, knob: str, value, *args) -> "Transaction":
+        """
+        Set a knob value.
+
+        Args:
+            node: Node or node name
+            knob: Knob name
+            value: New value
+            *args: Extra setValue() arguments (index, time, view)
+        """
+        def op():
+            _resolve_node(node)[knob].setValue(value, *args)
+        return self._add(op, None, f"set {_node_label(node)}.{knob}")
+
+    def execute(self, node, knob: str) -> "Transaction":
+        """
+        Press a button (or run a script knob).
+
+        Args:
+            node: Node or node name
+            knob: Knob name
+        """
+        def op():
+            _resolve_node(node)[knob].execute()
+        return self._add(op, None, f"execute {_node_label(node)}.{knob}")
+
+    def call(self, key: Optional[str], func: Callable, *args, **kwargs) -> "Transaction":
+        """
+        Call a function on the main thread.
+
+        Args:
+            key: Name of the result, or None to discard it
+            func: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+        """
+        name = getattr(func, '__name__', repr(func))
+        return self._add(lambda: func(*args, **kwargs), key, f"call {name}")
+
+    def _add(self, op: Callable, key: Optional[str], label: str) -> "Transaction":
+        self._operations.append((op, key, label))
+        return self
+
+    def apply(self) -> Dict[str, Any]:
+        """
+        Run the operations in order on the calling thread.
+
+        Must be called on the main thread; use run() from worker threads.
+
+        Returns:
+            Dictionary of results by key
+
+        Raises:
+            TransactionError: If an operation fails
+        """
+        results = {}
+        for index, (op, key, label) in enumerate(self._operations):
+            try:
+                value = op()
+            except Exception as e:
+                raise TransactionError(index, label, results, e)
+            if key is not None:
+                results[key] = value
+        return results
+
+    def submit(self, dispatcher: Optional[MainThreadDispatcher] = None) -> MainThreadFuture:
+        """
+        Schedule the whole transaction as a single main-thread call.
+
+        Args:
+            dispatcher: Dispatcher to use (default: the shared one)
+
+        Returns:
+            MainThreadFuture resolving to the dictionary of results
+        """
+        return (dispatcher or _dispatcher).submit(self.apply)
+
+    def run(self, timeout: Optional[float] = None,
+            dispatcher: Optional[MainThreadDispatcher] = None) -> Dict[str, Any]:
+        """
+        Run the whole transaction in a single main-thread hop and wait for it.
+
+        Runs inline when called from the main thread.
+
+        Args:
+            timeout: Maximum seconds to wait; the transaction is cancelled if
+                     it has not started by then
+            dispatcher: Dispatcher to use (default: the shared one)
+
+        Returns:
+            Dictionary of results by key
+
+        Raises:
+            TransactionError: If an operation fails
+            concurrent.futures.TimeoutError: If the timeout expired
+        """
+        if not self._operations:
+            return {}
+        return self.submit(dispatcher).wait(timeout)
+
@@ -0,0 +1,112 @@
+"""
+VfxPipe Lazy Menu Commands
+
+Lightweight proxies used as Nuke menu commands. A proxy holds a
+"module:function" reference and only imports the tool module the first time
+the menu entry is clicked, so building the VfxPipe menu costs the same no
+matter how many tools are installed.
+
+The time spent importing each tool on first use is recorded and can be
+queried with get_import_timings().
+"""
+
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# Import cost of each resolved reference, in seconds
+_import_timings = {}
+_lock = threading.Lock()
+
+
+def resolve_ref(ref: str) -> Callable:
+    """
+    Import and return the callable named by a "module:function" reference.
+
+    Args:
+        ref: Reference string, e.g. "VfxPipe.nuke.tools.auto_track:show_auto_track_widget"
+
+    Returns:
+        The referenced callable
+
+    Raises:
+        ValueError: If the reference is malformed
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such attribute
+    """
+    module_name, sep, attr_path = ref.partition(":")
+    if not sep or not module_name or not attr_path:
+        raise ValueError(f"Invalid command reference '{ref}', expected 'module:function'")
+
+    target = importlib.import_module(module_name)
+    for attr in attr_path.split("."):
+        target = getattr(target, attr)
+    return target
+
+
+class LazyCommand:
+    """
+    Callable menu command that imports its target on first use.
+
+    Nuke accepts any callable for Menu.addCommand(), so instances can be
+    passed directly in place of the real tool function.
+    """
+
+    def __init__(self, ref: str, label: Optional[str] = None):
+        self.ref = ref
+        self.label = label or ref
+        self._target = None
+
+    @property
+    def resolved(self) -> bool:
+        """True once the target callable has been imported."""
+        return self._target is not None
+
+    def resolve(self) -> Callable:
+        """
+        Import the target callable if needed and return it.
+
+        Returns:
+            The referenced callable
+        """
+        if self._target is None:
+            start_time = time.perf_counter()
+            target = resolve_ref(self.ref)
+            elapsed = time.perf_counter() - start_time
+
+            with _lock:
+                _import_timings.setdefault(self.ref, elapsed)
+            print(f"[VfxPipe] Loaded {self.label} on first use in {elapsed * 1000:.1f} ms")
+
+            self._target = target
+        return self._target
+
+    def reset(self):
+        """Forget the resolved target so the next call resolves it again."""
+        self._target = None
+
+    def __call__(self, *args, **kwargs) -> Any:
+        try:
+            target = self.resolve()
+        except Exception as e:
+            print(f"[VfxPipe] ERROR loading command {self.label} ({self.ref}): {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+        return target(*args, **kwargs)
+
+    def __repr__(self):
+        return f"LazyCommand({self.ref!r})"
+
+
+def get_import_timings() -> Dict[str, float]:
+    """
+    Get the first-use import cost of every resolved command.
+
+    Returns:
+        Dictionary mapping "module:function" references to seconds
+    """
+    with _lock:
+        return dict(_import_timings)
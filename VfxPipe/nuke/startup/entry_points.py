@@ -0,0 +1,279 @@
+"""
+VfxPipe Tool Entry Points
+
+Lets packages outside VfxPipe (show or site specific tools) register Nuke
+tools through Python packaging entry points, next to the modules found in
+VfxPipe/nuke/tools. A package declares them in its pyproject.toml:
+
+    [project.entry-points."vfxpipe.nuke.tools"]
+    shot_publish = "showtools.nuke.shot_publish"
+
+The entry point name is the tool name and the value names a module that
+follows the usual register() contract ("module:function" names a different
+registration function).
+
+Scanning installed distributions is slow on shared storage, so the resolved
+set is cached per environment. The cache is keyed on the interpreter and the
+mtime of every sys.path entry, which changes whenever a distribution is
+installed, upgraded or removed; a warm start costs one stat per sys.path
+entry and one cache read. The first initialization stage of a GUI session
+only reads the cache; the scan and the cache build run in the background
+stage (see init.py).
+
+Environment variables:
+    VFXPIPE_TOOL_CACHE: Set to 0 to disable this cache (and the tool manifest)
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from VfxPipe.utils.cache import cache_key, get_cache_dir, read_json, write_json_atomic
+
+
+ENTRY_POINT_GROUP = "vfxpipe.nuke.tools"
+
+CACHE_FORMAT = 1
+
+
+class ToolSource:
+    """
+    Where a tool comes from and how to load it.
+
+    Attributes:
+        name: Tool name
+        module_name: Full dotted module name
+        path: File used to fingerprint the tool, or None if unknown
+        register_name: Name of the registration function in the module
+        origin: "directory" or the distribution providing the entry point
+    """
+
+    def __init__(self, name: str, module_name: str, path: Optional[Path] = None,
+                 register_name: str = "register", origin: str = "directory"):
+        self.name = name
+        self.module_name = module_name
+        self.path = path
+        self.register_name = register_name
+        self.origin = origin
+
+    def __repr__(self):
+        return f"ToolSource({self.name!r}, {self.module_name!r}, origin={self.origin!r})"
+
+
+def environment_key() -> str:
+    """
+    Build the key identifying the current set of installed distributions.
+
+    Returns:
+        Cache key derived from the interpreter and the sys.path entries' mtimes
+    """
+    parts = [sys.executable, sys.version]
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        parts.append(f"{entry}={mtime}")
+    return cache_key(*parts)
+
+
+def _cache_path() -> Path:
+    return get_cache_dir() / f"nuke_entry_points-{cache_key(sys.executable, sys.version)}.json"
+
+
+def _metadata_module():
+    """Get importlib.metadata, or the importlib_metadata backport on Python 3.7."""
+    try:
+        from importlib import metadata
+    except ImportError:
+        try:
+            import importlib_metadata as metadata
+        except ImportError:
+            return None
+    return metadata
+
+
+def _module_origin(module_name: str) -> Optional[str]:
+    """Locate a module's source file without executing the module itself."""
+    import importlib.util
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    origin = getattr(spec, 'origin', None)
+    return origin if origin and origin.endswith(".py") else None
+
+
+def _parse_entry_points(text: str, group: str) -> List[Tuple[str, str]]:
+    """
+    Read the entries of one group from the text of an entry_points.txt file.
+
+    Args:
+        text: File content (INI style: [group] headers, name = value lines)
+        group: Entry point group name
+
+    Returns:
+        List of (name, value) tuples in file order
+    """
+    entries = []
+    section = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            section = line[1:-1].strip()
+        elif section == group and "=" in line:
+            name, _, value = line.partition("=")
+            entries.append((name.strip(), value.strip()))
+    return entries
+
+
+def _distribution_name(info_dir: Path) -> str:
+    """Read the project name from a .dist-info or .egg-info directory."""
+    for file_name in ("METADATA", "PKG-INFO"):
+        try:
+            with open(info_dir / file_name, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if not line.strip():
+                        break
+                    if line.lower().startswith("name:"):
+                        return line.split(":", 1)[1].strip()
+        except OSError:
+            continue
+    return info_dir.name.split("-", 1)[0]
+
+
+def _path_entry_points(entry: str, group: str) -> List[Tuple[str, str, str]]:
+    """
+    List the entry points of a group found in one sys.path entry.
+
+    Directories are read directly: each distribution's .dist-info or
+    .egg-info directory holds an entry_points.txt file. importlib.metadata is
+    only imported for zipped sys.path entries, since importing it costs more
+    than the scan itself.
+
+    Args:
+        entry: sys.path entry
+        group: Entry point group name
+
+    Returns:
+        List of (distribution, name, value) tuples
+    """
+    directory = entry or "."
+    if os.path.isfile(directory):
+        metadata = _metadata_module()
+        if metadata is None:
+            return []
+        found = []
+        for dist in metadata.distributions(path=[directory]):
+            for entry_point in dist.entry_points:
+                if entry_point.group == group:
+                    found.append((dist.metadata['Name'], entry_point.name, entry_point.value))
+        return found
+
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        if not name.endswith((".dist-info", ".egg-info")):
+            continue
+        info_dir = Path(directory) / name
+        try:
+            text = (info_dir / "entry_points.txt").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        entries = _parse_entry_points(text, group)
+        if entries:
+            dist_name = _distribution_name(info_dir)
+            found.extend((dist_name, entry_name, value) for entry_name, value in entries)
+    return found
+
+
+def scan_entry_points(group: str = ENTRY_POINT_GROUP) -> List[Dict[str, Any]]:
+    """
+    Resolve the entry points of a group from the installed distributions.
+
+    Like importlib.metadata, a distribution installed in several sys.path
+    entries is only read from the first one.
+
+    Args:
+        group: Entry point group name
+
+    Returns:
+        List of JSON-safe dictionaries sorted by tool name
+    """
+    tools = {}
+    seen_dists = set()
+    for entry in sys.path:
+        try:
+            found = _path_entry_points(entry, group)
+        except Exception as e:
+            print(f"[VfxPipe] WARNING: Could not read entry points from {entry}: {e}")
+            continue
+
+        path_dists = set()
+        for dist_name, entry_name, value in found:
+            key = dist_name.lower().replace("-", "_").replace(".", "_")
+            if key in seen_dists:
+                continue
+            path_dists.add(key)
+
+            module_name, _, attr = value.partition(":")
+            module_name = module_name.strip()
+            attr = attr.split("[", 1)[0].strip() or "register"
+
+            if entry_name in tools:
+                print(f"[VfxPipe] WARNING: Duplicate tool entry point '{entry_name}' "
+                      f"from {dist_name}, ignoring it")
+                continue
+
+            tools[entry_name] = {
+                'name': entry_name,
+                'module': module_name,
+                'register': attr,
+                'path': _module_origin(module_name),
+                'dist': dist_name,
+            }
+        seen_dists.update(path_dists)
+    return [tools[name] for name in sorted(tools)]
+
+
+def find_entry_point_tools(use_cache: bool = True, cached_only: bool = False) -> List[ToolSource]:
+    """
+    Get the tools registered through the vfxpipe.nuke.tools entry point group.
+
+    Args:
+        use_cache: Serve the result from the per-environment cache when valid
+        cached_only: Never scan the installed distributions; without a valid
+                     cache no entry point tools are returned
+
+    Returns:
+        List of ToolSource sorted by tool name
+    """
+    key = environment_key()
+    path = _cache_path()
+
+    data = read_json(path, default={}) if use_cache else {}
+    if isinstance(data, dict) and data.get('format') == CACHE_FORMAT and data.get('key') == key:
+        entries = data.get('tools') or []
+    elif cached_only:
+        entries = []
+    else:
+        entries = scan_entry_points()
+        if use_cache:
+            write_json_atomic(path, {'format': CACHE_FORMAT, 'key': key, 'tools': entries})
+
+    return [
+        ToolSource(
+            entry['name'],
+            entry['module'],
+            path=Path(entry['path']) if entry.get('path') else None,
+            register_name=entry.get('register') or "register",
+            origin=entry.get('dist') or "unknown",
+        )
+        for entry in entries
+    ]
@@ -7,16 +7,45 @@ This module handles:
 - Tool discovery and registration
 - Menu setup
 - Logging configuration
+
+In terminal sessions (nuke -t) and on the farm VfxPipe starts in headless
+mode: only tools exposing batch entry points are registered and menu
+construction is skipped. The mode follows nuke.GUI unless forced with the
+VFXPIPE_HEADLESS environment variable (1 = headless, 0 = GUI).
+
+Interactive sessions initialize in two stages. The first stage runs inside
+init.py and only registers menu entries from the tool manifest and the
+entry point cache. The second stage (environment validation, entry point
+scan, tool imports and cache refresh) runs in a background thread once the Nuke UI is idle. Set VFXPIPE_DEFERRED_INIT=0 to
+run everything synchronously.
+
+Tools edited while Nuke is running can be picked up with reload_tools()
+(VfxPipe > Reload Tools), which reloads only the changed tool modules and the
+widgets they depend on.
 """
 
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from VfxPipe.nuke.startup import manifest, profiler
+from VfxPipe.nuke.startup.commands import LazyCommand
 
 
 # Track initialization state
 _initialized = False
+_headless = False
 _registered_tools = []
+_deferred_tools = {}
+_vfxpipe_menu = None
+_menu_entries = {}
+_started_ns = 0
+_registry_lock = threading.RLock()
+_background_done = threading.Event()
+_background_timings = {}
 
 
 def initialize():
@@ -24,22 +53,186 @@ def initialize():
     Main initialization function called from DCC_plugins/nuke/init.py
 
     This function orchestrates the entire startup sequence for VfxPipe in Nuke.
+    Set VFXPIPE_PROFILE_STARTUP=1 to profile each phase (see profiler.py).
+
+    In GUI sessions with deferred initialization enabled, only the first
+    stage runs here and the rest is scheduled with _schedule_background_stage().
     """
-    global _initialized
+    global _initialized, _headless, _started_ns
 
     if _initialized:
         print("[VfxPipe] Already initialized, skipping...")
         return
 
-    print("[VfxPipe] Initializing VfxPipe for Nuke...")
+    _started_ns = time.time_ns()
+
+    _headless = is_headless()
+    deferred = not _headless and is_deferred_init_enabled()
+    mode = "headless" if _headless else "GUI"
+    print(f"[VfxPipe] Initializing VfxPipe for Nuke ({mode} mode)...")
 
-    # Run initialization steps
-    validate_environment()
-    discover_and_register_tools()
-    setup_menus()
+    startup_profiler = profiler.StartupProfiler.from_environment()
+    profiler.set_profiler(startup_profiler)
+    startup_profiler.start()
+    start_time = time.perf_counter()
+
+    try:
+        if deferred:
+            # Stage 1: menu entries from cached metadata only
+            with startup_profiler.phase("register_cached_tools"):
+                discover_and_register_tools(cached_only=True)
+            with startup_profiler.phase("setup_menus"):
+                setup_menus()
+        else:
+            # Run initialization steps
+            with startup_profiler.phase("validate_environment"):
+                validate_environment()
+            with startup_profiler.phase("discover_and_register_tools"):
+                discover_and_register_tools()
+            if _headless:
+                print("[VfxPipe] Headless session, skipping menu setup")
+            else:
+                with startup_profiler.phase("setup_menus"):
+                    setup_menus()
+    finally:
+        if not deferred:
+            startup_profiler.finish()
 
     _initialized = True
-    print("[VfxPipe] Initialization complete!")
+    elapsed = time.perf_counter() - start_time
+
+    if deferred:
+        print(f"[VfxPipe] Menu ready in {elapsed * 1000:.1f} ms, "
+              f"continuing initialization in the background")
+        _schedule_background_stage()
+    else:
+        _background_done.set()
+        print("[VfxPipe] Initialization complete!")
+
+
+def is_deferred_init_enabled() -> bool:
+    """
+    Check if two-stage (deferred) initialization is enabled.
+
+    Returns:
+        True unless VFXPIPE_DEFERRED_INIT is set to 0/false/off
+    """
+    value = os.environ.get("VFXPIPE_DEFERRED_INIT", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+def _schedule_background_stage():
+    """
+    Start the second initialization stage once the Nuke UI is idle.
+
+    A zero-delay Qt timer fires on the first pass of the event loop, i.e.
+    after the UI has been shown. Without a running Qt application the stage
+    starts immediately.
+    """
+    def start_thread():
+        thread = threading.Thread(target=_run_background_stage, name="VfxPipe-init")
+        thread.daemon = True
+        thread.start()
+
+    try:
+        from VfxPipe import qt
+        app = qt.QtCore.QCoreApplication.instance()
+        if app is not None:
+            qt.QtCore.QTimer.singleShot(0, start_thread)
+            return
+    except Exception as e:
+        print(f"[VfxPipe] Could not schedule background initialization on the UI: {e}")
+
+    start_thread()
+
+
+def _run_background_stage():
+    """
+    Second initialization stage: validation, tool imports and cache refresh.
+
+    Runs in a background thread; menu entries for tools imported here are
+    added from the main thread.
+    """
+    startup_profiler = profiler.get_profiler()
+    start_time = time.perf_counter()
+
+    try:
+        phase_start = time.perf_counter()
+        with startup_profiler.phase("validate_environment"):
+            validate_environment()
+        _background_timings['validate_environment'] = time.perf_counter() - phase_start
+
+        phase_start = time.perf_counter()
+        with startup_profiler.phase("discover_and_register_tools"):
+            discover_and_register_tools(skip_registered=True)
+        _background_timings['discover_and_register_tools'] = time.perf_counter() - phase_start
+
+    except Exception as e:
+        print(f"[VfxPipe] ERROR during background initialization: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        _background_timings['total'] = time.perf_counter() - start_time
+        startup_profiler.finish()
+        print(
+            f"[VfxPipe] Background initialization complete in "
+            f"{_background_timings['total'] * 1000:.1f} ms ("
+            + ", ".join(
+                f"{name} {seconds * 1000:.1f} ms"
+                for name, seconds in _background_timings.items() if name != 'total'
+            )
+            + ")"
+        )
+        _background_done.set()
+
+
+def wait_for_background_init(timeout: Optional[float] = None) -> bool:
+    """
+    Block until the background initialization stage has finished.
+
+    Args:
+        timeout: Maximum seconds to wait (None waits forever)
+
+    Returns:
+        bool: True if initialization is complete
+    """
+    return _background_done.wait(timeout)
+
+
+def get_background_timings() -> Dict[str, float]:
+    """
+    Get the duration of each background initialization phase.
+
+    Returns:
+        Dictionary mapping phase names (and 'total') to seconds
+    """
+    return dict(_background_timings)
+
+
+def is_headless() -> bool:
+    """
+    Determine whether VfxPipe should start in headless mode.
+
+    VFXPIPE_HEADLESS forces the mode (1/true = headless, 0/false = GUI);
+    otherwise the session is headless when Nuke runs without a GUI or the
+    nuke module is not available at all.
+
+    Returns:
+        True for terminal/farm sessions, False for interactive sessions
+    """
+    forced = os.environ.get("VFXPIPE_HEADLESS", "").strip().lower()
+    if forced in ("1", "true", "on", "yes"):
+        return True
+    if forced in ("0", "false", "off", "no"):
+        return False
+
+    nuke = sys.modules.get("nuke")
+    if nuke is None:
+        try:
+            import nuke
+        except ImportError:
+            return True
+    return not getattr(nuke, "GUI", True)
 
 
 def validate_environment():
@@ -64,80 +257,351 @@ def validate_environment():
     except ImportError:
         print("[VfxPipe] WARNING: Nuke module not available (may be expected in some contexts)")
 
-    # Verify VfxPipe package structure
-    vfxpipe_root = Path(__file__).parent.parent.parent
-    required_dirs = ['nuke/tools', 'nuke/widgets', 'utils']
+    # Verify VfxPipe package structure (works for the source tree and bundles)
+    import importlib.util
+    required_packages = ['nuke.tools', 'nuke.widgets', 'utils']
 
-    for dir_path in required_dirs:
-        full_path = vfxpipe_root / dir_path
-        if not full_path.exists():
-            print(f"[VfxPipe] WARNING: Missing directory: {dir_path}")
+    for package in required_packages:
+        try:
+            spec = importlib.util.find_spec(f"VfxPipe.{package}")
+        except ImportError:
+            spec = None
+        if spec is None:
+            print(f"[VfxPipe] WARNING: Missing directory: {package.replace('.', '/')}")
 
     print("[VfxPipe] Environment validation complete")
 
 
-def discover_and_register_tools():
+def discover_and_register_tools(cached_only: bool = False, skip_registered: bool = False):
     """
     Discover and register all available VfxPipe tools.
 
-    Scans the VfxPipe/nuke/tools directory for tool modules and registers them.
+    Scans the VfxPipe/nuke/tools directory and the vfxpipe.nuke.tools entry
+    point group (see entry_points.py) for tool modules and registers them.
     Tools should implement a register() function to be auto-loaded.
+
+    Tool metadata is served from the persisted tool manifest when the tool
+    file is unchanged, so a warm start registers tools without importing them.
+    Only new or modified tools are imported to refresh their manifest entry.
+
+    Imports run in parallel (see loader.py) while tools are still registered
+    in a deterministic order. A tool exceeding its load timeout is deferred
+    and registered once its import completes.
+
+    Args:
+        cached_only: Only register tools served by the manifest, import nothing
+        skip_registered: Leave tools that are already registered untouched
     """
-    global _registered_tools
 
     print("[VfxPipe] Discovering tools...")
 
     tools_dir = Path(__file__).parent.parent / "tools"
+    bundle = _bundle_archive()
 
-    if not tools_dir.exists():
-        print("[VfxPipe] No tools directory found")
-        return
+    use_manifest = manifest.is_enabled()
 
-    # Find all Python modules in tools directory (excluding __init__.py)
-    tool_modules = [
-        f.stem for f in tools_dir.glob("*.py")
-        if f.is_file() and f.stem != "__init__"
-    ]
+    # Python modules in the tools directory plus tools from entry points
+    tool_sources = _find_tools(tools_dir, bundle, use_cache=use_manifest, cached_only=cached_only)
 
-    if not tool_modules:
-        print("[VfxPipe] No tools found in tools directory")
+    if not tool_sources:
+        print("[VfxPipe] No tools found")
         return
 
-    # Import and register each tool
-    for tool_name in tool_modules:
-        try:
-            print(f"[VfxPipe] Loading tool: {tool_name}")
-            module = __import__(
-                f"VfxPipe.nuke.tools.{tool_name}",
-                fromlist=[tool_name]
-            )
-
-            # Check if module has a register function
-            if hasattr(module, 'register'):
-                tool_info = module.register()
-                _registered_tools.append({
-                    'name': tool_name,
-                    'module': module,
-                    'info': tool_info
-                })
-                print(f"[VfxPipe] Registered tool: {tool_name}")
+    tool_manifest = manifest.ToolManifest.load(tools_dir) if use_manifest else None
+
+    cached_entries = {}
+    futures = {}
+    if skip_registered:
+        with _registry_lock:
+            registered = {tool['name'] for tool in _registered_tools}
+        tool_sources = [source for source in tool_sources if source.name not in registered]
+
+    to_load = []
+    for source in tool_sources:
+        tool_name = source.name
+        entry = tool_manifest.lookup(tool_name, source.path) if tool_manifest else None
+        if entry is not None:
+            cached_entries[tool_name] = entry
+        elif cached_only:
+            print(f"[VfxPipe] Tool {tool_name} is new or changed, loading it in the background")
+        else:
+            to_load.append(source)
+
+    # Start importing every tool the manifest cannot serve, in parallel.
+    # The loader (and its threading machinery) is only imported when needed.
+    tool_loader = None
+    if to_load:
+        from VfxPipe.nuke.startup import loader
+        import VfxPipe.nuke.tools  # noqa: F401 - parent package, imported once up front
+        tool_loader = loader.ParallelToolLoader.from_environment()
+        for source in to_load:
+            print(f"[VfxPipe] Loading tool: {source.name}")
+            futures[source.name] = tool_loader.submit(source.name, source.module_name, source.register_name)
+
+    # Register in deterministic order, deferring tools that exceed their timeout
+    for source in tool_sources:
+        tool_name = source.name
+        entry = cached_entries.get(tool_name)
+        if entry is not None:
+            if entry.get('has_register'):
+                with _registry_lock:
+                    _register_tool(tool_name, None, entry.get('info'), cached=True,
+                                   tool_file=source.path, fingerprint=entry.get('fingerprint'))
             else:
                 print(f"[VfxPipe] WARNING: Tool {tool_name} has no register() function")
+            continue
+
+        future = futures.get(tool_name)
+        if future is None:
+            continue
+        if not tool_loader.wait(future):
+            print(f"[VfxPipe] WARNING: Tool {tool_name} exceeded {tool_loader.timeout:.1f}s, "
+                  f"deferring registration")
+            with _registry_lock:
+                _deferred_tools[tool_name] = future
+            future.add_done_callback(
+                lambda f, name=tool_name, path=source.path: _on_deferred_tool_loaded(name, path, f, tool_manifest)
+            )
+            continue
 
-        except Exception as e:
-            print(f"[VfxPipe] ERROR loading tool {tool_name}: {e}")
-            import traceback
-            traceback.print_exc()
+        _handle_load_result(tool_name, source.path, future, tool_manifest)
+
+    if tool_manifest:
+        with _registry_lock:
+            if not cached_only and not skip_registered:
+                tool_manifest.prune(source.name for source in tool_sources)
+            tool_manifest.save()
 
     print(f"[VfxPipe] Registered {len(_registered_tools)} tool(s)")
 
 
+def _handle_load_result(tool_name: str, tool_file: Path, future, tool_manifest) -> bool:
+    """
+    Register a tool from a finished load and refresh its manifest entry.
+
+    Args:
+        tool_name: Tool module name
+        tool_file: File used to fingerprint the tool
+        future: Finished future from the ParallelToolLoader
+        tool_manifest: ToolManifest to update, or None
+
+    Returns:
+        bool: True if the tool was added to the registry
+    """
+    error = future.exception()
+    if error is not None:
+        print(f"[VfxPipe] ERROR loading tool {tool_name}: {error}")
+        import traceback
+        traceback.print_exception(type(error), error, error.__traceback__)
+        return False
+
+    return _apply_load_result(future.result(), tool_file, tool_manifest)
+
+
+def _apply_load_result(result, tool_file: Path, tool_manifest) -> bool:
+    """
+    Register a freshly imported tool, refresh its manifest entry and menu entry.
+
+    Args:
+        result: loader.ToolLoadResult of the tool
+        tool_file: File used to fingerprint the tool
+        tool_manifest: ToolManifest to update, or None
+
+    Returns:
+        bool: True if the tool is in the registry
+    """
+    tool_name = result.name
+    registered = False
+
+    with _registry_lock:
+        if tool_manifest:
+            tool_manifest.update(tool_name, result.module_name, tool_file,
+                                 result.has_register, result.info)
+            fingerprint = tool_manifest.tools[tool_name].get('fingerprint')
+        else:
+            fingerprint = _stat_fingerprint(tool_file)
+
+        # Check if module has a register function
+        if result.has_register:
+            registered = _register_tool(tool_name, result.module, result.info, cached=False,
+                                        tool_file=tool_file, fingerprint=fingerprint)
+        else:
+            print(f"[VfxPipe] WARNING: Tool {tool_name} has no register() function")
+        menu = _vfxpipe_menu
+        tool = _find_registered(tool_name) if registered else None
+
+    # Menus already built (deferred stage or late tool): add the entry on the main thread
+    if menu is not None and tool is not None:
+        try:
+            import nuke
+            nuke.executeInMainThread(_add_menu_entry, args=(menu, tool))
+        except Exception as e:
+            print(f"[VfxPipe] ERROR adding menu entry for {tool_name}: {e}")
+    return registered
+
+
+def _on_deferred_tool_loaded(tool_name: str, tool_file: Path, future, tool_manifest):
+    """
+    Register a tool that finished loading after its startup timeout.
+
+    Runs in the loader thread. If the VfxPipe menu already exists, the tool's
+    entry is added to it from the main thread (see _handle_load_result).
+    """
+    with _registry_lock:
+        _deferred_tools.pop(tool_name, None)
+
+    print(f"[VfxPipe] Deferred tool finished loading: {tool_name}")
+    if _handle_load_result(tool_name, tool_file, future, tool_manifest) and tool_manifest:
+        with _registry_lock:
+            tool_manifest.save()
+
+
+def _register_tool(tool_name: str, module, tool_info: Optional[Dict[str, Any]], cached: bool,
+                   tool_file: Optional[Path] = None,
+                   fingerprint: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Add a tool to the registry, replacing a previous entry of the same tool.
+
+    In headless mode only tools declaring batch entry points are registered.
+
+    Args:
+        tool_name: Tool module name
+        module: Imported tool module, or None when registered from the manifest
+        tool_info: Metadata returned by register()
+        cached: Whether the metadata came from the tool manifest
+        tool_file: File used to fingerprint the tool
+        fingerprint: Fingerprint of tool_file when the metadata was produced
+
+    Returns:
+        bool: True if the tool is in the registry
+    """
+    existing = _find_registered(tool_name)
+
+    if _headless and not (tool_info or {}).get('batch'):
+        print(f"[VfxPipe] Skipping GUI-only tool in headless mode: {tool_name}")
+        if existing is not None:
+            _registered_tools.remove(existing)
+        return False
+
+    tool = {
+        'name': tool_name,
+        'module': module,
+        'info': tool_info,
+        'cached': cached,
+        'file': tool_file,
+        'fingerprint': fingerprint,
+    }
+    if existing is not None:
+        _registered_tools[_registered_tools.index(existing)] = tool
+    else:
+        _registered_tools.append(tool)
+    print(f"[VfxPipe] Registered tool: {tool_name}{' (cached)' if cached else ''}")
+    return True
+
+
+def _find_registered(tool_name: str) -> Optional[Dict[str, Any]]:
+    """Get the registry entry of a tool, or None. Call with _registry_lock held."""
+    for tool in _registered_tools:
+        if tool['name'] == tool_name:
+            return tool
+    return None
+
+
+def _stat_fingerprint(tool_file: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Cheap mtime/size fingerprint for tools registered without a manifest."""
+    if tool_file is None:
+        return None
+    try:
+        return manifest.file_fingerprint(tool_file, with_hash=False)
+    except OSError:
+        return None
+
+
+def _bundle_archive() -> Optional[Path]:
+    """
+    Get the zip archive VfxPipe was imported from, if any.
+
+    Returns:
+        Path to the deployment bundle, or None when running from source
+    """
+    archive = getattr(__loader__, 'archive', None)
+    return Path(archive) if archive else None
+
+
+def _find_tools(tools_dir: Path, bundle: Optional[Path] = None, use_cache: bool = True,
+                cached_only: bool = False):
+    """
+    List every available tool: the tools directory first, then entry points.
+
+    Entry point tools named like a built-in tool are ignored.
+
+    Args:
+        tools_dir: VfxPipe/nuke/tools directory of the source tree
+        bundle: Deployment bundle VfxPipe was imported from, if any
+        use_cache: Serve entry points from the per-environment cache
+        cached_only: Only list entry points the cache holds, scan nothing
+
+    Returns:
+        List of entry_points.ToolSource in registration order
+    """
+    from VfxPipe.nuke.startup.entry_points import ToolSource, find_entry_point_tools
+
+    sources = [
+        ToolSource(name, f"VfxPipe.nuke.tools.{name}", path)
+        for name, path in _find_tool_files(tools_dir, bundle)
+    ]
+    names = {source.name for source in sources}
+
+    for source in find_entry_point_tools(use_cache=use_cache, cached_only=cached_only):
+        if source.name in names:
+            print(f"[VfxPipe] WARNING: Entry point tool '{source.name}' from {source.origin} "
+                  f"conflicts with a built-in tool, ignoring it")
+            continue
+        names.add(source.name)
+        sources.append(source)
+    return sources
+
+
+def _find_tool_files(tools_dir: Path, bundle: Optional[Path] = None) -> List[Tuple[str, Path]]:
+    """
+    List the tool modules and the file used to fingerprint each of them.
+
+    Args:
+        tools_dir: VfxPipe/nuke/tools directory of the source tree
+        bundle: Deployment bundle VfxPipe was imported from, if any
+
+    Returns:
+        Sorted list of (tool name, fingerprint file) tuples. Tools inside a
+        bundle are fingerprinted by the archive itself.
+    """
+    if bundle is not None:
+        import pkgutil
+        import VfxPipe.nuke.tools as tools_package
+        return sorted(
+            (name, bundle)
+            for _, name, is_package in pkgutil.iter_modules(tools_package.__path__)
+            if not is_package
+        )
+
+    if not tools_dir.exists():
+        return []
+
+    return sorted(
+        (f.stem, f) for f in tools_dir.glob("*.py")
+        if f.is_file() and f.stem != "__init__"
+    )
+
+
 def setup_menus():
     """
     Set up VfxPipe menu entries in Nuke.
 
     Creates the main VfxPipe menu and adds entries for registered tools.
+    Tools registered from the manifest get a LazyCommand proxy, so their
+    module is only imported when the menu entry is first clicked.
     """
+    global _vfxpipe_menu
+
     print("[VfxPipe] Setting up menus...")
 
     try:
@@ -148,23 +612,18 @@ def setup_menus():
         vfxpipe_menu = menubar.addMenu("VfxPipe")
 
         # Add menu entries for each registered tool
-        for tool in _registered_tools:
-            tool_info = tool.get('info', {})
+        with _registry_lock:
+            tools = list(_registered_tools)
+            _vfxpipe_menu = vfxpipe_menu
 
-            if not tool_info:
-                continue
+        for tool in tools:
+            _add_menu_entry(vfxpipe_menu, tool)
 
-            menu_name = tool_info.get('menu_name', tool['name'])
-            menu_action = tool_info.get('action')
-
-            if menu_action:
-                vfxpipe_menu.addCommand(menu_name, menu_action)
-                print(f"[VfxPipe] Added menu entry: {menu_name}")
-
-        # Add separator and about entry
-        if _registered_tools:
+        # Add separator, reload and about entries
+        if tools:
             vfxpipe_menu.addSeparator()
 
+        vfxpipe_menu.addCommand("Reload Tools", reload_tools)
         vfxpipe_menu.addCommand("About VfxPipe", show_about)
 
         print("[VfxPipe] Menu setup complete")
@@ -177,6 +636,150 @@ def setup_menus():
         traceback.print_exc()
 
 
+def _add_menu_entry(vfxpipe_menu, tool: Dict[str, Any]):
+    """
+    Add or replace the menu entry of a registered tool.
+
+    New entries are inserted after the previous tool entries, so tools added
+    after the menu was built still appear above the About entry. An existing
+    entry of the same tool is replaced at its current position.
+
+    Args:
+        vfxpipe_menu: The VfxPipe nuke.Menu
+        tool: Registry entry of the tool
+    """
+    tool_info = tool.get('info', {})
+
+    if not tool_info:
+        _remove_menu_entry(vfxpipe_menu, tool['name'])
+        return
+
+    menu_name = tool_info.get('menu_name', tool['name'])
+    menu_action = tool_info.get('action')
+
+    if isinstance(menu_action, str):
+        # Cached "module:function" reference, imported on first click
+        menu_action = LazyCommand(menu_action, label=menu_name)
+
+    if not menu_action:
+        _remove_menu_entry(vfxpipe_menu, tool['name'])
+        return
+
+    names = list(_menu_entries)
+    if tool['name'] in _menu_entries:
+        index = names.index(tool['name'])
+        vfxpipe_menu.removeItem(_menu_entries[tool['name']])
+    else:
+        index = len(names)
+    vfxpipe_menu.addCommand(menu_name, menu_action, index=index)
+    _menu_entries[tool['name']] = menu_name
+    print(f"[VfxPipe] Added menu entry: {menu_name}")
+
+
+def _remove_menu_entry(vfxpipe_menu, tool_name: str):
+    """
+    Remove the menu entry of a tool, if it has one.
+
+    Args:
+        vfxpipe_menu: The VfxPipe nuke.Menu
+        tool_name: Tool module name
+    """
+    menu_name = _menu_entries.pop(tool_name, None)
+    if menu_name is not None:
+        vfxpipe_menu.removeItem(menu_name)
+        print(f"[VfxPipe] Removed menu entry: {menu_name}")
+
+
+def reload_tools() -> Dict[str, List[str]]:
+    """
+    Reload tools whose source changed since they were registered.
+
+    Only changed tool modules, the widgets they import and the loaded tools
+    importing a changed widget are reloaded. New tool files are loaded and
+    tools whose file is gone are unregistered. Only the affected menu
+    entries are rebuilt. Call from the main thread (e.g. the menu command).
+
+    Returns:
+        Dictionary with the 'reloaded', 'added', 'removed', 'widgets' and
+        'failed' module names
+    """
+    summary = {'reloaded': [], 'added': [], 'removed': [], 'widgets': [], 'failed': []}
+
+    if _bundle_archive() is not None:
+        print("[VfxPipe] Tool reloading is not available when running from a bundle")
+        return summary
+
+    import importlib
+    from VfxPipe.nuke.startup import reload as tool_reload
+
+    tools_dir = Path(__file__).parent.parent / "tools"
+    importlib.invalidate_caches()
+    use_manifest = manifest.is_enabled()
+    sources = {source.name: source for source in _find_tools(tools_dir, use_cache=use_manifest)}
+
+    with _registry_lock:
+        registered = {tool['name']: tool for tool in _registered_tools}
+        pending = set(_deferred_tools)
+
+    # Tools still loading in the background are left to the loader
+    sources = {name: source for name, source in sources.items() if name not in pending}
+
+    plan = tool_reload.plan_reload(registered, sources, _started_ns)
+
+    tool_manifest = manifest.ToolManifest.load(tools_dir) if use_manifest else None
+    if tool_manifest:
+        # Unregistered but unchanged (no register(), GUI-only in headless mode)
+        plan.added = {
+            name for name in plan.added
+            if tool_manifest.lookup(name, sources[name].path) is None
+        }
+
+    if plan.is_empty():
+        print("[VfxPipe] No tool changes detected")
+        tool_reload.snapshot_widgets()
+        return summary
+
+    summary['widgets'] = list(plan.widgets)
+    summary['failed'].extend(tool_reload.reload_widgets(plan.widgets))
+
+    for tool_name in plan.tools_to_load:
+        try:
+            result = tool_reload.reload_tool(sources[tool_name])
+        except Exception as e:
+            print(f"[VfxPipe] ERROR reloading tool {tool_name}: {e}")
+            import traceback
+            traceback.print_exc()
+            summary['failed'].append(tool_name)
+            continue
+
+        _apply_load_result(result, sources[tool_name].path, tool_manifest)
+        summary['added' if tool_name in plan.added else 'reloaded'].append(tool_name)
+
+    for tool_name in sorted(plan.removed):
+        with _registry_lock:
+            tool = _find_registered(tool_name)
+            if tool is not None:
+                _registered_tools.remove(tool)
+            menu = _vfxpipe_menu
+        if menu is not None:
+            _remove_menu_entry(menu, tool_name)
+        summary['removed'].append(tool_name)
+        print(f"[VfxPipe] Unregistered removed tool: {tool_name}")
+
+    if tool_manifest:
+        with _registry_lock:
+            tool_manifest.prune(set(sources) | pending)
+            tool_manifest.save()
+
+    tool_reload.snapshot_widgets()
+    print(
+        f"[VfxPipe] Reload complete: {len(summary['reloaded'])} reloaded, "
+        f"{len(summary['added'])} added, {len(summary['removed'])} removed, "
+        f"{len(summary['widgets'])} widget(s), {len(summary['failed'])} failed"
+    )
+    return summary
+
+
 def show_about():
     """Display information about VfxPipe."""
     try:
@@ -196,6 +799,37 @@ Registered Tools: {len(_registered_tools)}
         print(f"[VfxPipe] Error showing about: {e}")
 
 
+def get_batch_entry_points() -> Dict[str, Callable]:
+    """
+    Get the batch-capable entry points of all registered tools.
+
+    Tools declare them with a 'batch' dictionary in their register() metadata,
+    mapping entry point names to callables that need no GUI.
+
+    Returns:
+        Dictionary mapping "tool.entry_point" to a callable (a LazyCommand for
+        tools registered from the manifest)
+    """
+    entry_points = {}
+    for tool in _registered_tools:
+        batch = (tool.get('info') or {}).get('batch') or {}
+        for name, func in batch.items():
+            if isinstance(func, str):
+                func = LazyCommand(func, label=f"{tool['name']}.{name}")
+            entry_points[f"{tool['name']}.{name}"] = func
+    return entry_points
+
+
+def is_headless_session() -> bool:
+    """
+    Check if VfxPipe was initialized in headless mode.
+
+    Returns:
+        True if initialize() ran in headless mode
+    """
+    return _headless
+
+
 def get_registered_tools() -> List[Dict[str, Any]]:
     """
     Get list of registered tools.
@@ -203,7 +837,19 @@ def get_registered_tools() -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries containing tool information
     """
-    return _registered_tools.copy()
+    with _registry_lock:
+        return _registered_tools.copy()
+
+
+def get_deferred_tools() -> List[str]:
+    """
+    Get the tools whose loading exceeded the startup timeout and is still pending.
+
+    Returns:
+        List of tool names
+    """
+    with _registry_lock:
+        return sorted(_deferred_tools)
 
 
 def is_initialized() -> bool:
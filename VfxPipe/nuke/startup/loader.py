@@ -0,0 +1,182 @@
+"""
+VfxPipe Parallel Tool Loader
+
+Imports tool modules and calls their register() function in a bounded pool
+of background threads. Module loading from network storage is mostly I/O, so
+several tools load at the same time instead of one after another.
+
+Each tool gets a time budget that starts when its import begins. A tool that
+does not finish in time is reported as deferred to the caller, which can
+register it whenever the import eventually completes. Loader threads are
+daemon threads, so a tool hung on an unresponsive share never blocks Nuke
+from exiting.
+
+Environment variables:
+    VFXPIPE_TOOL_LOAD_WORKERS: Maximum concurrent tool imports (default: 4)
+    VFXPIPE_TOOL_LOAD_TIMEOUT: Seconds each tool may take before it is
+                               deferred (default: 10, 0 = no limit)
+"""
+
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Any, Dict, Optional
+
+from VfxPipe.nuke.startup import profiler
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 10.0
+
+
+class ToolLoadResult:
+    """
+    Outcome of importing a tool module and calling its register().
+
+    Attributes:
+        name: Tool module name
+        module_name: Full dotted module name
+        module: Imported module
+        has_register: Whether the module defines register()
+        info: Metadata returned by register()
+        elapsed: Seconds spent importing and registering
+    """
+
+    def __init__(self, name: str, module_name: str, module, has_register: bool,
+                 info: Optional[Dict[str, Any]], elapsed: float):
+        self.name = name
+        self.module_name = module_name
+        self.module = module
+        self.has_register = has_register
+        self.info = info
+        self.elapsed = elapsed
+
+
+def load_tool(tool_name: str, module_name: str, register_name: str = "register") -> ToolLoadResult:
+    """
+    Import a tool module and call its register() function.
+
+    Args:
+        tool_name: Tool module name
+        module_name: Full dotted module name
+        register_name: Name of the registration function (entry points may
+                       name another one)
+
+    Returns:
+        ToolLoadResult
+
+    Raises:
+        Exception: Whatever the tool raised while importing or registering
+    """
+    start_time = time.perf_counter()
+    with profiler.get_profiler().tool_import(tool_name):
+        module = importlib.import_module(module_name)
+        register = getattr(module, register_name, None)
+        has_register = register is not None
+        info = register() if has_register else None
+    return ToolLoadResult(
+        tool_name, module_name, module, has_register, info,
+        time.perf_counter() - start_time
+    )
+
+
+def _env_number(name: str, default: float, cast=float):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+class ParallelToolLoader:
+    """
+    Loads tools in a bounded set of daemon threads with a per-tool timeout.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        self.max_workers = max(1, int(max_workers))
+        self.timeout = timeout if timeout and timeout > 0 else None
+        self._slots = threading.Semaphore(self.max_workers)
+        self._started = {}
+        self._released = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "ParallelToolLoader":
+        """
+        Create a loader configured from VFXPIPE_TOOL_LOAD_WORKERS/TIMEOUT.
+
+        Returns:
+            ParallelToolLoader instance
+        """
+        return cls(
+            max_workers=_env_number("VFXPIPE_TOOL_LOAD_WORKERS", DEFAULT_WORKERS, int),
+            timeout=_env_number("VFXPIPE_TOOL_LOAD_TIMEOUT", DEFAULT_TIMEOUT),
+        )
+
+    def submit(self, tool_name: str, module_name: str, register_name: str = "register") -> Future:
+        """
+        Start loading a tool in the background.
+
+        Args:
+            tool_name: Tool module name
+            module_name: Full dotted module name
+            register_name: Name of the registration function
+
+        Returns:
+            Future resolving to a ToolLoadResult
+        """
+        future = Future()
+
+        def worker():
+            self._slots.acquire()
+            try:
+                if not future.set_running_or_notify_cancel():
+                    return
+                with self._lock:
+                    self._started[future] = time.monotonic()
+                try:
+                    future.set_result(load_tool(tool_name, module_name, register_name))
+                except BaseException as e:
+                    future.set_exception(e)
+            finally:
+                self._release_slot(future)
+
+        thread = threading.Thread(target=worker, name=f"VfxPipe-load-{tool_name}")
+        thread.daemon = True
+        thread.start()
+        return future
+
+    def wait(self, future: Future, poll_interval: float = 0.05) -> bool:
+        """
+        Wait for a tool to finish loading within its time budget.
+
+        The budget starts when the tool's import begins, so tools queued
+        behind busy workers are not penalized for the wait.
+
+        Args:
+            future: Future returned by submit()
+            poll_interval: Seconds between budget checks
+
+        Returns:
+            bool: True if the tool finished, False if it exceeded its timeout
+        """
+        while not future.done():
+            if self.timeout is not None:
+                with self._lock:
+                    started = self._started.get(future)
+                if started is not None and time.monotonic() - started >= self.timeout:
+                    # A hung tool must not hold a slot needed by the next ones
+                    self._release_slot(future)
+                    return False
+            wait([future], timeout=poll_interval)
+        return True
+
+    def _release_slot(self, future: Future):
+        """Release the worker slot of a tool, at most once."""
+        with self._lock:
+            if future in self._released:
+                return
+            self._released.add(future)
+        self._slots.release()
@@ -0,0 +1,270 @@
+"""
+VfxPipe Tool Manifest
+
+Persisted cache of each tool's register() metadata, keyed on the tool file's
+mtime, size and content hash. On a warm start discover_and_register_tools()
+reads this single file and registers menus without importing any tool; only
+tools whose files changed are imported again to refresh their entry.
+
+Callables in the metadata (e.g. 'action') are stored as "module:function"
+references and resolved when they are first needed.
+
+Environment variables:
+    VFXPIPE_TOOL_CACHE: Set to 0 to disable the manifest (always import tools)
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from VfxPipe import __version__
+from VfxPipe.utils.cache import cache_key, get_cache_dir, read_json, write_json_atomic
+
+
+MANIFEST_FORMAT = 1
+
+# register() keys whose values are callables stored as "module:function"
+CALLABLE_KEYS = ('action',)
+
+# register() keys whose values map names to callables (e.g. batch entry points)
+CALLABLE_MAP_KEYS = ('batch',)
+
+
+def is_enabled() -> bool:
+    """
+    Check if the tool manifest cache is enabled.
+
+    Returns:
+        True unless VFXPIPE_TOOL_CACHE is set to 0/false/off
+    """
+    value = os.environ.get("VFXPIPE_TOOL_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+def callable_to_ref(func: Callable) -> Optional[str]:
+    """
+    Convert a module-level function into a "module:function" reference.
+
+    Args:
+        func: Callable to convert
+
+    Returns:
+        str or None: Reference string, or None if the callable cannot be
+        resolved again by name (lambdas, closures, bound methods, ...)
+    """
+    module = getattr(func, '__module__', None)
+    qualname = getattr(func, '__qualname__', None)
+    if not module or not qualname or '<' in qualname or '.' in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def file_fingerprint(path: Path, with_hash: bool = True) -> Dict[str, Any]:
+    """
+    Compute the fingerprint used to detect tool changes.
+
+    Args:
+        path: Tool source file
+        with_hash: Whether to include the content hash (requires reading the file)
+
+    Returns:
+        Dictionary with 'mtime', 'size' and optionally 'sha1'
+    """
+    stat = path.stat()
+    fingerprint = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+    if with_hash:
+        fingerprint['sha1'] = hashlib.sha1(path.read_bytes()).hexdigest()
+    return fingerprint
+
+
+class ToolManifest:
+    """
+    Tool metadata cache for a single tools directory.
+
+    One manifest file exists per tools directory, Python version and VfxPipe
+    version, so different installs and interpreters never share entries.
+    """
+
+    def __init__(self, tools_dir: Path, path: Optional[Path] = None):
+        self.tools_dir = Path(tools_dir)
+        self.path = path or self.default_path(self.tools_dir)
+        self.tools = {}
+        self.dirty = False
+
+    @staticmethod
+    def default_path(tools_dir: Path) -> Path:
+        """
+        Get the manifest file location for a tools directory.
+
+        Args:
+            tools_dir: Directory containing the tool modules
+
+        Returns:
+            Path to the manifest file
+        """
+        key = cache_key(
+            Path(tools_dir).resolve(),
+            f"{sys.version_info[0]}.{sys.version_info[1]}",
+            __version__,
+        )
+        return get_cache_dir() / f"nuke_tools-{key}.json"
+
+    @classmethod
+    def load(cls, tools_dir: Path) -> "ToolManifest":
+        """
+        Load the manifest for a tools directory.
+
+        A missing, corrupt or outdated manifest results in an empty one.
+
+        Args:
+            tools_dir: Directory containing the tool modules
+
+        Returns:
+            ToolManifest instance
+        """
+        manifest = cls(tools_dir)
+        data = read_json(manifest.path, default={})
+        if isinstance(data, dict) and data.get('format') == MANIFEST_FORMAT:
+            tools = data.get('tools')
+            if isinstance(tools, dict):
+                manifest.tools = tools
+        return manifest
+
+    def lookup(self, tool_name: str, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached entry for a tool if its file is unchanged.
+
+        The cheap mtime/size check is tried first; the content hash is only
+        computed when those differ (e.g. after a checkout touched the file).
+
+        Args:
+            tool_name: Tool module name
+            path: Tool source file, or None if unknown
+
+        Returns:
+            Cached entry dictionary, or None if the tool must be imported
+        """
+        entry = self.tools.get(tool_name)
+        if path is None or not entry or not entry.get('cacheable', False):
+            return None
+
+        cached = entry.get('fingerprint', {})
+        try:
+            current = file_fingerprint(path, with_hash=False)
+            if current['mtime'] == cached.get('mtime') and current['size'] == cached.get('size'):
+                return entry
+
+            current = file_fingerprint(path)
+        except OSError:
+            return None
+
+        if current['sha1'] != cached.get('sha1'):
+            return None
+
+        # Content unchanged, only the stat data moved on
+        entry['fingerprint'] = current
+        self.dirty = True
+        return entry
+
+    def update(self, tool_name: str, module_name: str, path: Path,
+               has_register: bool, info: Optional[Dict[str, Any]] = None):
+        """
+        Store the register() result of a freshly imported tool.
+
+        Args:
+            tool_name: Tool module name
+            module_name: Full dotted module name
+            path: Tool source file, or None if unknown (never cached)
+            has_register: Whether the module defines register()
+            info: Metadata returned by register()
+        """
+        cached_info, cacheable = self._serialize_info(info) if has_register else (None, True)
+
+        try:
+            if path is None:
+                raise OSError(f"No source file for tool {tool_name}")
+            fingerprint = file_fingerprint(path)
+        except OSError:
+            fingerprint = {}
+            cacheable = False
+
+        self.tools[tool_name] = {
+            'module': module_name,
+            'fingerprint': fingerprint,
+            'has_register': has_register,
+            'info': cached_info,
+            'cacheable': cacheable,
+        }
+        self.dirty = True
+
+    def prune(self, tool_names):
+        """
+        Drop entries for tools that no longer exist.
+
+        Args:
+            tool_names: Names of the tools currently present
+        """
+        for name in set(self.tools) - set(tool_names):
+            del self.tools[name]
+            self.dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the manifest to disk if it changed.
+
+        Returns:
+            bool: True if the manifest is up to date on disk
+        """
+        if not self.dirty:
+            return True
+
+        data = {
+            'format': MANIFEST_FORMAT,
+            'vfxpipe_version': __version__,
+            'python': f"{sys.version_info[0]}.{sys.version_info[1]}",
+            'tools_dir': str(self.tools_dir),
+            'tools': self.tools,
+        }
+        if write_json_atomic(self.path, data):
+            self.dirty = False
+            return True
+        return False
+
+    @staticmethod
+    def _serialize_info(info):
+        """
+        Convert register() metadata into a JSON-safe dictionary.
+
+        Returns:
+            Tuple of (serialized info, cacheable flag)
+        """
+        if info is None:
+            return None, True
+        if not isinstance(info, dict):
+            return None, False
+
+        serialized = {}
+        for key, value in info.items():
+            if key in CALLABLE_KEYS and callable(value):
+                ref = callable_to_ref(value)
+                if ref is None:
+                    return None, False
+                serialized[key] = ref
+            elif key in CALLABLE_MAP_KEYS and isinstance(value, dict):
+                refs = {}
+                for name, func in value.items():
+                    ref = func if isinstance(func, str) else callable_to_ref(func)
+                    if ref is None:
+                        return None, False
+                    refs[name] = ref
+                serialized[key] = refs
+            else:
+                try:
+                    json.dumps(value)
+                except (TypeError, ValueError):
+                    return None, False
+                serialized[key] = value
+        return serialized, True
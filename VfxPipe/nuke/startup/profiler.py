@@ -0,0 +1,394 @@
+"""
+VfxPipe Startup Profiler
+
+Opt-in profiler for the Nuke startup sequence. When enabled it records wall
+and CPU time for every initialize() phase and every tool import, plus the
+nested import tree (self and cumulative time per module) of everything that
+is imported while startup runs, through import statements as well as
+importlib.import_module().
+
+CPU times of phases, tools and modules are the CPU time of the thread that
+ran them, so tools loaded in parallel do not count each other's work; only
+the total is process CPU.
+
+The report is written as JSON next to Nuke's temporary files and a top-N
+summary is printed to the console.
+
+Environment variables:
+    VFXPIPE_PROFILE_STARTUP: Set to 1 to enable the profiler
+    VFXPIPE_PROFILE_DIR: Directory for the JSON report
+                         (default: NUKE_TEMP_DIR, then the system temp dir)
+    VFXPIPE_PROFILE_TOP: Number of entries in the printed summary (default: 10)
+"""
+
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def is_enabled() -> bool:
+    """
+    Check if startup profiling was requested.
+
+    Returns:
+        True if VFXPIPE_PROFILE_STARTUP is set to a truthy value
+    """
+    value = os.environ.get("VFXPIPE_PROFILE_STARTUP", "").strip().lower()
+    return value in ("1", "true", "on", "yes")
+
+
+def get_report_dir() -> Path:
+    """
+    Get the directory where profile reports are written.
+
+    Returns:
+        Path to the report directory
+    """
+    for var in ("VFXPIPE_PROFILE_DIR", "NUKE_TEMP_DIR"):
+        value = os.environ.get(var)
+        if value:
+            return Path(value).expanduser()
+
+    import tempfile
+    return Path(tempfile.gettempdir())
+
+
+class _Timer:
+    """
+    Wall and CPU time measurement for a single block.
+
+    CPU time is measured with cpu_clock: the calling thread's CPU time by
+    default, time.process_time for the whole process.
+    """
+
+    __slots__ = ('cpu_clock', 'wall_start', 'cpu_start', 'wall', 'cpu')
+
+    def __init__(self, cpu_clock=time.thread_time):
+        self.cpu_clock = cpu_clock
+        self.wall_start = time.perf_counter()
+        self.cpu_start = cpu_clock()
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def stop(self):
+        self.wall = time.perf_counter() - self.wall_start
+        self.cpu = self.cpu_clock() - self.cpu_start
+
+
+class _ImportNode:
+    """One module in the recorded import tree."""
+
+    __slots__ = ('name', 'children', 'cumulative', 'cpu', 'error')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.children = []
+        self.cumulative = 0.0
+        self.cpu = 0.0
+        self.error = None
+
+    @property
+    def self_time(self) -> float:
+        return max(0.0, self.cumulative - sum(c.cumulative for c in self.children))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'module': self.name,
+            'cumulative': round(self.cumulative, 6),
+            'self': round(self.self_time, 6),
+            'cpu': round(self.cpu, 6),
+            'children': [c.to_dict() for c in self.children],
+        }
+        if self.error:
+            data['error'] = self.error
+        return data
+
+    def walk(self):
+        for child in self.children:
+            yield child
+            yield from child.walk()
+
+
+class StartupProfiler:
+    """
+    Records phase timings, tool import timings and the module import tree.
+
+    A disabled profiler keeps the same interface but does no work, so the
+    startup code can use it unconditionally.
+    """
+
+    def __init__(self, enabled: bool = True, top_n: int = 10):
+        self.enabled = enabled
+        self.top_n = top_n
+        self.phases = []
+        self.tool_imports = []
+        self.report_path = None
+        self._roots = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._original_import = None
+        self._original_import_module = None
+        self._total = None
+
+    @classmethod
+    def from_environment(cls) -> "StartupProfiler":
+        """
+        Create a profiler configured from the VFXPIPE_PROFILE_* variables.
+
+        Returns:
+            StartupProfiler instance (disabled unless requested)
+        """
+        try:
+            top_n = int(os.environ.get("VFXPIPE_PROFILE_TOP", "10"))
+        except ValueError:
+            top_n = 10
+        return cls(enabled=is_enabled(), top_n=top_n)
+
+    def start(self):
+        """Start the total timer and install the import hooks."""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._total = _Timer(time.process_time)
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+        builtins.__import__ = self._profiled_import
+        # Tools are loaded with importlib.import_module(), which bypasses __import__
+        importlib.import_module = self._profiled_import_module
+
+    def stop(self):
+        """Stop the total timer and remove the import hooks."""
+        if self._original_import is None:
+            return
+        if builtins.__import__ == self._profiled_import:
+            builtins.__import__ = self._original_import
+        if importlib.import_module == self._profiled_import_module:
+            importlib.import_module = self._original_import_module
+        self._original_import = None
+        self._original_import_module = None
+        self._total.stop()
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a startup phase.
+
+        Args:
+            name: Phase name (e.g. "discover_and_register_tools")
+        """
+        if not self.enabled:
+            yield
+            return
+        timer = _Timer()
+        try:
+            yield
+        finally:
+            timer.stop()
+            with self._lock:
+                self.phases.append({'name': name, 'wall': timer.wall, 'cpu': timer.cpu})
+
+    @contextmanager
+    def tool_import(self, tool_name: str):
+        """
+        Time the import and registration of a single tool.
+
+        Args:
+            tool_name: Tool module name
+        """
+        if not self.enabled:
+            yield
+            return
+        timer = _Timer()
+        try:
+            yield
+        finally:
+            timer.stop()
+            with self._lock:
+                self.tool_imports.append({'name': tool_name, 'wall': timer.wall, 'cpu': timer.cpu})
+
+    def _profiled_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement that records first-time imports."""
+        original = self._original_import or builtins.__import__
+        fullname = self._resolve_name(name, globals, level)
+        return self._record(fullname, original, name, globals, locals, fromlist, level)
+
+    def _profiled_import_module(self, name, package=None):
+        """importlib.import_module replacement that records first-time imports."""
+        original = self._original_import_module or importlib.import_module
+        try:
+            fullname = importlib.util.resolve_name(name, package)
+        except (ImportError, ValueError):
+            fullname = None
+        return self._record(fullname, original, name, package)
+
+    def _record(self, fullname, import_func, *args):
+        """Run an import, adding it to the import tree if it is a first-time import."""
+        if not fullname or fullname in sys.modules:
+            return import_func(*args)
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        node = _ImportNode(fullname)
+        if stack:
+            stack[-1].children.append(node)
+        else:
+            with self._lock:
+                self._roots.append(node)
+
+        stack.append(node)
+        timer = _Timer()
+        try:
+            return import_func(*args)
+        except Exception as e:
+            node.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            timer.stop()
+            node.cumulative = timer.wall
+            node.cpu = timer.cpu
+            stack.pop()
+
+    @staticmethod
+    def _resolve_name(name, globals, level):
+        """Resolve a possibly relative import into an absolute module name."""
+        if not level:
+            return name
+        package = (globals or {}).get('__package__') or ''
+        bits = package.rsplit('.', level - 1)
+        if len(bits) < level:
+            return None
+        base = bits[0]
+        return f"{base}.{name}" if name else base
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the profile report.
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        modules = []
+        for root in self._roots:
+            modules.append(root)
+            modules.extend(root.walk())
+
+        return {
+            'pid': os.getpid(),
+            'python': sys.version.split()[0],
+            'executable': sys.executable,
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'total': {
+                'wall': self._total.wall if self._total else 0.0,
+                'process_cpu': self._total.cpu if self._total else 0.0,
+            },
+            'phases': self.phases,
+            'tool_imports': self.tool_imports,
+            'import_count': len(modules),
+            'import_tree': [root.to_dict() for root in self._roots],
+            'top_imports_by_self': [
+                {'module': m.name, 'self': round(m.self_time, 6), 'cumulative': round(m.cumulative, 6)}
+                for m in sorted(modules, key=lambda m: m.self_time, reverse=True)[:self.top_n]
+            ],
+        }
+
+    def write_report(self, directory: Optional[Path] = None) -> Optional[Path]:
+        """
+        Write the report as JSON.
+
+        Args:
+            directory: Target directory (default: get_report_dir())
+
+        Returns:
+            Path to the written file, or None on failure
+        """
+        import json
+
+        directory = Path(directory) if directory else get_report_dir()
+        filename = f"vfxpipe_startup_profile_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.json"
+        path = directory / filename
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, indent=2)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[VfxPipe] WARNING: Could not write startup profile: {e}")
+            return None
+        self.report_path = path
+        return path
+
+    def summary_lines(self) -> List[str]:
+        """
+        Format the top-N summary printed at the end of startup.
+
+        Returns:
+            List of summary lines
+        """
+        report = self.report()
+        lines = [
+            f"[VfxPipe] Startup profile: {report['total']['wall'] * 1000:.1f} ms wall, "
+            f"{report['total']['process_cpu'] * 1000:.1f} ms process CPU, "
+            f"{report['import_count']} module(s) imported"
+        ]
+
+        for phase in report['phases']:
+            lines.append(
+                f"[VfxPipe]   phase {phase['name']:<32} {phase['wall'] * 1000:9.1f} ms wall "
+                f"{phase['cpu'] * 1000:9.1f} ms CPU"
+            )
+
+        tools = sorted(report['tool_imports'], key=lambda t: t['wall'], reverse=True)
+        for tool in tools[:self.top_n]:
+            lines.append(
+                f"[VfxPipe]   tool  {tool['name']:<32} {tool['wall'] * 1000:9.1f} ms wall "
+                f"{tool['cpu'] * 1000:9.1f} ms CPU"
+            )
+
+        for module in report['top_imports_by_self']:
+            lines.append(
+                f"[VfxPipe]   import {module['module']:<31} {module['self'] * 1000:9.1f} ms self "
+                f"{module['cumulative'] * 1000:9.1f} ms cumulative"
+            )
+        return lines
+
+    def finish(self):
+        """Stop profiling, write the JSON report and print the summary."""
+        if not self.enabled:
+            return
+        self.stop()
+        for line in self.summary_lines():
+            print(line)
+        path = self.write_report()
+        if path:
+            print(f"[VfxPipe] Startup profile written to {path}")
+
+
+# Profiler of the startup currently in progress
+_active = StartupProfiler(enabled=False)
+
+
+def get_profiler() -> StartupProfiler:
+    """
+    Get the profiler for the startup currently in progress.
+
+    Returns:
+        The active StartupProfiler (a disabled one outside of startup)
+    """
+    return _active
+
+
+def set_profiler(profiler: StartupProfiler):
+    """
+    Make a profiler the active one.
+
+    Args:
+        profiler: StartupProfiler to activate
+    """
+    global _active
+    _active = profiler
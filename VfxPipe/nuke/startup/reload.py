@@ -0,0 +1,264 @@
+"""
+VfxPipe Tool Hot-Reload
+
+Change detection and module reloading behind init.reload_tools(). Tool files
+are compared against the fingerprint recorded when they were registered
+(mtime/size first, content hash when those differ), so only tools that really
+changed are reloaded.
+
+Widget modules are not registered, so they are tracked separately: a loaded
+widget counts as changed when its file was modified after startup (or after
+the previous reload). Tools importing a changed widget are reloaded as well,
+since they may hold on to instances of the old widget class.
+"""
+
+import ast
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from VfxPipe.nuke.startup.manifest import file_fingerprint
+
+
+TOOLS_PACKAGE = "VfxPipe.nuke.tools"
+WIDGETS_PACKAGE = "VfxPipe.nuke.widgets"
+
+# Fingerprints of loaded widget modules as of the last reload
+_widget_fingerprints = {}
+
+
+class ReloadPlan:
+    """
+    Tools and widgets affected by a reload.
+
+    Attributes:
+        changed: Registered tools whose file changed
+        added: Tool files that are not registered yet
+        removed: Registered tools whose file is gone
+        dependents: Unchanged loaded tools importing a changed widget
+        widgets: Widget modules to reload, in reload order
+    """
+
+    def __init__(self):
+        self.changed = set()
+        self.added = set()
+        self.removed = set()
+        self.dependents = set()
+        self.widgets = []
+
+    @property
+    def tools_to_load(self) -> List[str]:
+        """Sorted names of the tools that must be (re)imported."""
+        return sorted(self.changed | self.added | self.dependents)
+
+    def is_empty(self) -> bool:
+        return not (self.changed or self.added or self.removed or self.dependents or self.widgets)
+
+
+def file_changed(path: Path, fingerprint: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check if a file differs from a recorded fingerprint.
+
+    Args:
+        path: Source file
+        fingerprint: Fingerprint from manifest.file_fingerprint(), or None
+
+    Returns:
+        bool: True if the file changed or cannot be compared
+    """
+    if not fingerprint:
+        return True
+    try:
+        current = file_fingerprint(path, with_hash=False)
+        if current['mtime'] == fingerprint.get('mtime') and current['size'] == fingerprint.get('size'):
+            return False
+        if not fingerprint.get('sha1'):
+            return True
+        return file_fingerprint(path)['sha1'] != fingerprint['sha1']
+    except OSError:
+        return True
+
+
+def widget_imports(path: Path, package: str = TOOLS_PACKAGE) -> Set[str]:
+    """
+    Find the widget modules a source file imports, anywhere in the file.
+
+    Args:
+        path: Python source file
+        package: Package the file belongs to, used for relative imports
+
+    Returns:
+        Set of full widget module names
+    """
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    found = set()
+    prefix = WIDGETS_PACKAGE + "."
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level:
+                base = package.rsplit(".", node.level - 1)[0]
+                module = f"{base}.{module}" if module else base
+            if module == WIDGETS_PACKAGE:
+                names = [f"{module}.{alias.name}" for alias in node.names]
+            else:
+                names = [module]
+        else:
+            continue
+        found.update(name for name in names if name.startswith(prefix))
+    return found
+
+
+def _module_file(module) -> Optional[Path]:
+    filename = getattr(module, '__file__', None)
+    return Path(filename) if filename and filename.endswith(".py") else None
+
+
+def _loaded_widgets() -> Dict[str, Path]:
+    """Map every loaded widget module to its source file."""
+    prefix = WIDGETS_PACKAGE + "."
+    widgets = {}
+    for name, module in list(sys.modules.items()):
+        if name.startswith(prefix) and module is not None:
+            path = _module_file(module)
+            if path is not None:
+                widgets[name] = path
+    return widgets
+
+
+def _widget_changed(name: str, path: Path, since_ns: int) -> bool:
+    fingerprint = _widget_fingerprints.get(name)
+    if fingerprint is not None:
+        return file_changed(path, fingerprint)
+    try:
+        return path.stat().st_mtime_ns > since_ns
+    except OSError:
+        return False
+
+
+def plan_reload(registered: Dict[str, Dict[str, Any]], sources: Dict[str, Any],
+                since_ns: int) -> ReloadPlan:
+    """
+    Work out which tools and widgets need reloading.
+
+    Tools without a known source file (some entry point tools) are only
+    reloaded when they depend on a changed widget.
+
+    Args:
+        registered: Registry entries keyed by tool name
+        sources: Current entry_points.ToolSource of each tool, keyed by name
+        since_ns: time.time_ns() of startup, used for widgets that were
+                  never reloaded before
+
+    Returns:
+        ReloadPlan
+    """
+    plan = ReloadPlan()
+
+    for name, source in sources.items():
+        tool = registered.get(name)
+        if tool is None:
+            plan.added.add(name)
+        elif source.path is not None and file_changed(source.path, tool.get('fingerprint')):
+            plan.changed.add(name)
+    plan.removed = set(registered) - set(sources)
+
+    loaded_widgets = _loaded_widgets()
+    changed_widgets = {
+        name for name, path in loaded_widgets.items()
+        if _widget_changed(name, path, since_ns)
+    }
+
+    # Only imported tools can hold widget references; the rest import fresh
+    dependencies = {
+        name: widget_imports(source.path, source.module_name.rpartition(".")[0])
+        for name, source in sources.items()
+        if source.path is not None and (source.module_name in sys.modules or name in plan.changed)
+    }
+    for name, widgets in dependencies.items():
+        if widgets & changed_widgets and name not in plan.changed and name not in plan.added:
+            plan.dependents.add(name)
+
+    # A changed tool gets fresh copies of the widgets it uses
+    widgets = set(changed_widgets)
+    for name in plan.changed:
+        widgets.update(w for w in dependencies.get(name, ()) if w in loaded_widgets)
+    plan.widgets = sorted(widgets)
+    return plan
+
+
+def reload_module(module_name: str):
+    """
+    Reload a module if it is imported, import it otherwise.
+
+    Args:
+        module_name: Full dotted module name
+
+    Returns:
+        The fresh module
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return importlib.import_module(module_name)
+    return importlib.reload(module)
+
+
+def reload_widgets(module_names: Iterable[str]) -> Dict[str, Exception]:
+    """
+    Reload widget modules and record their new fingerprints.
+
+    Args:
+        module_names: Widget modules to reload
+
+    Returns:
+        Dictionary of module names that failed to reload and their errors
+    """
+    errors = {}
+    for name in module_names:
+        try:
+            reload_module(name)
+            print(f"[VfxPipe] Reloaded widget: {name}")
+        except Exception as e:
+            errors[name] = e
+            print(f"[VfxPipe] ERROR reloading widget {name}: {e}")
+    return errors
+
+
+def snapshot_widgets():
+    """Record the fingerprints of every loaded widget module."""
+    for name, path in _loaded_widgets().items():
+        try:
+            _widget_fingerprints[name] = file_fingerprint(path)
+        except OSError:
+            _widget_fingerprints.pop(name, None)
+
+
+def reload_tool(source):
+    """
+    Reload (or first import) a tool module and call its register() function.
+
+    Args:
+        source: entry_points.ToolSource of the tool
+
+    Returns:
+        loader.ToolLoadResult for the fresh module
+    """
+    from VfxPipe.nuke.startup.loader import ToolLoadResult
+
+    start_time = time.perf_counter()
+    module = reload_module(source.module_name)
+    register = getattr(module, source.register_name, None)
+    has_register = register is not None
+    info = register() if has_register else None
+    return ToolLoadResult(
+        source.name, source.module_name, module, has_register, info,
+        time.perf_counter() - start_time
+    )
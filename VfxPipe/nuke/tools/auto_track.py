@@ -3,52 +3,137 @@ Auto Track Tool - Automated Camera Tracking for Nuke
 
 Provides automated camera tracking functionality with recursive solve refinement.
 Integrates with the Auto Track Widget for user configuration.
+
+The same pipeline runs without a GUI (nuke -t, farm jobs) through the
+command line entry point, which saves the script and writes a JSON summary:
+
+    python -m VfxPipe.nuke.tools.auto_track --script shot.nk \
+        --nodes CameraTracker1,CameraTracker2 --params params.json --summary result.json
+
+Run with --help for all options.
 """
 
+import logging
 import nuke
 import nukescripts
+import sys
 import time
-from VfxPipe.utils.host import getPySideVersion
-from VfxPipe.utils.logger import getLogger
+from VfxPipe import qt
+from VfxPipe.utils.logger import LogThrottle, getLogger, log_context, snapshot
 from ticketSubmitter import submit_ticket
 
 # Initialize logger
 logger = getLogger("AutoTrack")
 
-# Dynamically import correct PySide version based on DCC
-_pyside_version = getPySideVersion()
+# Recent log records attached to error tickets
+TICKET_LOG_RECORDS = 50
+
+# Per-iteration debug lines are sampled 1 in LOG_SAMPLE_EVERY, plus the
+# first and last iteration
+LOG_SAMPLE_EVERY = 10
+throttled = LogThrottle(logger)
+
+# Seconds between cancellation checks while waiting for the main thread
+MAIN_THREAD_POLL_INTERVAL = 0.25
+
+# Defaults of the Auto Track widget, used for parameters a batch run omits
+DEFAULT_PARAMS = {
+    'minLen': 3,
+    'maxTrackError': 4.0,
+    'maxError': 4.0,
+    'controlError': 1.0,
+    'max_iter': 5,
+    'camera_prefix': 'cam_',
+    'link_output': False,
+    'workers': 0,
+    'refine_strategy': 'fixed',
+}
+
+# Format version of the batch result summary
+SUMMARY_FORMAT = 1
+
+# Script run by the delete*Tracks buttons to skip their confirmation dialog
+PROCEED_WITH_UPDATE_SCRIPT = (
+    "cameraTracker = nuke.thisNode()\n"
+    "cameraTracker['proceedWithUpdate'].setValue(True)"
+)
+
+
+def _set_reference_frames(cameraTracker):
+    """
+    Key the track range on the selectedFrames knob. Main thread only.
 
-try:
-    if _pyside_version == 2:
-        from PySide2 import QtCore
-    else:
-        from PySide6 import QtCore
-except ImportError as e:
-    raise ImportError(
-        f"PySide{_pyside_version} is required for this DCC but not available. "
-        f"Please install PySide{_pyside_version}. Error: {e}"
-    )
+    Args:
+        cameraTracker: CameraTracker node
+
+    Returns:
+        List of reference frames
+    """
+    refFrames = [cameraTracker['trackStart'].value(), cameraTracker['trackStop'].value()]
+    selFrameKnob = cameraTracker.knob('selectedFrames')
+    selFrameKnob.clearAnimated()
+    selFrameKnob.setAnimated()
+    for frame in refFrames:
+        selFrameKnob.setValueAt(frame, frame)
+    return refFrames
 
 
-class TrackingWorker(QtCore.QThread):
+class TrackingWorkerBase(object):
     """
-    Worker thread for camera tracking operations.
+    Camera tracking logic shared by the Qt worker thread and batch runs.
 
-    Runs tracking operations in a separate thread to keep UI responsive.
+    Kept free of Qt so the module can be imported without loading PySide;
+    the QThread subclass adding the signals is built on first use by
+    get_tracking_worker_class(), and HeadlessTrackingRunner replaces the
+    signals with plain callbacks.
+
+    Per-node outcomes are collected in self.results, keyed by node name.
     """
 
-    # Signals for progress updates
-    progress_update = QtCore.Signal(str, float, str)  # message, percentage, detail
-    tracking_complete = QtCore.Signal(bool, str)  # success, message
-    error_occurred = QtCore.Signal(str, str)  # title, message
+    # Whether error tickets may show their dialog
+    show_ticket_ui = True
+
+    def _init_job(self, params):
+        # Tracking-only modules are imported when a job starts, not when the
+        # tool is registered at startup
+        from VfxPipe.nuke.main_thread import MainThreadDispatcher
 
-    def __init__(self, params):
-        super(TrackingWorker, self).__init__()
         self.params = params
         self.cancelled = False
+        self.dispatcher = MainThreadDispatcher()
+        self.results = {}
+
+    def _wait(self, future):
+        """
+        Wait for a main-thread call, cancelling it if the job is cancelled.
+
+        A call that already started (a running trackFeatures, say) cannot be
+        interrupted and is waited for.
+
+        Args:
+            future: MainThreadFuture from self.dispatcher
+
+        Returns:
+            Result of the call
+
+        Raises:
+            CancelledError: If the job was cancelled before the call started
+        """
+        from concurrent.futures import TimeoutError
+
+        while True:
+            try:
+                return future.result(MAIN_THREAD_POLL_INTERVAL)
+            except TimeoutError:
+                if self.cancelled:
+                    future.cancel()
 
     def run(self):
         """Execute the tracking process."""
+        from concurrent.futures import CancelledError
+        from VfxPipe.nuke import main_thread
+        from VfxPipe.utils import runlog
+
         logger.info("=" * 60)
         logger.info("AUTO TRACK PROCESS STARTED")
         logger.info("=" * 60)
@@ -56,8 +141,16 @@ class TrackingWorker(QtCore.QThread):
         try:
             nodes = self.params['nodes']
             total_nodes = len(nodes)
-            logger.info(f"Processing {total_nodes} CameraTracker node(s): {nodes}")
-            logger.info(f"Parameters: {self.params}")
+            logger.info("Processing %d CameraTracker node(s): %s", total_nodes, nodes)
+            logger.debug("Parameters: %s", self.params)
+
+            if self.params.get('workers', 0) > 0:
+                try:
+                    self._run_parallel(nodes)
+                except CancelledError:
+                    logger.warning("Tracking cancelled by user")
+                    self.tracking_complete.emit(False, "Tracking cancelled by user")
+                return
 
             for idx, node_name in enumerate(nodes):
                 if self.cancelled:
@@ -65,67 +158,78 @@ class TrackingWorker(QtCore.QThread):
                     self.tracking_complete.emit(False, "Tracking cancelled by user")
                     return
 
-                # Calculate progress
-                base_progress = (idx / total_nodes) * 100
-                logger.info(f"\n{'=' * 60}")
-                logger.info(f"Processing node {idx + 1}/{total_nodes}: {node_name}")
-                logger.info(f"{'=' * 60}")
-
-                # Get node
-                try:
-                    node = nuke.toNode(node_name)
-                    if not node:
-                        raise Exception(f"Node '{node_name}' not found")
-                    logger.info(f"Node found: {node.Class()} - {node_name}")
-                except Exception as e:
-                    logger.error(f"Failed to get node '{node_name}': {e}")
-                    self.error_occurred.emit("Node Error", str(e))
-                    return
-
-                # Process this node
-                self.progress_update.emit(
-                    f"Processing {node_name} ({idx + 1}/{total_nodes})",
-                    base_progress,
-                    "Preparing to track..."
-                )
+                # Tag every record of this node for ticket snapshots
+                with log_context(node=node_name):
+                    # Calculate progress
+                    base_progress = (idx / total_nodes) * 100
+                    logger.info("\n%s", "=" * 60)
+                    logger.info("Processing node %d/%d: %s", idx + 1, total_nodes, node_name)
+                    logger.info("=" * 60)
 
-                try:
-                    start_time = time.time()
-                    self._process_camera_tracker(
-                        node,
-                        node_name,
+                    # Get node
+                    try:
+                        node = nuke.toNode(node_name)
+                        if not node:
+                            raise Exception(f"Node '{node_name}' not found")
+                        logger.info("Node found: %s - %s", node.Class(), node_name)
+                    except Exception as e:
+                        logger.error("Failed to get node '%s': %s", node_name, e)
+                        self.results[node_name] = {'status': "failed", 'error': str(e)}
+                        self.error_occurred.emit("Node Error", str(e))
+                        return
+
+                    # Process this node
+                    self.progress_update.emit(
+                        f"Processing {node_name} ({idx + 1}/{total_nodes})",
                         base_progress,
-                        100.0 / total_nodes
+                        "Preparing to track..."
                     )
-                    elapsed = time.time() - start_time
-                    logger.info(f"Completed {node_name} in {elapsed:.2f} seconds")
-                except Exception as e:
-                    logger.error(f"Error processing {node_name}: {e}", exc_info=True)
 
-                    # Submit ticket (must run in main thread for UI)
+                    result = self.results.setdefault(node_name, {'status': "running"})
                     try:
-                        # Capture variables by value for lambda
-                        ctx = {
-                            "node_name": node_name,
-                            "node_class": node.Class() if 'node' in locals() and node else "N/A",
-                            "processing_step": "camera_tracker_processing",
-                            "total_nodes": total_nodes,
-                            "current_node_index": idx + 1,
-                            "params": self.params
-                        }
-                        nuke.executeInMainThread(lambda exc=e, context=ctx: submit_ticket(
-                            exception=exc,
-                            context=context,
-                            show_ui=True
-                        ))
-                    except Exception as ticket_err:
-                        logger.error(f"Failed to submit ticket: {ticket_err}", exc_info=True)
-
-                    self.error_occurred.emit(
-                        f"Error processing {node_name}",
-                        f"Failed to process camera tracker:\n\n{str(e)}"
-                    )
-                    return
+                        start_time = time.time()
+                        self._process_camera_tracker(
+                            node,
+                            node_name,
+                            base_progress,
+                            100.0 / total_nodes
+                        )
+                        elapsed = time.time() - start_time
+                        result['duration'] = elapsed
+                        result['status'] = "cancelled" if self.cancelled else "done"
+                        logger.info("Completed %s in %.2f seconds", node_name, elapsed,
+                                    extra=runlog.fields(node=node_name, stage="node", duration=elapsed))
+                    except CancelledError:
+                        result['status'] = "cancelled"
+                        logger.warning("Tracking cancelled by user")
+                        self.tracking_complete.emit(False, "Tracking cancelled by user")
+                        return
+                    except Exception as e:
+                        result['status'] = "failed"
+                        result['error'] = str(e)
+                        logger.error("Error processing %s: %s", node_name, e, exc_info=True)
+
+                        # Submit ticket (must run in main thread for UI)
+                        try:
+                            ctx = {
+                                "node_name": node_name,
+                                "node_class": node.Class() if 'node' in locals() and node else "N/A",
+                                "processing_step": "camera_tracker_processing",
+                                "total_nodes": total_nodes,
+                                "current_node_index": idx + 1,
+                                "params": self.params,
+                                "recent_logs": snapshot(node=node_name, limit=TICKET_LOG_RECORDS)
+                            }
+                            # Shared dispatcher: cancelling the job must not drop the ticket
+                            main_thread.submit(submit_ticket, exception=e, context=ctx, show_ui=self.show_ticket_ui)
+                        except Exception as ticket_err:
+                            logger.error(f"Failed to submit ticket: {ticket_err}", exc_info=True)
+
+                        self.error_occurred.emit(
+                            f"Error processing {node_name}",
+                            f"Failed to process camera tracker:\n\n{str(e)}"
+                        )
+                        return
 
             # Complete
             logger.info("=" * 60)
@@ -141,22 +245,134 @@ class TrackingWorker(QtCore.QThread):
 
             # Submit ticket (must run in main thread for UI)
             try:
-                # Capture variables by value for lambda
                 ctx = {
                     "processing_step": "main_tracking_loop",
                     "total_nodes": total_nodes if 'total_nodes' in locals() else "N/A",
                     "nodes": nodes if 'nodes' in locals() else "N/A",
-                    "params": self.params
+                    "params": self.params,
+                    "recent_logs": snapshot(limit=TICKET_LOG_RECORDS)
                 }
-                nuke.executeInMainThread(lambda exc=e, context=ctx: submit_ticket(
-                    exception=exc,
-                    context=context,
-                    show_ui=True
-                ))
+                main_thread.submit(submit_ticket, exception=e, context=ctx, show_ui=self.show_ticket_ui)
             except Exception as ticket_err:
                 logger.error(f"Failed to submit ticket: {ticket_err}", exc_info=True)
 
             self.error_occurred.emit("Tracking Error", f"Unexpected error:\n\n{str(e)}")
+        finally:
+            throttled.log_summary(logging.DEBUG)
+
+    def _run_parallel(self, nodes):
+        """
+        Track the nodes in headless Nuke worker processes.
+
+        Results are merged into the live script as each worker finishes.
+
+        Args:
+            nodes: CameraTracker node names
+        """
+        from concurrent.futures import CancelledError
+        from VfxPipe.nuke import main_thread
+        from VfxPipe.nuke.tracking.coordinator import CoordinatorClient, CoordinatorLauncher
+        from VfxPipe.nuke.tracking.daemon import DaemonClient, DaemonLauncher
+        from VfxPipe.nuke.tracking.fanout import FanOut, snapshot_script
+        from VfxPipe.nuke.tracking.merge import merge_snippet
+        from VfxPipe.utils import runlog
+
+        total_nodes = len(nodes)
+        completed = [0]
+
+        def report(node_name, msg):
+            self.progress_update.emit(
+                f"Completed {completed[0]}/{total_nodes}",
+                completed[0] / total_nodes * 100,
+                f"{node_name} [{msg.get('agent', '-')}]: {msg.get('message')}"
+            )
+
+        # Prefer the render node coordinator, then warm daemon workers
+        # (no Nuke startup), then new local processes
+        launcher = None
+        coordinator = CoordinatorClient.find()
+        daemon = DaemonClient.find() if coordinator is None else None
+        if coordinator is not None:
+            logger.info("Using the tracking coordinator at %s:%d", coordinator.host, coordinator.port)
+            launcher = CoordinatorLauncher(coordinator, on_progress=report)
+        elif daemon is not None:
+            logger.info("Using the tracking daemon at %s:%d", daemon.host, daemon.port)
+            launcher = DaemonLauncher(daemon)
+        fan_out = FanOut(max_workers=min(self.params['workers'], total_nodes), launcher=launcher)
+        self.progress_update.emit(
+            f"Tracking {total_nodes} node(s) in {fan_out.max_workers} worker process(es)",
+            0,
+            "Saving script snapshot..."
+        )
+        script = self._wait(self.dispatcher.submit(snapshot_script, fan_out.work_dir / "snapshot.nk"))
+
+        failed = []
+        for done, result in enumerate(fan_out.run(script, nodes, self.params, lambda: self.cancelled), 1):
+            completed[0] = done
+            node_name = result.node
+            entry = self.results.setdefault(node_name, {})
+            entry.update(result.summary or {})
+            entry['duration'] = result.duration
+
+            if result.ok:
+                try:
+                    merged = self._wait(self.dispatcher.submit(merge_snippet, result.task.snippet, node_name))
+                    entry['camera'] = merged['camera']
+                    logger.info(f"Completed {node_name} in {result.duration:.2f} seconds "
+                                f"(RMSE {entry.get('final_rmse')}, camera {merged['camera']})",
+                                extra=runlog.fields(node=node_name, stage="node", duration=result.duration))
+                except CancelledError:
+                    raise
+                except Exception as e:
+                    result.error = f"Could not merge result: {e}"
+                    logger.error(f"Failed to merge {node_name}: {e}", exc_info=True)
+
+            if result.cancelled:
+                entry['status'] = "cancelled"
+            elif result.error:
+                entry['status'] = "failed"
+                entry['error'] = result.error
+                failed.append(node_name)
+                logger.error("Worker failed for %s: %s", node_name, result.error,
+                             extra=runlog.fields(node=node_name, stage="node", duration=result.duration))
+
+            self.progress_update.emit(
+                f"Completed {done}/{total_nodes}",
+                done / total_nodes * 100,
+                f"{node_name}: {entry.get('status', 'done')}"
+            )
+
+        if self.cancelled:
+            fan_out.cleanup()
+            logger.warning("Tracking cancelled by user")
+            self.tracking_complete.emit(False, "Tracking cancelled by user")
+            return
+
+        if failed:
+            # Worker logs are kept for the ticket and for debugging
+            fan_out.keep_files = True
+            ctx = {
+                "processing_step": "parallel_tracking",
+                "failed_nodes": failed,
+                "errors": {name: self.results[name].get('error') for name in failed},
+                "work_dir": str(fan_out.work_dir),
+                "params": self.params,
+                "recent_logs": snapshot(limit=TICKET_LOG_RECORDS)
+            }
+            main_thread.submit(submit_ticket, exception=RuntimeError(f"{len(failed)} tracking worker(s) failed"),
+                               context=ctx, show_ui=self.show_ticket_ui)
+            self.error_occurred.emit(
+                "Parallel Tracking Error",
+                f"{len(failed)} of {total_nodes} node(s) failed: {', '.join(failed)}\n\n"
+                f"Worker logs: {fan_out.work_dir}"
+            )
+        else:
+            fan_out.cleanup()
+            logger.info(f"AUTO TRACK COMPLETED SUCCESSFULLY - {total_nodes} node(s) processed in parallel")
+            self.tracking_complete.emit(
+                True,
+                f"Successfully processed {total_nodes} camera tracker(s)"
+            )
 
     def _process_camera_tracker(self, node, node_name, base_progress, progress_range):
         """
@@ -168,18 +384,23 @@ class TrackingWorker(QtCore.QThread):
             base_progress: Starting progress percentage
             progress_range: Range of progress this node represents
         """
-        logger.info(f"\n--- Processing CameraTracker: {node_name} ---")
+        from concurrent.futures import CancelledError
+        from VfxPipe.nuke.main_thread import Transaction
+        from VfxPipe.utils import runlog
+
+        logger.info("\n--- Processing CameraTracker: %s ---", node_name)
+        result = self.results.setdefault(node_name, {})
+        timings = result.setdefault('timings', {})
 
         # Show control panel
         logger.debug("Showing control panel...")
-        nuke.executeInMainThread(node.showControlPanel)
+        self.dispatcher.submit(node.showControlPanel)
 
         # Get current plate name
         try:
-            plate_name = nuke.executeInMainThreadWithResult(
-                lambda: nuke.tcl(f"full_name [topnode {node.name()}]")
-            )
-            logger.info(f"Plate name: {plate_name}")
+            plate_name = self._wait(self.dispatcher.submit(nuke.tcl, f"full_name [topnode {node_name}]"))
+            logger.info("Plate name: %s", plate_name)
+            result['plate'] = plate_name
         except Exception as e:
             logger.warning(f"Could not get plate name, using node name: {e}")
             plate_name = node_name
@@ -195,19 +416,23 @@ class TrackingWorker(QtCore.QThread):
             f"Tracking features on plate: {plate_name}"
         )
 
-        # Execute tracking in main thread (CRITICAL FIX)
+        # Execute tracking in main thread and wait until it has finished
         logger.debug("Executing trackFeatures button...")
-        start_time = time.time()
-        nuke.executeInMainThread(lambda: node["trackFeatures"].execute())
-        elapsed = time.time() - start_time
+        future = Transaction().execute(node, "trackFeatures").submit(self.dispatcher)
+        self._wait(future)
+        timings['track'] = {'duration': future.run_time, 'queue_wait': future.queue_wait}
 
         # Check track count
         try:
-            track_count = nuke.executeInMainThreadWithResult(
-                lambda: len(node.knob('tracks').getValue())
-            )
-            logger.info(f"Tracking complete in {elapsed:.2f}s - {track_count} tracks created")
-        except:
+            track_count = len(self._wait(self.dispatcher.submit(lambda: node.knob('tracks').getValue())))
+            result['track_count'] = track_count
+            logger.info(f"Tracking complete in {future.run_time:.2f}s "
+                        f"(queued {future.queue_wait:.2f}s) - {track_count} tracks created",
+                        extra=runlog.fields(node=node_name, stage="track", duration=future.run_time,
+                                            queue_wait=future.queue_wait))
+        except CancelledError:
+            raise
+        except Exception:
             logger.warning("Could not get track count")
 
         # Solve Camera
@@ -222,17 +447,21 @@ class TrackingWorker(QtCore.QThread):
         )
 
         logger.debug("Executing solveCamera button...")
-        start_time = time.time()
-        nuke.executeInMainThread(lambda: node["solveCamera"].execute())
-        elapsed = time.time() - start_time
+        future = Transaction().execute(node, "solveCamera").submit(self.dispatcher)
+        self._wait(future)
+        timings['solve'] = {'duration': future.run_time, 'queue_wait': future.queue_wait}
 
         # Check initial RMSE
         try:
-            initial_rmse = nuke.executeInMainThreadWithResult(
-                lambda: node['solveRMSE'].value()
-            )
-            logger.info(f"Camera solved in {elapsed:.2f}s - Initial RMSE: {initial_rmse:.4f}")
-        except:
+            initial_rmse = self._wait(self.dispatcher.submit(lambda: node['solveRMSE'].value()))
+            result['initial_rmse'] = initial_rmse
+            logger.info(f"Camera solved in {future.run_time:.2f}s "
+                        f"(queued {future.queue_wait:.2f}s) - Initial RMSE: {initial_rmse:.4f}",
+                        extra=runlog.fields(node=node_name, stage="solve", rmse=initial_rmse,
+                                            duration=future.run_time, queue_wait=future.queue_wait))
+        except CancelledError:
+            raise
+        except Exception:
             logger.warning("Could not get initial RMSE")
 
         # Recursive update solve
@@ -264,32 +493,19 @@ class TrackingWorker(QtCore.QThread):
             f"Generating camera node: {self.params['camera_prefix']}{plate_name}"
         )
 
-        # Store current cameras to find the new one
-        cameras_before = nuke.executeInMainThreadWithResult(
-            lambda: set(nuke.allNodes('Camera3'))
-        )
-        logger.debug(f"Cameras before: {len(cameras_before)}")
-
-        # Create camera using the enhanced function (in main thread)
+        # Create and rename the camera in a single main-thread transaction
         logger.debug("Creating camera node...")
-        start_time = time.time()
-        camera_node = nuke.executeInMainThreadWithResult(
-            lambda: self._create_camera(node)
-        )
-        elapsed = time.time() - start_time
-        logger.info(f"Camera created in {elapsed:.2f}s")
-
-        # Find and rename the new camera
-        cameras_after = nuke.executeInMainThreadWithResult(
-            lambda: set(nuke.allNodes('Camera3'))
-        )
-        new_cameras = cameras_after - cameras_before
-        logger.debug(f"Cameras after: {len(cameras_after)}, New cameras: {len(new_cameras)}")
-
-        if new_cameras:
-            camera_node = list(new_cameras)[0]
-            final_name = f"{self.params['camera_prefix']}{plate_name}"
-            nuke.executeInMainThread(lambda: camera_node.setName(final_name))
+        final_name = f"{self.params['camera_prefix']}{plate_name}"
+        future = self.dispatcher.submit(self._create_named_camera, node, final_name)
+        created = self._wait(future)
+        timings['camera'] = {'duration': future.run_time, 'queue_wait': future.queue_wait}
+        result['camera'] = created['name']
+        logger.info(f"Camera created in {future.run_time:.2f}s (queued {future.queue_wait:.2f}s)",
+                    extra=runlog.fields(node=node_name, stage="camera", duration=future.run_time,
+                                        queue_wait=future.queue_wait))
+        logger.debug("Cameras before: %d, after: %d", created['before'], created['after'])
+
+        if created['name']:
             logger.info(f"Camera renamed to: {final_name}")
 
             self.progress_update.emit(
@@ -300,6 +516,33 @@ class TrackingWorker(QtCore.QThread):
         else:
             logger.warning("No new camera found after creation!")
 
+    def _create_named_camera(self, solver, name):
+        """
+        Create the camera for a solver and give it its final name. Main thread only.
+
+        The new camera is found by comparing the Camera3 nodes before and
+        after creation.
+
+        Args:
+            solver: CameraTracker node
+            name: Final camera name
+
+        Returns:
+            Dictionary with the camera 'name' (None if no new camera was
+            found) and the 'before'/'after' camera counts
+        """
+        cameras_before = set(nuke.allNodes('Camera3'))
+        self._create_camera(solver)
+        cameras_after = set(nuke.allNodes('Camera3'))
+        new_cameras = cameras_after - cameras_before
+
+        camera_name = None
+        if new_cameras:
+            camera_node = list(new_cameras)[0]
+            camera_node.setName(name)
+            camera_name = camera_node.name()
+        return {'name': camera_name, 'before': len(cameras_before), 'after': len(cameras_after)}
+
     def _create_camera(self, solver):
         """
         Create a camera node based on the projection calculated by the solver.
@@ -352,34 +595,18 @@ class TrackingWorker(QtCore.QThread):
             # Re-raise to be caught by outer handler (which will submit ticket)
             raise
 
-    def _update_solve(self, cameraTracker):
+    def _add_update_solve(self, tx, cameraTracker):
         """
-        Update the solve for a camera tracker.
+        Add the update-solve steps to a main-thread transaction.
+
+        Stores the reference frames under 'ref_frames'.
 
         Args:
+            tx: Transaction to extend
             cameraTracker: CameraTracker node
         """
-        logger.debug("Updating solve...")
-
-        # Get reference frames (in main thread)
-        refFrames = nuke.executeInMainThreadWithResult(
-            lambda: [cameraTracker['trackStart'].value(), cameraTracker['trackStop'].value()]
-        )
-        logger.debug(f"Reference frames: {refFrames}")
-
-        # Update selected frames knob (in main thread)
-        def update_frames():
-            selFrameKnob = cameraTracker.knob('selectedFrames')
-            selFrameKnob.clearAnimated()
-            selFrameKnob.setAnimated()
-            for frame in refFrames:
-                selFrameKnob.setValueAt(frame, frame)
-
-        nuke.executeInMainThread(update_frames)
-
-        # Execute update solve button (in main thread)
-        nuke.executeInMainThread(lambda: cameraTracker.knob("doUpdateSolve").execute())
-        logger.debug("Solve updated")
+        tx.call('ref_frames', _set_reference_frames, cameraTracker)
+        tx.execute(cameraTracker, "doUpdateSolve")
 
     def _update_solve_recursive(self, node, node_name, base_progress, progress_range):
         """
@@ -391,56 +618,64 @@ class TrackingWorker(QtCore.QThread):
             base_progress: Starting progress percentage
             progress_range: Range of progress this represents
         """
+        from VfxPipe.nuke.main_thread import Transaction
+        from VfxPipe.nuke.tracking import refinement
+        from VfxPipe.utils import runlog
+
         params = self.params
-        minLen = params['minLen']
-        maxTrackError = params['maxTrackError']
-        maxError = params['maxError']
+        thresholds = refinement.Thresholds(params['minLen'], params['maxTrackError'], params['maxError'])
         controlError = params['controlError']
         max_iter = params['max_iter']
+        strategy = refinement.create_strategy(params.get('refine_strategy'), controlError)
 
-        logger.info(f"Starting recursive refinement - Target RMSE: {controlError}, Max iterations: {max_iter}")
+        logger.info("Starting recursive refinement - Target RMSE: %s, Max iterations: %s, Strategy: %s",
+                    controlError, max_iter, strategy.name)
 
         iteration = 0
 
         try:
-            current_rmse = nuke.executeInMainThreadWithResult(lambda: node['solveRMSE'].value())
+            current_rmse = self._wait(Transaction().read('rmse', node, 'solveRMSE').submit(self.dispatcher))['rmse']
 
             while current_rmse >= controlError and iteration < max_iter:
                 if self.cancelled:
                     logger.info("Recursive refinement cancelled by user")
                     return
 
-                logger.debug(f"Iteration {iteration + 1}/{max_iter} - Current RMSE: {current_rmse:.4f}")
-
-                # Update thresholds (in main thread)
-                nuke.executeInMainThread(lambda: node['minLengthThreshold'].setValue(minLen))
-                nuke.executeInMainThread(lambda: node['maxRMSEThreshold'].setValue(maxTrackError))
-                nuke.executeInMainThread(lambda: node['maxErrorThreshold'].setValue(maxError))
-                logger.debug(f"Set thresholds - minLen: {minLen}, maxTrackError: {maxTrackError:.2f}, maxError: {maxError:.2f}")
-
-                # Delete rejected tracks
-                nuke.executeInMainThread(lambda: node['deleteRejectedTracks'].setValue(
-                    "cameraTracker = nuke.thisNode()\n"
-                    "cameraTracker['proceedWithUpdate'].setValue(True)"
-                ))
-                nuke.executeInMainThread(lambda: node['deleteRejectedTracks'].execute())
-                logger.debug("Deleted rejected tracks")
-
-                # Delete invalid tracks
-                nuke.executeInMainThread(lambda: node['deleteInvalidTracks'].setValue(
-                    "cameraTracker = nuke.thisNode()\n"
-                    "cameraTracker['proceedWithUpdate'].setValue(True)"
-                ))
-                nuke.executeInMainThread(lambda: node['deleteInvalidTracks'].execute())
-                logger.debug("Deleted invalid tracks")
-
-                # Update solve
-                self._update_solve(node)
-
-                new_rmse = nuke.executeInMainThreadWithResult(lambda: node['solveRMSE'].value())
+                throttled.sample(iteration, max_iter, LOG_SAMPLE_EVERY, logging.DEBUG,
+                                 "Iteration %d/%d - Current RMSE: %.4f", iteration + 1, max_iter, current_rmse)
+                iteration_start = time.time()
+
+                # One main-thread hop per iteration: thresholds, track
+                # cleanup, update solve and the new RMSE
+                tx = Transaction()
+                tx.set(node, 'minLengthThreshold', thresholds.min_len)
+                tx.set(node, 'maxRMSEThreshold', thresholds.max_track_error)
+                tx.set(node, 'maxErrorThreshold', thresholds.max_error)
+                for knob in ('deleteRejectedTracks', 'deleteInvalidTracks'):
+                    tx.set(node, knob, PROCEED_WITH_UPDATE_SCRIPT)
+                    tx.execute(node, knob)
+                self._add_update_solve(tx, node)
+                tx.read('rmse', node, 'solveRMSE')
+                future = tx.submit(self.dispatcher)
+                results = self._wait(future)
+
+                new_rmse = results['rmse']
+                # Converging ends the loop before max_iter: log this iteration too
+                throttled.sample(iteration, max_iter, LOG_SAMPLE_EVERY, logging.DEBUG,
+                                 "Set thresholds - minLen: %s, maxTrackError: %.2f, maxError: %.2f; "
+                                 "deleted rejected/invalid tracks; reference frames: %s",
+                                 thresholds.min_len, thresholds.max_track_error, thresholds.max_error,
+                                 results['ref_frames'], last=new_rmse < controlError)
+
                 improvement = current_rmse - new_rmse
 
-                logger.info(f"Iteration {iteration + 1} complete - RMSE: {current_rmse:.4f} → {new_rmse:.4f} (Δ {improvement:.4f})")
+                logger.info(
+                    "Iteration %d complete - RMSE: %.4f → %.4f (Δ %.4f)",
+                    iteration + 1, current_rmse, new_rmse, improvement,
+                    extra=runlog.fields(node=node_name, stage="refine", iteration=iteration + 1,
+                                        rmse=new_rmse, duration=time.time() - iteration_start,
+                                        queue_wait=future.queue_wait)
+                )
 
                 # Update progress
                 iter_progress = base_progress + (iteration / max_iter) * progress_range
@@ -448,7 +683,7 @@ class TrackingWorker(QtCore.QThread):
                     f"Iteration {iteration + 1}/{max_iter} | "
                     f"RMSE: {current_rmse:.4f} → {new_rmse:.4f} | "
                     f"Target: {controlError:.4f} | "
-                    f"MinLen: {minLen}, MaxError: {maxError:.2f}"
+                    f"MinLen: {thresholds.min_len}, MaxError: {thresholds.max_error:.2f}"
                 )
 
                 self.progress_update.emit(
@@ -457,15 +692,27 @@ class TrackingWorker(QtCore.QThread):
                     detail
                 )
 
-                # Adjust parameters for next iteration
-                minLen += 1
-                maxTrackError -= 0.25
-                maxError -= 0.25
                 iteration += 1
                 current_rmse = new_rmse
 
+                # Tighter thresholds for the next iteration
+                if current_rmse >= controlError and iteration < max_iter:
+                    next_thresholds = strategy.next_thresholds(thresholds, current_rmse)
+                    if next_thresholds is None:
+                        logger.info("No tighter thresholds left to try after minLen: %s, "
+                                    "maxTrackError: %.2f, maxError: %.2f", thresholds.min_len,
+                                    thresholds.max_track_error, thresholds.max_error)
+                        break
+                    thresholds = next_thresholds
+
             # Final status
-            final_rmse = nuke.executeInMainThreadWithResult(lambda: node['solveRMSE'].value())
+            # The last iteration already read the RMSE of the current solve
+            final_rmse = current_rmse
+            result = self.results.setdefault(node_name, {})
+            result['iterations'] = iteration
+            result['refine_strategy'] = strategy.name
+            result['final_rmse'] = final_rmse
+            result['converged'] = final_rmse < controlError
             final_detail = (
                 f"Refinement complete after {iteration} iteration(s) | "
                 f"Final RMSE: {final_rmse:.4f}"
@@ -474,7 +721,8 @@ class TrackingWorker(QtCore.QThread):
             if final_rmse < controlError:
                 logger.info(f"✓ Target RMSE achieved: {final_rmse:.4f} < {controlError:.4f}")
             else:
-                logger.warning(f"Target RMSE not achieved: {final_rmse:.4f} >= {controlError:.4f} (max iterations reached)")
+                logger.warning(f"Target RMSE not achieved: {final_rmse:.4f} >= {controlError:.4f} "
+                               f"after {iteration} iteration(s)")
 
             self.progress_update.emit(
                 f"Refining {node_name}",
@@ -488,8 +736,122 @@ class TrackingWorker(QtCore.QThread):
             raise
 
     def cancel(self):
-        """Cancel the tracking operation."""
+        """Cancel the tracking operation and any main-thread call not started yet."""
         self.cancelled = True
+        self.dispatcher.cancel_pending()
+
+
+_tracking_worker_class = None
+
+
+def get_tracking_worker_class():
+    """
+    Get the TrackingWorker QThread class, loading Qt on first call.
+
+    Returns:
+        TrackingWorker class
+    """
+    global _tracking_worker_class
+
+    if _tracking_worker_class is None:
+        QtCore = qt.QtCore
+
+        class TrackingWorker(TrackingWorkerBase, QtCore.QThread):
+            """
+            Worker thread for camera tracking operations.
+
+            Runs tracking operations in a separate thread to keep UI responsive.
+            """
+
+            # Signals for progress updates
+            progress_update = QtCore.Signal(str, float, str)  # message, percentage, detail
+            tracking_complete = QtCore.Signal(bool, str)  # success, message
+            error_occurred = QtCore.Signal(str, str)  # title, message
+
+            def __init__(self, params):
+                QtCore.QThread.__init__(self)
+                self._init_job(params)
+
+        TrackingWorker.__qualname__ = "TrackingWorker"
+        _tracking_worker_class = TrackingWorker
+
+    return _tracking_worker_class
+
+
+def __getattr__(name):
+    # Keep 'from auto_track import TrackingWorker' working without eager Qt
+    if name == "TrackingWorker":
+        return get_tracking_worker_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _Callback(object):
+    """Stand-in for a Qt signal that forwards emit() to a plain function."""
+
+    def __init__(self, func=None):
+        self._func = func
+
+    def emit(self, *args):
+        if self._func is not None:
+            self._func(*args)
+
+
+class HeadlessTrackingRunner(TrackingWorkerBase):
+    """
+    Runs the tracking pipeline on the calling thread, without Qt.
+
+    Reporter callbacks take the place of the worker signals. Run it from
+    Nuke's main thread (nuke -t), where main-thread calls run inline.
+
+    Attributes:
+        success: True/False once the run finished, None before
+        message: Completion or error message
+    """
+
+    show_ticket_ui = False
+
+    def __init__(self, params, on_progress=None, on_complete=None, on_error=None, is_cancelled=None):
+        """
+        Initialize the runner.
+
+        Args:
+            params: Tracking parameters, as built by the Auto Track widget
+            on_progress: Called with (message, percentage, detail)
+            on_complete: Called with (success, message)
+            on_error: Called with (title, message)
+            is_cancelled: Polled between steps; the run is cancelled once it returns True
+        """
+        self._is_cancelled = is_cancelled
+        self._init_job(params)
+        self.success = None
+        self.message = ""
+        self.progress_update = _Callback(on_progress)
+        self.tracking_complete = _Callback(self._reporter(on_complete, self._on_complete))
+        self.error_occurred = _Callback(self._reporter(on_error, self._on_error))
+
+    @staticmethod
+    def _reporter(callback, record):
+        def report(*args):
+            record(*args)
+            if callback is not None:
+                callback(*args)
+        return report
+
+    @property
+    def cancelled(self):
+        return self._cancelled or (self._is_cancelled is not None and bool(self._is_cancelled()))
+
+    @cancelled.setter
+    def cancelled(self, value):
+        self._cancelled = value
+
+    def _on_complete(self, success, message):
+        self.success = success
+        self.message = message
+
+    def _on_error(self, title, message):
+        self.success = False
+        self.message = f"{title}: {message}"
 
 
 # Global reference to widget and worker
@@ -533,7 +895,7 @@ def _on_start_tracking(params):
 
     try:
         # Create and start worker thread
-        _worker = TrackingWorker(params)
+        _worker = get_tracking_worker_class()(params)
 
         # Connect worker signals to widget
         _worker.progress_update.connect(_widget.update_status)
@@ -569,6 +931,156 @@ def _on_cancel_tracking():
         _worker.cancel()
 
 
+def _export_nodes(node_names, path):
+    """
+    Write nodes to a .nk snippet that can be pasted or imported elsewhere.
+
+    Args:
+        node_names: Names of the nodes to export
+        path: Snippet file path
+    """
+    nodes = [nuke.toNode(name) for name in node_names]
+    for node in nuke.selectedNodes():
+        node['selected'].setValue(False)
+    for node in nodes:
+        if node is not None:
+            node['selected'].setValue(True)
+    nuke.nodeCopy(str(path))
+
+
+def run_batch(script, nodes=None, params=None, output=None, save=True, export=None,
+              on_progress=None, is_cancelled=None):
+    """
+    Run the auto track pipeline on a script without a GUI.
+
+    Args:
+        script: Nuke script to open
+        nodes: CameraTracker node names (default: every CameraTracker in the script)
+        params: Tracking parameters; missing ones use DEFAULT_PARAMS
+        output: Save the script to this path instead of over the original
+        save: Save the script after tracking
+        export: Also write the trackers and their cameras to this .nk snippet
+        on_progress: Called with (message, percentage, detail) as tracking progresses
+        is_cancelled: Polled between steps; tracking stops once it returns True
+
+    Returns:
+        Result summary dictionary (see SUMMARY_FORMAT)
+
+    Raises:
+        ValueError: If params name an unknown refinement strategy
+    """
+    from VfxPipe.nuke.tracking import refinement
+    from VfxPipe.utils import runlog
+
+    start_time = time.time()
+    job_params = dict(DEFAULT_PARAMS)
+    job_params.update(params or {})
+    # Fail before opening the script rather than after tracking
+    refinement.create_strategy(job_params['refine_strategy'], job_params['controlError'])
+
+    nuke.scriptOpen(str(script))
+
+    if not nodes:
+        nodes = [node.name() for node in nuke.allNodes('CameraTracker')]
+    job_params['nodes'] = list(nodes)
+
+    runner = HeadlessTrackingRunner(job_params, on_progress=on_progress, is_cancelled=is_cancelled)
+    if nodes:
+        runner.run()
+    else:
+        runner.success, runner.message = False, "No CameraTracker nodes to process"
+        logger.error(runner.message)
+
+    results = []
+    for name in nodes:
+        result = {'node': name, 'status': "skipped"}
+        result.update(runner.results.get(name, {}))
+        results.append(result)
+
+    saved = None
+    if save and any(result['status'] == "done" for result in results):
+        saved = str(output or script)
+        if output:
+            nuke.scriptSaveAs(saved, overwrite=1)
+        else:
+            nuke.scriptSave(saved)
+        logger.info("Saved script: %s", saved)
+
+    if export:
+        exported = [result['node'] for result in results if result['status'] == "done"]
+        exported += [result['camera'] for result in results if result.get('camera')]
+        _export_nodes(exported, export)
+        logger.info("Exported %d node(s) to %s", len(exported), export)
+
+    return {
+        'format': SUMMARY_FORMAT,
+        'success': bool(runner.success),
+        'message': runner.message,
+        'script': str(script),
+        'saved': saved,
+        'export': str(export) if export else None,
+        'run_id': runlog.get_run_id(),
+        'duration': time.time() - start_time,
+        'params': {key: value for key, value in job_params.items() if key != 'nodes'},
+        'nodes': results,
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point for batch tracking.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code: 0 on success, 1 if tracking failed
+    """
+    import argparse
+    import json
+    from VfxPipe.nuke.tracking import refinement
+
+    parser = argparse.ArgumentParser(prog="python -m VfxPipe.nuke.tools.auto_track",
+                                     description="Run Auto Track on a Nuke script without a GUI.")
+    parser.add_argument("--script", required=True, help="Nuke script to track")
+    parser.add_argument("--nodes", default="",
+                        help="Comma separated CameraTracker names (default: all CameraTrackers)")
+    parser.add_argument("--params", help="JSON file with tracking parameters (default: widget defaults)")
+    parser.add_argument("--output", help="Save the tracked script here instead of over --script")
+    parser.add_argument("--no-save", action="store_true", help="Do not save the script")
+    parser.add_argument("--export", help="Write the solved trackers and cameras to this .nk snippet")
+    parser.add_argument("--summary", default="-", help="Result summary JSON file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    params = {}
+    if args.params:
+        try:
+            with open(args.params, "r", encoding="utf-8") as f:
+                params = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"cannot read parameters from {args.params}: {e}")
+        if not isinstance(params, dict):
+            parser.error(f"{args.params} must contain a JSON object")
+        if params.get('refine_strategy', refinement.DEFAULT_STRATEGY) not in refinement.STRATEGIES:
+            parser.error(f"unknown refine_strategy '{params['refine_strategy']}' "
+                         f"(available: {', '.join(refinement.STRATEGIES)})")
+
+    nodes = [name.strip() for name in args.nodes.split(",") if name.strip()]
+    summary = run_batch(args.script, nodes, params, output=args.output,
+                        save=not args.no_save, export=args.export)
+
+    text = json.dumps(summary, indent=2, default=str)
+    if args.summary == "-":
+        # Drain the log output first so the summary is not interleaved with it
+        from VfxPipe.utils.logger import shutdown
+        shutdown()
+        print(text)
+    else:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0 if summary['success'] else 1
+
+
 def register():
     """
     Register the Auto Track tool with VfxPipe.
@@ -578,5 +1090,12 @@ def register():
     """
     return {
         'menu_name': 'Auto Track',
-        'action': show_auto_track_widget
+        'action': show_auto_track_widget,
+        'batch': {
+            'run': run_batch
+        }
     }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+VfxPipe Tracking Execution
+
+Ways of running Auto Track jobs outside the interactive Nuke session, such as
+fanning CameraTracker nodes out to headless Nuke processes and merging their
+results back into the live script.
+"""
@@ -0,0 +1,1077 @@
+"""
+Multi-Host Tracking Coordinator
+
+Spreads Auto Track jobs across render nodes. The coordinator holds a queue
+of tracker jobs and hands them, one at a time, to worker agents connected
+over TCP. An agent is a headless Nuke process on a render node; it sends
+heartbeats while connected, and an agent that misses them or disconnects is
+dropped and its job requeued on another agent. Progress and results are
+streamed back to the session that submitted the job.
+
+Jobs carry the script text, so agents need no access to the submitting
+machine, but the plates the script reads must be visible from the render
+nodes. The solved tracker and camera come back as .nk snippet text.
+
+    # coordinator host
+    python -m VfxPipe.nuke.tracking.coordinator serve --token SECRET
+    # each render node (runs the agent inside `nuke -t`, restarting it if Nuke dies)
+    python -m VfxPipe.nuke.tracking.coordinator agent --connect coordhost:47820 --token SECRET --nuke /path/to/Nuke
+
+    # local farm: coordinator and agents on localhost
+    python -m VfxPipe.nuke.tracking.coordinator local --agents 3
+    # same without Nuke: agents run in Python against the stand-in nuke module
+    # of a source checkout, with simulated solves
+    python -m VfxPipe.nuke.tracking.coordinator local --agents 3 --stand-in
+
+Sessions find the coordinator through VFXPIPE_TRACK_COORDINATOR, or through
+track_coordinator.json in the VfxPipe cache directory (written by `serve`
+and `local` on the coordinator host). Parallel Auto Track runs use it when
+it answers, before the local daemon or new processes.
+
+Environment variables:
+    VFXPIPE_TRACK_COORDINATOR: Coordinator address (host:port)
+    VFXPIPE_TRACK_COORDINATOR_TOKEN: Access token shared by the coordinator, agents and sessions
+    VFXPIPE_NUKE_EXECUTABLE: Nuke executable for local agents (default: sys.executable)
+"""
+
+import collections
+import json
+import os
+import queue
+import secrets
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from VfxPipe.nuke.tracking import protocol
+from VfxPipe.nuke.tracking.jobs import JobProcess, execute_job, rss_bytes
+from VfxPipe.utils.cache import get_cache_dir, read_json, write_json_atomic
+from VfxPipe.utils.logger import getLogger
+
+logger = getLogger("TrackingCoordinator")
+
+DEFAULT_PORT = 47820
+
+# Agents send a heartbeat this often and are dropped after HEARTBEAT_TIMEOUT
+# seconds without any message
+HEARTBEAT_INTERVAL = 5.0
+HEARTBEAT_TIMEOUT = 20.0
+
+# Times a job is handed to an agent before it is failed
+MAX_ATTEMPTS = 3
+
+# Seconds an agent waits before reconnecting to the coordinator
+RECONNECT_INTERVAL = 5.0
+
+# A supervised agent that exits this many times in a row, each within
+# QUICK_EXIT seconds, is not restarted again
+MAX_START_FAILURES = 3
+QUICK_EXIT = 60.0
+
+ADDRESS_ENV = "VFXPIPE_TRACK_COORDINATOR"
+TOKEN_ENV = "VFXPIPE_TRACK_COORDINATOR_TOKEN"
+
+# Runs this module's agent command inside `nuke -t`
+AGENT_BOOTSTRAP = (
+    "import runpy\n"
+    "runpy.run_module('VfxPipe.nuke.tracking.coordinator', run_name='__main__')\n"
+)
+
+
+def state_path() -> Path:
+    """Path of the file advertising a coordinator on this host."""
+    return get_cache_dir() / "track_coordinator.json"
+
+
+# -----------------------------------------------------------------------------
+# Agent
+# -----------------------------------------------------------------------------
+
+class _AgentSession:
+    """One agent connection: a reader and a heartbeat thread, jobs on the calling thread."""
+
+    def __init__(self, connection: protocol.Connection, name: str):
+        self.connection = connection
+        self.name = name
+        self.jobs = queue.Queue()
+        self.cancelled_ids = set()
+        self.closed = threading.Event()
+        self.job_id = None
+        # 0 when told to shut down, 1 when rejected, None when the connection was lost
+        self.exit_code = None
+
+    def run(self) -> Optional[int]:
+        """
+        Register and run jobs until the connection ends.
+
+        Returns:
+            Exit code, or None if the connection was lost
+        """
+        self.connection.send(protocol.message("register", token=os.environ.get(TOKEN_ENV, ""),
+                                              name=self.name, pid=os.getpid(),
+                                              version=protocol.PROTOCOL_VERSION))
+        threading.Thread(target=self._read, name="TrackAgentReader", daemon=True).start()
+        threading.Thread(target=self._heartbeat, name="TrackAgentHeartbeat", daemon=True).start()
+
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            self.job_id = job.get('id')
+            result = self._execute(job)
+            self.job_id = None
+            self.connection.send(result)
+        self.connection.close()
+        return self.exit_code
+
+    def _read(self):
+        try:
+            while True:
+                msg = self.connection.receive()
+                if msg is None:
+                    break
+                message_type = msg['type']
+                if message_type == "job":
+                    self.jobs.put(msg)
+                elif message_type == "cancel":
+                    self.cancelled_ids.add(msg.get('id'))
+                elif message_type == "shutdown":
+                    self.exit_code = 0
+                    break
+                elif message_type == "error":
+                    print(f"[VfxPipe] Tracking coordinator rejected this agent: {msg.get('error')}")
+                    self.exit_code = 1
+                    break
+        except protocol.ProtocolError as e:
+            logger.error("Invalid message from the coordinator: %s", e)
+        finally:
+            self.closed.set()
+            self.jobs.put(None)
+
+    def _heartbeat(self):
+        while not self.closed.wait(HEARTBEAT_INTERVAL):
+            self.connection.send(protocol.message("heartbeat", job=self.job_id, rss=rss_bytes()))
+
+    def _is_cancelled(self, job_id: str) -> bool:
+        # A lost connection cancels too; the coordinator already requeued the job
+        return job_id in self.cancelled_ids or self.closed.is_set()
+
+    def _execute(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a job, writing the shipped script and reading back the exported snippet."""
+        job_id = job.get('id')
+
+        def report(text, percentage, detail=""):
+            self.connection.send(protocol.message("progress", id=job_id, node=job.get('node'),
+                                                  message=text, percentage=percentage, detail=detail))
+
+        with tempfile.TemporaryDirectory(prefix="vfxpipe_agent_") as tmp:
+            local_job = dict(job, summary=None)
+            if job.get('script_data') is not None:
+                script = Path(tmp) / "script.nk"
+                script.write_text(job['script_data'], encoding="utf-8")
+                local_job['script'] = str(script)
+                del local_job['script_data']
+            snippet = None
+            if not job.get('export'):
+                snippet = Path(tmp) / "export.nk"
+                local_job['export'] = str(snippet)
+
+            result = execute_job(local_job, on_progress=report, is_cancelled=lambda: self._is_cancelled(job_id))
+            if snippet is not None and snippet.exists():
+                result['snippet'] = snippet.read_text(encoding="utf-8")
+        result['agent'] = self.name
+        return result
+
+
+def run_agent(host: str, port: int, name: Optional[str] = None, reconnect: bool = True) -> int:
+    """
+    Agent loop: connect to the coordinator and run its jobs in this (headless Nuke) process.
+
+    The token is read from VFXPIPE_TRACK_COORDINATOR_TOKEN.
+
+    Args:
+        host: Coordinator host
+        port: Coordinator port
+        name: Agent name shown by the coordinator (default: host name)
+        reconnect: Reconnect when the coordinator cannot be reached
+
+    Returns:
+        Process exit code: 0 when the coordinator shut the agent down
+    """
+    name = name or socket.gethostname()
+    while True:
+        try:
+            connection = protocol.connect(host, port, timeout=10)
+        except OSError as e:
+            print(f"[VfxPipe] Tracking agent could not reach the coordinator at {host}:{port}: {e}")
+            if not reconnect:
+                return 1
+            time.sleep(RECONNECT_INTERVAL)
+            continue
+
+        print(f"[VfxPipe] Tracking agent '{name}' connected to {host}:{port}")
+        exit_code = _AgentSession(connection, name).run()
+        if exit_code is not None:
+            return exit_code
+        print("[VfxPipe] Lost the tracking coordinator")
+        if not reconnect:
+            return 1
+        time.sleep(RECONNECT_INTERVAL)
+
+
+def agent_command(connect: str, name: Optional[str] = None, executable: Optional[str] = None,
+                  args: Optional[List[str]] = None) -> List[str]:
+    """
+    Build the command starting an agent in a headless Nuke process.
+
+    Args:
+        connect: Coordinator address (host:port)
+        name: Agent name
+        executable: Nuke executable (default: VFXPIPE_NUKE_EXECUTABLE or sys.executable)
+        args: Arguments before the agent script (default: ["-t"])
+
+    Returns:
+        Command list
+    """
+    script = get_cache_dir() / "track_coordinator" / "agent.py"
+    if not script.exists():
+        script.parent.mkdir(parents=True, exist_ok=True)
+        script.write_text(AGENT_BOOTSTRAP, encoding="utf-8")
+
+    executable = executable or os.environ.get("VFXPIPE_NUKE_EXECUTABLE") or sys.executable
+    command = [executable] + (list(args) if args is not None else ["-t"])
+    command += [str(script), "agent", "--connect", connect]
+    if name:
+        command += ["--name", name]
+    return command
+
+
+def agent_environment(token: str, launcher=None) -> Dict[str, str]:
+    """
+    Environment of an agent process; the token is not put on the command line.
+
+    Args:
+        token: Access token of the coordinator
+        launcher: fanout.SubprocessLauncher providing the base environment
+                  (default: SubprocessLauncher())
+    """
+    from VfxPipe.nuke.tracking.fanout import SubprocessLauncher
+    env = (launcher or SubprocessLauncher()).environment()
+    env[TOKEN_ENV] = token
+    return env
+
+
+def supervise_agent(command: List[str], env: Dict[str, str]) -> int:
+    """
+    Run an agent process, restarting it when it dies.
+
+    Args:
+        command: Agent command (see agent_command())
+        env: Agent environment
+
+    Returns:
+        Exit code of the last agent process
+    """
+    failures = 0
+    while True:
+        start_time = time.time()
+        returncode = subprocess.call(command, env=env)
+        if returncode == 0:
+            return 0
+        failures = failures + 1 if time.time() - start_time < QUICK_EXIT else 1
+        if failures >= MAX_START_FAILURES:
+            print(f"[VfxPipe] Tracking agent exited {failures} times in a row (code {returncode}), giving up")
+            return returncode
+        print(f"[VfxPipe] Tracking agent exited with code {returncode}, restarting")
+        time.sleep(RECONNECT_INTERVAL)
+
+
+# -----------------------------------------------------------------------------
+# Coordinator
+# -----------------------------------------------------------------------------
+
+class _Job:
+    """A submitted job and the client waiting for it."""
+
+    def __init__(self, msg: Dict[str, Any], client: protocol.Connection):
+        self.id = msg.get('id') or uuid.uuid4().hex
+        self.msg = dict(msg, type="job", id=self.id)
+        self.msg.pop('token', None)
+        self.node = msg.get('node')
+        self.client = client
+        self.state = "queued"
+        self.agent = None
+        self.attempts = 0
+        self.queued_at = time.time()
+        self.started_at = None
+
+
+class _Agent:
+    """A connected agent."""
+
+    def __init__(self, connection: protocol.Connection, hello: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:8]
+        self.name = str(hello.get('name') or connection.peer)
+        self.pid = hello.get('pid')
+        self.address = connection.peer
+        self.connection = connection
+        self.job = None
+        self.jobs = 0
+        self.rss = None
+        self.connected_at = time.time()
+        self.last_seen = self.connected_at
+
+
+class TrackingCoordinator:
+    """
+    Job queue handing tracking jobs to remote agents.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = DEFAULT_PORT, token: Optional[str] = None,
+                 heartbeat_timeout: float = HEARTBEAT_TIMEOUT, max_attempts: int = MAX_ATTEMPTS):
+        """
+        Initialize the coordinator and start listening.
+
+        Args:
+            host: Interface to listen on ("0.0.0.0" for all)
+            port: Port to listen on (0 = any free port)
+            token: Access token (default: VFXPIPE_TRACK_COORDINATOR_TOKEN, or a new one)
+            heartbeat_timeout: Seconds without a message after which an agent is dropped
+            max_attempts: Times a job is handed to an agent before it is failed
+        """
+        self.token = token or os.environ.get(TOKEN_ENV) or secrets.token_hex(16)
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max(1, max_attempts)
+
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen(64)
+        self.host, self.port = self._server.getsockname()[:2]
+
+        self._lock = threading.Lock()
+        self._queue = collections.deque()
+        self._jobs = {}
+        self._agents = {}
+        self._stopping = threading.Event()
+
+    @property
+    def address(self) -> str:
+        """Address clients on this host connect to."""
+        host = "127.0.0.1" if self.host in ("", "0.0.0.0") else self.host
+        return f"{host}:{self.port}"
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def serve_forever(self):
+        """Serve agents and clients until stop() is called."""
+        self._write_state()
+        logger.info("Tracking coordinator listening on %s:%d", self.host, self.port)
+
+        self._server.settimeout(0.5)
+        try:
+            while not self._stopping.is_set():
+                try:
+                    sock, _ = self._server.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                threading.Thread(target=self._handle, args=(protocol.Connection(sock),),
+                                 name="TrackCoordinatorConnection", daemon=True).start()
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        """Ask the server loop to exit."""
+        self._stopping.set()
+
+    def _shutdown(self):
+        self._stopping.set()
+        self._server.close()
+        if read_json(state_path(), default={}).get('port') == self.port:
+            try:
+                state_path().unlink()
+            except OSError:
+                pass
+
+        with self._lock:
+            jobs = list(self._jobs.values())
+            agents = list(self._agents.values())
+        for job in jobs:
+            self._finish(job, protocol.message("result", ok=False, error="Coordinator stopped"))
+        for agent in agents:
+            agent.connection.send(protocol.message("shutdown"))
+            agent.connection.close()
+        logger.info("Tracking coordinator stopped")
+
+    def _write_state(self):
+        path = state_path()
+        host, port = protocol.parse_address(self.address)
+        write_json_atomic(path, {'host': host, 'port': port, 'pid': os.getpid(),
+                                 'token': self.token, 'version': protocol.PROTOCOL_VERSION})
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+
+    def _handle(self, connection: protocol.Connection):
+        """Serve one connection; the first message tells agents from clients."""
+        with connection:
+            try:
+                msg = connection.receive(timeout=30)
+            except (socket.timeout, protocol.ProtocolError):
+                return
+            if msg is None:
+                return
+            if not protocol.token_matches(msg, self.token):
+                connection.send(protocol.message("error", error="Invalid token"))
+                return
+            if msg['type'] == "register":
+                self._serve_agent(connection, msg)
+                return
+            self._serve_client(connection, msg)
+
+    # -------------------------------------------------------------------------
+    # Agents
+    # -------------------------------------------------------------------------
+
+    def _serve_agent(self, connection: protocol.Connection, hello: Dict[str, Any]):
+        """Read an agent's heartbeats, progress and results until it is lost."""
+        if hello.get('version') != protocol.PROTOCOL_VERSION:
+            connection.send(protocol.message("error", error=f"Protocol version {protocol.PROTOCOL_VERSION} required"))
+            return
+        agent = _Agent(connection, hello)
+        with self._lock:
+            stopping = self._stopping.is_set()
+            if not stopping:
+                self._agents[agent.id] = agent
+        if stopping:
+            connection.send(protocol.message("shutdown"))
+            return
+        logger.info("Agent %s connected from %s (pid %s)", agent.name, agent.address, agent.pid)
+        self._dispatch()
+
+        # Runs until the agent goes away; on stop, _shutdown() tells the agent
+        # to exit and closes the connection, which ends the loop
+        reason = "disconnected"
+        try:
+            while True:
+                try:
+                    msg = connection.receive(timeout=self.heartbeat_timeout)
+                except socket.timeout:
+                    reason = f"no heartbeat for {self.heartbeat_timeout:.0f}s"
+                    break
+                if msg is None:
+                    break
+                agent.last_seen = time.time()
+                message_type = msg['type']
+                if message_type == "heartbeat":
+                    agent.rss = msg.get('rss', agent.rss)
+                elif message_type == "progress":
+                    self._progress(agent, msg)
+                elif message_type == "result":
+                    self._agent_result(agent, msg)
+        except protocol.ProtocolError as e:
+            reason = f"protocol error: {e}"
+        finally:
+            connection.close()
+            self._agent_lost(agent, reason)
+
+    def _dispatch(self):
+        """Hand queued jobs to idle agents."""
+        assigned = []
+        with self._lock:
+            idle = [agent for agent in self._agents.values() if agent.job is None]
+            while idle and self._queue:
+                job = self._queue.popleft()
+                if job.state != "queued":
+                    continue
+                agent = idle.pop(0)
+                job.state = "running"
+                job.agent = agent
+                job.attempts += 1
+                job.started_at = time.time()
+                agent.job = job
+                assigned.append((agent, job))
+
+        for agent, job in assigned:
+            logger.info("Job %s (%s) -> agent %s, attempt %d", job.id, job.node, agent.name, job.attempts)
+            if not agent.connection.send(job.msg):
+                # The agent's handler sees the closed connection and requeues the job
+                agent.connection.close()
+                continue
+            job.client.send(protocol.message("progress", id=job.id, node=job.node, agent=agent.name,
+                                             message=f"Started on {agent.name}", percentage=0))
+
+    def _progress(self, agent: _Agent, msg: Dict[str, Any]):
+        """Forward an agent's progress report to the job's client."""
+        job = agent.job
+        if job is not None and job.id == msg.get('id'):
+            job.client.send(dict(msg, agent=agent.name))
+
+    def _agent_result(self, agent: _Agent, msg: Dict[str, Any]):
+        with self._lock:
+            job = agent.job
+            if job is None or job.id != msg.get('id'):
+                return
+            agent.job = None
+            agent.jobs += 1
+            agent.rss = msg.get('rss', agent.rss)
+        self._finish(job, dict(msg, agent=agent.name))
+        self._dispatch()
+
+    def _agent_lost(self, agent: _Agent, reason: str):
+        """Drop an agent and requeue (or fail) the job it was running."""
+        with self._lock:
+            self._agents.pop(agent.id, None)
+            job, agent.job = agent.job, None
+            requeue = (job is not None and job.state == "running" and job.attempts < self.max_attempts
+                       and not self._stopping.is_set())
+            if requeue:
+                job.state = "queued"
+                job.agent = None
+                self._queue.appendleft(job)
+
+        if self._stopping.is_set():
+            return
+        logger.warning("Agent %s lost (%s)", agent.name, reason)
+        if job is None:
+            return
+        if requeue:
+            logger.warning("Requeued job %s (%s) from agent %s", job.id, job.node, agent.name)
+            job.client.send(protocol.message("progress", id=job.id, node=job.node, requeued=True,
+                                             message=f"Requeued: agent {agent.name} lost ({reason})"))
+            self._dispatch()
+        elif job.state == "cancelled":
+            self._finish(job, protocol.message("result", ok=False, error="Job cancelled"))
+        else:
+            self._finish(job, protocol.message(
+                "result", ok=False,
+                error=f"Agent {agent.name} lost ({reason}), gave up after {job.attempts} attempt(s)"
+            ))
+
+    # -------------------------------------------------------------------------
+    # Clients
+    # -------------------------------------------------------------------------
+
+    def _serve_client(self, connection: protocol.Connection, msg: Optional[Dict[str, Any]]):
+        submitted = []
+        try:
+            while msg is not None:
+                if not protocol.token_matches(msg, self.token):
+                    connection.send(protocol.message("error", error="Invalid token"))
+                    return
+                message_type = msg['type']
+                if message_type == "submit":
+                    if not msg.get('node') or not (msg.get('script') or msg.get('script_data')):
+                        connection.send(protocol.message("error", id=msg.get('id'),
+                                                         error="A job needs a node and a script"))
+                    else:
+                        job = _Job(msg, connection)
+                        with self._lock:
+                            self._jobs[job.id] = job
+                            self._queue.append(job)
+                        submitted.append(job)
+                        self._dispatch()
+                elif message_type == "cancel":
+                    self.cancel(msg.get('id'))
+                elif message_type == "status":
+                    connection.send(self.status())
+                elif message_type == "stop":
+                    connection.send(protocol.message("status", stopping=True))
+                    self.stop()
+                    return
+                else:
+                    connection.send(protocol.message("error", error=f"Unknown message type '{message_type}'"))
+                msg = connection.receive()
+        except protocol.ProtocolError as e:
+            connection.send(protocol.message("error", error=str(e)))
+        finally:
+            # Nobody is waiting for the results anymore
+            for job in submitted:
+                if job.state in ("queued", "running"):
+                    self.cancel(job.id)
+
+    def cancel(self, job_id: Optional[str]) -> bool:
+        """
+        Cancel a job. A running job stops at its agent's next tracking step.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            True if the job was queued or running
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state not in ("queued", "running"):
+                return False
+            was_running = job.state == "running"
+            job.state = "cancelled"
+            agent = job.agent
+
+        if was_running and agent is not None:
+            # The agent answers with the job's result once it stopped
+            logger.info("Cancelling job %s on agent %s", job_id, agent.name)
+            agent.connection.send(protocol.message("cancel", id=job_id))
+        else:
+            self._finish(job, protocol.message("result", ok=False, error="Job cancelled"))
+        return True
+
+    def _finish(self, job: _Job, result: Dict[str, Any]):
+        """Send a job's result to its client, once."""
+        with self._lock:
+            if self._jobs.pop(job.id, None) is None:
+                return
+            cancelled = job.state == "cancelled"
+            if not cancelled:
+                job.state = "done"
+        result = dict(result, type="result", id=job.id, node=job.node, attempts=job.attempts)
+        if cancelled:
+            result.update(ok=False, cancelled=True)
+        result['queue_wait'] = job.started_at - job.queued_at if job.started_at else None
+        job.client.send(result)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Build a status report.
+
+        Returns:
+            'status' message with the agents and the number of queued and running jobs
+        """
+        now = time.time()
+        with self._lock:
+            agents = [{
+                'name': agent.name,
+                'address': agent.address,
+                'pid': agent.pid,
+                'jobs': agent.jobs,
+                'rss': agent.rss,
+                'job': agent.job.id if agent.job else None,
+                'last_seen': round(now - agent.last_seen, 1),
+            } for agent in self._agents.values()]
+            queued = sum(1 for job in self._jobs.values() if job.state == "queued")
+            running = sum(1 for job in self._jobs.values() if job.state == "running")
+        return protocol.message("status", host=self.host, port=self.port, pid=os.getpid(),
+                                agents=agents, queued=queued, running=running)
+
+
+class LocalFarm:
+    """
+    Stand-in farm: a coordinator and agent processes on localhost.
+
+    Agents run in `nuke -t` by default. With a fanout.StandInLauncher they run
+    in this Python interpreter against the stand-in nuke module instead, so
+    jobs complete (with simulated solves) without a Nuke license.
+
+    Examples:
+        >>> with LocalFarm(agents=2) as client:
+        ...     result = client.run_job("shot.nk", "CameraTracker1")
+        >>> with LocalFarm(agents=2, launcher=StandInLauncher()) as client:
+        ...     result = client.run_job("shot.nk", "CameraTracker1")
+    """
+
+    def __init__(self, agents: int = 2, executable: Optional[str] = None, args: Optional[List[str]] = None,
+                 log_dir: Optional[Path] = None, heartbeat_timeout: float = HEARTBEAT_TIMEOUT,
+                 launcher=None):
+        """
+        Initialize the farm.
+
+        Args:
+            agents: Number of agent processes
+            executable: Agent executable (default: VFXPIPE_NUKE_EXECUTABLE or sys.executable)
+            args: Arguments before the agent script (default: ["-t"])
+            log_dir: Directory for agent output (default: <cache>/track_coordinator)
+            heartbeat_timeout: Seconds without a message after which an agent is dropped
+            launcher: fanout.SubprocessLauncher providing the agent executable,
+                      arguments and environment; overrides executable and args
+        """
+        self.agents = max(1, agents)
+        self.executable = executable
+        self.args = args
+        self.launcher = launcher
+        self.log_dir = Path(log_dir) if log_dir else get_cache_dir() / "track_coordinator"
+        self.heartbeat_timeout = heartbeat_timeout
+        self.coordinator = None
+        self.processes = []
+        self._thread = None
+
+    def start(self, timeout: float = 60) -> "CoordinatorClient":
+        """
+        Start the coordinator and the agents and wait for the agents to connect.
+
+        Args:
+            timeout: Seconds to wait for the agents
+
+        Returns:
+            Client of the coordinator
+        """
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.coordinator = TrackingCoordinator(host="127.0.0.1", port=0, token=secrets.token_hex(16),
+                                               heartbeat_timeout=self.heartbeat_timeout)
+        self._thread = threading.Thread(target=self.coordinator.serve_forever,
+                                        name="TrackCoordinator", daemon=True)
+        self._thread.start()
+
+        from VfxPipe.nuke.tracking.fanout import SubprocessLauncher
+        launcher = self.launcher or SubprocessLauncher(self.executable, self.args)
+        env = agent_environment(self.coordinator.token, launcher)
+        for index in range(self.agents):
+            command = agent_command(self.coordinator.address, f"local-{index}", launcher.executable, launcher.args)
+            with open(self.log_dir / f"agent-{index}.log", "ab") as log:
+                self.processes.append(subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT,
+                                                       stdin=subprocess.DEVNULL, env=env))
+
+        host, port = protocol.parse_address(self.coordinator.address)
+        client = CoordinatorClient(host, port, self.coordinator.token)
+        deadline = time.time() + timeout
+        while len(client.status()['agents']) < self.agents:
+            if time.time() > deadline or all(process.poll() is not None for process in self.processes):
+                self.stop()
+                raise RuntimeError(f"Tracking agents did not connect, see {self.log_dir}")
+            time.sleep(0.1)
+        return client
+
+    def stop(self):
+        """Stop the coordinator and the agents."""
+        if self.coordinator is not None:
+            self.coordinator.stop()
+            self._thread.join()
+        for process in self.processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self.processes = []
+
+    def __enter__(self) -> "CoordinatorClient":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+# -----------------------------------------------------------------------------
+# Client
+# -----------------------------------------------------------------------------
+
+class CoordinatorClient:
+    """
+    Submits jobs to a coordinator and streams back their progress.
+
+    Examples:
+        >>> client = CoordinatorClient.find()
+        >>> result = client.run_job(None, "CameraTracker1", script_data=open("shot.nk").read(),
+        ...                         on_progress=lambda msg: print(msg['message']))
+        >>> result['ok'], result['agent'], result['snippet']
+    """
+
+    def __init__(self, host: str, port: int, token: str):
+        self.host = host
+        self.port = port
+        self.token = token
+
+    @classmethod
+    def find(cls, timeout: float = 2.0) -> Optional["CoordinatorClient"]:
+        """
+        Find the coordinator from VFXPIPE_TRACK_COORDINATOR or the cache directory.
+
+        Args:
+            timeout: Seconds to wait for the coordinator to answer
+
+        Returns:
+            CoordinatorClient, or None if no coordinator answers
+        """
+        address = os.environ.get(ADDRESS_ENV)
+        if address:
+            try:
+                host, port = protocol.parse_address(address)
+            except ValueError:
+                logger.warning("Invalid %s: %s", ADDRESS_ENV, address)
+                return None
+            client = cls(host, port, os.environ.get(TOKEN_ENV, ""))
+        else:
+            state = read_json(state_path(), default=None)
+            if not isinstance(state, dict) or not state.get('port'):
+                return None
+            client = cls(state.get('host', "127.0.0.1"), state['port'], state.get('token', ""))
+        try:
+            client.status(timeout=timeout)
+        except (OSError, protocol.ProtocolError) as e:
+            if address:
+                logger.warning("Tracking coordinator at %s is not available: %s", address, e)
+            return None
+        return client
+
+    def _connect(self, timeout: Optional[float] = None) -> protocol.Connection:
+        return protocol.connect(self.host, self.port, timeout=timeout)
+
+    def _request(self, msg: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        with self._connect(timeout) as connection:
+            connection.send(dict(msg, token=self.token))
+            reply = connection.receive(timeout)
+        if reply is None:
+            raise protocol.ProtocolError("Coordinator closed the connection")
+        if reply['type'] == "error":
+            raise protocol.ProtocolError(reply.get('error'))
+        return reply
+
+    def status(self, timeout: Optional[float] = 10) -> Dict[str, Any]:
+        """Get the coordinator's status report."""
+        return self._request(protocol.message("status"), timeout)
+
+    def stop(self):
+        """Stop the coordinator; its agents are told to exit."""
+        self._request(protocol.message("stop"), timeout=10)
+
+    def cancel(self, job_id: str):
+        """Cancel a queued or running job."""
+        with self._connect(10) as connection:
+            connection.send(protocol.message("cancel", id=job_id, token=self.token))
+
+    def run_job(self, script: Optional[str], node: str, params: Optional[Dict[str, Any]] = None,
+                export: Optional[str] = None, job_id: Optional[str] = None,
+                script_data: Optional[str] = None,
+                on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run a job and wait for its result.
+
+        Args:
+            script: Nuke script path as seen from the agents (None with script_data)
+            node: CameraTracker to solve
+            params: Tracking parameters
+            export: Snippet path as seen from the agents; without it the
+                    snippet text is returned as the result's 'snippet'
+            job_id: Job ID, e.g. to cancel the job from another thread
+            script_data: Script text, shipped to the agent instead of a path
+            on_progress: Called with each 'progress' message (message,
+                         percentage, detail, agent, requeued)
+
+        Returns:
+            'result' message (ok, summary, error, agent, attempts, snippet, ...)
+        """
+        job_id = job_id or uuid.uuid4().hex
+        with self._connect(10) as connection:
+            connection.send(protocol.message(
+                "submit", id=job_id, token=self.token, script=str(script) if script else None,
+                script_data=script_data, node=node, params=params or {},
+                export=str(export) if export else None
+            ))
+            while True:
+                reply = connection.receive()
+                if reply is None:
+                    raise protocol.ProtocolError("Coordinator closed the connection")
+                if reply['type'] == "error":
+                    raise protocol.ProtocolError(reply.get('error'))
+                if reply.get('id') != job_id:
+                    continue
+                if reply['type'] == "progress":
+                    if on_progress is not None:
+                        on_progress(reply)
+                elif reply['type'] == "result":
+                    return reply
+
+
+class _CoordinatorJobProcess(JobProcess):
+    """Process-like handle of a coordinator job; ships the script and writes back the snippet."""
+
+    label = "coordinator job"
+    service = "Tracking coordinator"
+
+    def __init__(self, client: CoordinatorClient, task, on_progress=None):
+        self.on_progress = on_progress
+        super().__init__(client, task)
+
+    def _submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        result = self.client.run_job(None, self.task.node, params, job_id=self.job_id,
+                                     script_data=Path(self.task.script).read_text(encoding="utf-8"),
+                                     on_progress=self._progress)
+        if result.get('snippet') is not None:
+            Path(self.task.snippet).write_text(result['snippet'], encoding="utf-8")
+        if result.get('summary') is not None:
+            Path(self.task.summary).write_text(json.dumps(result['summary'], indent=2, default=str),
+                                               encoding="utf-8")
+        return result
+
+    def _progress(self, msg: Dict[str, Any]):
+        if self.on_progress is not None:
+            self.on_progress(self.task.node, msg)
+
+
+class CoordinatorLauncher:
+    """
+    FanOut launcher that runs tasks on the coordinator's agents.
+
+    Examples:
+        >>> FanOut(max_workers=8, launcher=CoordinatorLauncher(CoordinatorClient.find()))
+    """
+
+    def __init__(self, client: CoordinatorClient,
+                 on_progress: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        """
+        Initialize the launcher.
+
+        Args:
+            client: Coordinator client
+            on_progress: Called with (node, progress message) as agents report progress
+        """
+        self.client = client
+        self.on_progress = on_progress
+
+    def launch(self, task, work_dir: Path) -> _CoordinatorJobProcess:
+        """Submit a FanOut task to the coordinator."""
+        return _CoordinatorJobProcess(self.client, task, self.on_progress)
+
+
+# -----------------------------------------------------------------------------
+# Command line
+# -----------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the coordinator command line.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m VfxPipe.nuke.tracking.coordinator",
+                                     description="Spread tracking jobs across render nodes.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    serve = subparsers.add_parser("serve", help="Run the coordinator")
+    serve.add_argument("--host", default="0.0.0.0", help="Interface to listen on (default: all)")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    serve.add_argument("--token", help=f"Access token (default: {TOKEN_ENV}, or a new one)")
+    serve.add_argument("--heartbeat-timeout", type=float, default=HEARTBEAT_TIMEOUT,
+                       help="Drop agents silent for this many seconds")
+    serve.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS,
+                       help="Fail a job after this many lost agents")
+
+    local = subparsers.add_parser("local", help="Run a coordinator and agents on this host")
+    local.add_argument("--agents", type=int, default=2, help="Number of agents")
+    local.add_argument("--nuke", help="Nuke executable (default: VFXPIPE_NUKE_EXECUTABLE or this interpreter)")
+    local.add_argument("--nuke-args", default="-t",
+                       help="Arguments before the agent script (default: -t)")
+    local.add_argument("--stand-in", action="store_true",
+                       help="Run the agents in this interpreter against the stand-in nuke module "
+                            "(source checkout only, solves are simulated)")
+
+    agent = subparsers.add_parser("agent", help="Run jobs from a coordinator")
+    agent.add_argument("--connect", default=os.environ.get(ADDRESS_ENV),
+                       help=f"Coordinator address host:port (default: {ADDRESS_ENV})")
+    agent.add_argument("--token", help=f"Access token (default: {TOKEN_ENV})")
+    agent.add_argument("--name", help="Agent name (default: host name)")
+    agent.add_argument("--nuke", help="Run the agent in `NUKE -t`, restarting it when it exits")
+
+    submit = subparsers.add_parser("submit", help="Run a tracking job and print its result")
+    submit.add_argument("--script", required=True, help="Nuke script, sent to the agent")
+    submit.add_argument("--node", required=True, help="CameraTracker node")
+    submit.add_argument("--params", help="JSON file with tracking parameters")
+    submit.add_argument("--export", help="Write the solved tracker and camera to this .nk snippet")
+
+    subparsers.add_parser("status", help="Show the agents and queued jobs")
+    subparsers.add_parser("stop", help="Stop the coordinator and its agents")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "agent":
+        if not args.connect:
+            parser.error(f"--connect or {ADDRESS_ENV} is required")
+        if args.token:
+            os.environ[TOKEN_ENV] = args.token
+        if args.nuke:
+            command = agent_command(args.connect, args.name, args.nuke)
+            return supervise_agent(command, agent_environment(os.environ.get(TOKEN_ENV, "")))
+        host, port = protocol.parse_address(args.connect)
+        return run_agent(host, port, args.name)
+
+    if args.command == "serve":
+        coordinator = TrackingCoordinator(host=args.host, port=args.port, token=args.token,
+                                          heartbeat_timeout=args.heartbeat_timeout,
+                                          max_attempts=args.max_attempts)
+        if not (args.token or os.environ.get(TOKEN_ENV)):
+            print(f"[VfxPipe] Agents and sessions need {TOKEN_ENV}={coordinator.token}")
+        try:
+            coordinator.serve_forever()
+        except KeyboardInterrupt:
+            coordinator.stop()
+        return 0
+
+    if args.command == "local":
+        import shlex
+        launcher = None
+        if args.stand_in:
+            from VfxPipe.nuke.tracking.fanout import StandInLauncher
+            try:
+                launcher = StandInLauncher()
+            except FileNotFoundError as e:
+                print(f"[VfxPipe] {e}")
+                return 1
+        farm = LocalFarm(agents=args.agents, executable=args.nuke, args=shlex.split(args.nuke_args),
+                         launcher=launcher)
+        try:
+            farm.start()
+            print(f"[VfxPipe] Local tracking farm at {farm.coordinator.address} with {farm.agents} agent(s)")
+            while farm._thread.is_alive():
+                farm._thread.join(0.5)
+        except KeyboardInterrupt:
+            pass
+        except RuntimeError as e:
+            print(f"[VfxPipe] {e}")
+            return 1
+        finally:
+            farm.stop()
+        return 0
+
+    client = CoordinatorClient.find()
+    if client is None:
+        print("No tracking coordinator is running")
+        return 1
+
+    if args.command == "status":
+        print(json.dumps(client.status(), indent=2))
+    elif args.command == "stop":
+        client.stop()
+        print("Tracking coordinator stopping")
+    else:
+        params = {}
+        if args.params:
+            with open(args.params, "r", encoding="utf-8") as f:
+                params = json.load(f)
+        with open(args.script, "r", encoding="utf-8") as f:
+            script_data = f.read()
+
+        def report(msg):
+            percentage = msg.get('percentage')
+            prefix = f"{percentage:5.1f}% " if isinstance(percentage, (int, float)) else ""
+            print(f"{prefix}[{msg.get('agent', '-')}] {msg.get('message')}", file=sys.stderr)
+
+        result = client.run_job(None, args.node, params, script_data=script_data, on_progress=report)
+        snippet = result.pop('snippet', None)
+        if args.export and snippet is not None:
+            with open(args.export, "w", encoding="utf-8") as f:
+                f.write(snippet)
+        print(json.dumps(result, indent=2, default=str))
+        return 0 if result.get('ok') else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,724 @@
+"""
+Warm Tracking Worker Daemon
+
+Every headless Nuke launch pays for license checkout, plugin scanning and
+VfxPipe initialize() before it tracks anything; for short shots that costs
+more than trackFeatures itself. The daemon keeps a pool of initialized
+`nuke -t` worker processes and hands them tracking jobs (script, tracker
+node, params) received over a local socket, so a job only pays for opening
+the script and the tracking itself.
+
+Workers are recycled after a number of jobs, or when their memory (RSS)
+grows past a limit, and replaced when they exit. Cancelling a job that is
+already running kills its worker.
+
+    python -m VfxPipe.nuke.tracking.daemon serve --workers 4
+    python -m VfxPipe.nuke.tracking.daemon submit --script shot.nk --node CameraTracker1
+    python -m VfxPipe.nuke.tracking.daemon status
+    python -m VfxPipe.nuke.tracking.daemon stop
+    # same without Nuke: workers run in Python against the stand-in nuke module
+    python -m VfxPipe.nuke.tracking.daemon serve --workers 2 --stand-in
+
+The server listens on localhost only. Its address and an access token are
+written to track_daemon.json in the VfxPipe cache directory (readable by the
+owner only), which is how clients find it. While a daemon is running,
+parallel Auto Track runs use it instead of starting new Nuke processes.
+
+Environment variables:
+    VFXPIPE_NUKE_EXECUTABLE: Nuke executable for the workers (default: sys.executable)
+"""
+
+import os
+import queue
+import secrets
+import socket
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from VfxPipe.nuke.tracking import protocol
+from VfxPipe.nuke.tracking.jobs import JobProcess, execute_job
+from VfxPipe.utils.cache import get_cache_dir, read_json, write_json_atomic
+from VfxPipe.utils.logger import getLogger
+
+logger = getLogger("TrackingDaemon")
+
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_JOBS = 20
+DEFAULT_MAX_RSS_MB = 8192
+
+# A worker that exits this many times in a row without registering is not
+# restarted again (bad license, broken install, ...)
+MAX_START_FAILURES = 3
+
+# Seconds between checks of the worker processes
+MONITOR_INTERVAL = 1.0
+
+# Runs this module's worker command inside `nuke -t`
+WORKER_BOOTSTRAP = (
+    "import runpy\n"
+    "runpy.run_module('VfxPipe.nuke.tracking.daemon', run_name='__main__')\n"
+)
+
+
+def state_path() -> Path:
+    """Path of the file advertising the running daemon."""
+    return get_cache_dir() / "track_daemon.json"
+
+
+def run_worker(host: str, port: int, token: str, slot: int) -> int:
+    """
+    Worker loop: register with the daemon, then run jobs until told to stop.
+
+    Args:
+        host: Daemon host
+        port: Daemon port
+        token: Access token of the daemon
+        slot: Worker slot assigned by the daemon
+
+    Returns:
+        Process exit code
+    """
+    try:
+        connection = protocol.connect(host, port, timeout=10)
+    except OSError as e:
+        print(f"[VfxPipe] Tracking worker could not reach the daemon at {host}:{port}: {e}")
+        return 1
+
+    with connection:
+        connection.send(protocol.message("register", token=token, slot=slot, pid=os.getpid(),
+                                         version=protocol.PROTOCOL_VERSION))
+        while True:
+            msg = connection.receive()
+            if msg is None or msg['type'] == "shutdown":
+                return 0
+            if msg['type'] == "job":
+                connection.send(execute_job(msg))
+    return 0
+
+
+class _Job:
+    """A submitted job and the client waiting for it."""
+
+    def __init__(self, msg: Dict[str, Any], client: protocol.Connection):
+        self.id = msg.get('id') or uuid.uuid4().hex
+        self.msg = dict(msg, type="job", id=self.id)
+        self.client = client
+        self.state = "queued"
+        self.worker = None
+        self.attempts = 0
+        self.queued_at = time.time()
+        self.started_at = None
+
+
+class _Worker:
+    """A worker slot and its current process."""
+
+    def __init__(self, slot: int):
+        self.slot = slot
+        self.process = None
+        self.pid = None
+        self.connected = False
+        self.jobs = 0
+        self.rss = None
+        self.job = None
+        self.start_failures = 0
+        self.started_at = None
+
+
+class TrackingDaemon:
+    """
+    Pool of warm tracking workers behind a local socket server.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_jobs: int = DEFAULT_MAX_JOBS,
+                 max_rss_mb: int = DEFAULT_MAX_RSS_MB, port: int = 0,
+                 executable: Optional[str] = None, args: Optional[List[str]] = None,
+                 log_dir: Optional[Path] = None, launcher=None):
+        """
+        Initialize the daemon.
+
+        Args:
+            workers: Number of worker processes
+            max_jobs: Jobs after which a worker is recycled (0 = never)
+            max_rss_mb: Memory after which a worker is recycled (0 = no limit)
+            port: Port to listen on (0 = any free port)
+            executable: Worker executable (default: VFXPIPE_NUKE_EXECUTABLE or sys.executable)
+            args: Arguments before the worker script (default: ["-t"])
+            log_dir: Directory for worker output (default: <cache>/track_daemon)
+            launcher: fanout.SubprocessLauncher providing the worker executable,
+                      arguments and environment; overrides executable and args
+        """
+        self.max_jobs = max_jobs
+        self.max_rss = max_rss_mb * 1024 * 1024
+        self.executable = executable or os.environ.get("VFXPIPE_NUKE_EXECUTABLE") or sys.executable
+        self.args = list(args) if args is not None else ["-t"]
+        self.launcher = launcher
+        self.log_dir = Path(log_dir) if log_dir else get_cache_dir() / "track_daemon"
+        self.token = secrets.token_hex(16)
+
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", port))
+        self.host, self.port = self._server.getsockname()[:2]
+
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._jobs = {}
+        self._workers = [_Worker(slot) for slot in range(max(1, workers))]
+        self._stopping = threading.Event()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def serve_forever(self):
+        """Start the workers and serve clients until stop() is called."""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._server.listen(64)
+        self._write_state()
+        logger.info("Tracking daemon listening on %s:%d with %d worker(s)",
+                    self.host, self.port, len(self._workers))
+
+        for worker in self._workers:
+            self._start_worker(worker)
+        threading.Thread(target=self._monitor, name="TrackDaemonMonitor", daemon=True).start()
+
+        self._server.settimeout(0.5)
+        try:
+            while not self._stopping.is_set():
+                try:
+                    sock, _ = self._server.accept()
+                except socket.timeout:
+                    continue
+                except OSError:
+                    break
+                threading.Thread(target=self._handle, args=(protocol.Connection(sock),),
+                                 name="TrackDaemonConnection", daemon=True).start()
+        finally:
+            self._shutdown()
+
+    def stop(self):
+        """Ask the server loop to exit."""
+        self._stopping.set()
+
+    def _shutdown(self):
+        self._stopping.set()
+        self._server.close()
+        if read_json(state_path(), default={}).get('port') == self.port:
+            try:
+                state_path().unlink()
+            except OSError:
+                pass
+
+        # Answer queued jobs, then stop the workers
+        self._fail_queued("Daemon stopped")
+        for worker in self._workers:
+            process = worker.process
+            if process is not None and process.poll() is None:
+                process.terminate()
+        for worker in self._workers:
+            if worker.process is not None:
+                try:
+                    worker.process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    worker.process.kill()
+        logger.info("Tracking daemon stopped")
+
+    def _write_state(self):
+        path = state_path()
+        write_json_atomic(path, {'host': self.host, 'port': self.port, 'pid': os.getpid(),
+                                 'token': self.token, 'version': protocol.PROTOCOL_VERSION})
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def _start_worker(self, worker: _Worker):
+        """Launch the process of a worker slot."""
+        script = self.log_dir / "track_worker.py"
+        if not script.exists():
+            script.write_text(WORKER_BOOTSTRAP, encoding="utf-8")
+
+        from VfxPipe.nuke.tracking.fanout import SubprocessLauncher
+        launcher = self.launcher or SubprocessLauncher(self.executable, self.args)
+        env = launcher.environment()
+        command = [launcher.executable] + launcher.args + [
+            str(script), "worker", "--connect", f"{self.host}:{self.port}",
+            "--token", self.token, "--slot", str(worker.slot)
+        ]
+        with open(self.log_dir / f"worker-{worker.slot}.log", "ab") as log:
+            worker.process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT,
+                                              stdin=subprocess.DEVNULL, env=env)
+        worker.pid = worker.process.pid
+        worker.connected = False
+        worker.jobs = 0
+        worker.rss = None
+        worker.started_at = time.time()
+        logger.debug("Started worker %d (pid %d)", worker.slot, worker.pid)
+
+    def _monitor(self):
+        """Replace worker processes that exited."""
+        while not self._stopping.wait(MONITOR_INTERVAL):
+            for worker in self._workers:
+                process = worker.process
+                if process is None or process.poll() is None:
+                    continue
+                with self._lock:
+                    if worker.connected:
+                        # The connection handler restarts it once the job is settled
+                        continue
+                    worker.start_failures += 1
+                    worker.process = None
+                if worker.start_failures >= MAX_START_FAILURES:
+                    logger.error("Worker %d failed to start %d times, giving up (see %s)",
+                                 worker.slot, worker.start_failures, self.log_dir)
+                    continue
+                logger.warning("Worker %d exited before registering (code %s), restarting",
+                               worker.slot, process.returncode)
+                self._start_worker(worker)
+
+            if all(worker.process is None for worker in self._workers):
+                self._fail_queued("No tracking worker could be started")
+
+    def _fail_queued(self, error: str):
+        """Answer every queued job with an error."""
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if job.state == "queued":
+                self._finish(job, protocol.message("result", id=job.id, ok=False, error=error))
+
+    def _serve_worker(self, connection: protocol.Connection, hello: Dict[str, Any]):
+        """Feed jobs to a registered worker until it is recycled or dies."""
+        slot = hello.get('slot')
+        valid_slot = isinstance(slot, int) and 0 <= slot < len(self._workers)
+        if not protocol.token_matches(hello, self.token) or not valid_slot:
+            connection.send(protocol.message("error", error="Invalid registration"))
+            return
+        worker = self._workers[slot]
+        with self._lock:
+            worker.connected = True
+            worker.start_failures = 0
+        logger.info("Worker %d ready (pid %s) after %.1fs", slot, hello.get('pid'),
+                    time.time() - (worker.started_at or time.time()))
+
+        recycle_reason = None
+        try:
+            while not self._stopping.is_set():
+                try:
+                    job = self._queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                if worker.process is None or worker.process.poll() is not None:
+                    # Died while idle; leave the job to the other workers
+                    self._queue.put(job)
+                    recycle_reason = "worker exited"
+                    return
+                with self._lock:
+                    if job.state != "queued":
+                        continue
+                    job.state = "running"
+                    job.worker = worker
+                    job.attempts += 1
+                    job.started_at = time.time()
+                    worker.job = job
+
+                connection.send(job.msg)
+                reply = connection.receive()
+                with self._lock:
+                    worker.job = None
+                if reply is None:
+                    self._job_lost(job)
+                    recycle_reason = "cancelled job" if job.state == "cancelled" else "worker died"
+                    return
+
+                worker.jobs += 1
+                worker.rss = reply.get('rss')
+                self._finish(job, reply)
+
+                if self.max_jobs and worker.jobs >= self.max_jobs:
+                    recycle_reason = f"{worker.jobs} jobs"
+                elif self.max_rss and worker.rss and worker.rss > self.max_rss:
+                    recycle_reason = f"RSS {worker.rss / (1024 * 1024):.0f} MB"
+                if recycle_reason:
+                    connection.send(protocol.message("shutdown"))
+                    return
+        except protocol.ProtocolError as e:
+            recycle_reason = f"protocol error: {e}"
+        finally:
+            # Stays marked connected until replaced, so the monitor leaves it alone
+            self._retire(worker, recycle_reason)
+
+    def _job_lost(self, job: _Job):
+        """Handle a job whose worker died: cancelled, retried once, or failed."""
+        with self._lock:
+            cancelled = job.state == "cancelled"
+            retry = not cancelled and job.attempts < 2 and not self._stopping.is_set()
+            if retry:
+                job.state = "queued"
+                job.worker = None
+        if retry:
+            logger.warning("Worker died running job %s, retrying it", job.id)
+            self._queue.put(job)
+            return
+        self._finish(job, protocol.message(
+            "result", id=job.id, ok=False, cancelled=cancelled,
+            error="Job cancelled" if cancelled else "Worker process died"
+        ))
+
+    def _retire(self, worker: _Worker, reason: Optional[str]):
+        """Wait for a worker process to exit and start a replacement."""
+        process = worker.process
+        if process is not None:
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        if self._stopping.is_set():
+            worker.connected = False
+            return
+        logger.info("Recycling worker %d (%s)", worker.slot, reason or "disconnected")
+        self._start_worker(worker)
+
+    # -------------------------------------------------------------------------
+    # Clients
+    # -------------------------------------------------------------------------
+
+    def _handle(self, connection: protocol.Connection):
+        """Serve one connection; the first message tells workers from clients."""
+        with connection:
+            try:
+                msg = connection.receive(timeout=30)
+            except (socket.timeout, protocol.ProtocolError):
+                return
+            if msg is None:
+                return
+            if msg['type'] == "register":
+                self._serve_worker(connection, msg)
+                return
+            self._serve_client(connection, msg)
+
+    def _serve_client(self, connection: protocol.Connection, msg: Optional[Dict[str, Any]]):
+        submitted = []
+        try:
+            while msg is not None:
+                if not protocol.token_matches(msg, self.token):
+                    connection.send(protocol.message("error", error="Invalid token"))
+                    return
+                message_type = msg['type']
+                if message_type == "submit":
+                    job = _Job(msg, connection)
+                    with self._lock:
+                        self._jobs[job.id] = job
+                    submitted.append(job)
+                    self._queue.put(job)
+                elif message_type == "cancel":
+                    self.cancel(msg.get('id'))
+                elif message_type == "status":
+                    connection.send(self.status())
+                elif message_type == "stop":
+                    connection.send(protocol.message("status", stopping=True))
+                    self.stop()
+                    return
+                else:
+                    connection.send(protocol.message("error", error=f"Unknown message type '{message_type}'"))
+                msg = connection.receive()
+        except protocol.ProtocolError as e:
+            connection.send(protocol.message("error", error=str(e)))
+        finally:
+            # Nobody is waiting for the results anymore
+            for job in submitted:
+                if job.state in ("queued", "running"):
+                    self.cancel(job.id)
+
+    def cancel(self, job_id: Optional[str]) -> bool:
+        """
+        Cancel a job. A running job is stopped by killing its worker.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            True if the job was queued or running
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.state not in ("queued", "running"):
+                return False
+            was_running = job.state == "running"
+            job.state = "cancelled"
+            worker = job.worker
+
+        if was_running and worker is not None and worker.process is not None:
+            # The worker connection sees the process die and answers the client
+            logger.info("Cancelling running job %s, killing worker %d", job_id, worker.slot)
+            worker.process.kill()
+        else:
+            self._finish(job, protocol.message("result", id=job.id, ok=False, cancelled=True,
+                                               error="Job cancelled"))
+        return True
+
+    def _finish(self, job: _Job, result: Dict[str, Any]):
+        """Send a job's result to its client."""
+        with self._lock:
+            if job.state != "cancelled":
+                job.state = "done"
+            self._jobs.pop(job.id, None)
+        result = dict(result, id=job.id)
+        result['queue_wait'] = job.started_at - job.queued_at if job.started_at else None
+        job.client.send(result)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Build a status report.
+
+        Returns:
+            'status' message with the workers and the number of queued jobs
+        """
+        with self._lock:
+            workers = [{
+                'slot': worker.slot,
+                'pid': worker.pid,
+                'ready': worker.connected,
+                'jobs': worker.jobs,
+                'rss': worker.rss,
+                'job': worker.job.id if worker.job else None,
+            } for worker in self._workers]
+            queued = sum(1 for job in self._jobs.values() if job.state == "queued")
+        return protocol.message("status", host=self.host, port=self.port, pid=os.getpid(),
+                                workers=workers, queued=queued)
+
+
+# -----------------------------------------------------------------------------
+# Client
+# -----------------------------------------------------------------------------
+
+class DaemonClient:
+    """
+    Submits jobs to a running daemon.
+
+    Examples:
+        >>> client = DaemonClient.find()
+        >>> result = client.run_job("shot.nk", "CameraTracker1", {"max_iter": 10})
+        >>> result['ok'], result['summary']['nodes'][0]['final_rmse']
+    """
+
+    def __init__(self, host: str, port: int, token: str):
+        self.host = host
+        self.port = port
+        self.token = token
+
+    @classmethod
+    def find(cls, timeout: float = 0.5) -> Optional["DaemonClient"]:
+        """
+        Find the daemon advertised in the cache directory.
+
+        Args:
+            timeout: Seconds to wait for the daemon to answer
+
+        Returns:
+            DaemonClient, or None if no daemon is running
+        """
+        state = read_json(state_path(), default=None)
+        if not isinstance(state, dict) or not state.get('port'):
+            return None
+        client = cls(state.get('host', "127.0.0.1"), state['port'], state.get('token', ""))
+        try:
+            client.status(timeout=timeout)
+        except (OSError, protocol.ProtocolError):
+            return None
+        return client
+
+    def _connect(self, timeout: Optional[float] = None) -> protocol.Connection:
+        return protocol.connect(self.host, self.port, timeout=timeout)
+
+    def _request(self, msg: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        with self._connect(timeout) as connection:
+            connection.send(dict(msg, token=self.token))
+            reply = connection.receive(timeout)
+        if reply is None:
+            raise protocol.ProtocolError("Daemon closed the connection")
+        if reply['type'] == "error":
+            raise protocol.ProtocolError(reply.get('error'))
+        return reply
+
+    def status(self, timeout: Optional[float] = 10) -> Dict[str, Any]:
+        """Get the daemon's status report."""
+        return self._request(protocol.message("status"), timeout)
+
+    def stop(self):
+        """Stop the daemon and its workers."""
+        self._request(protocol.message("stop"), timeout=10)
+
+    def cancel(self, job_id: str):
+        """Cancel a queued or running job."""
+        with self._connect(10) as connection:
+            connection.send(protocol.message("cancel", id=job_id, token=self.token))
+
+    def run_job(self, script: str, node: str, params: Optional[Dict[str, Any]] = None,
+                export: Optional[str] = None, summary: Optional[str] = None,
+                job_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run a job and wait for its result.
+
+        Args:
+            script: Nuke script to open
+            node: CameraTracker to solve
+            params: Tracking parameters
+            export: Write the solved tracker and camera to this .nk snippet
+            summary: Write the batch result summary JSON here
+            job_id: Job ID, e.g. to cancel the job from another thread
+
+        Returns:
+            'result' message (ok, summary, error, duration, rss)
+        """
+        job_id = job_id or uuid.uuid4().hex
+        with self._connect(10) as connection:
+            connection.send(protocol.message(
+                "submit", id=job_id, token=self.token, script=str(script), node=node,
+                params=params or {}, export=str(export) if export else None,
+                summary=str(summary) if summary else None
+            ))
+            while True:
+                reply = connection.receive()
+                if reply is None:
+                    raise protocol.ProtocolError("Daemon closed the connection")
+                if reply['type'] == "error":
+                    raise protocol.ProtocolError(reply.get('error'))
+                if reply['type'] == "result" and reply.get('id') == job_id:
+                    return reply
+
+
+class DaemonJobProcess(JobProcess):
+    """Process-like handle of a daemon job."""
+
+    label = "daemon job"
+    service = "Tracking daemon"
+
+
+class DaemonLauncher:
+    """
+    FanOut launcher that runs tasks on the warm daemon workers.
+
+    Examples:
+        >>> FanOut(max_workers=4, launcher=DaemonLauncher(DaemonClient.find()))
+    """
+
+    def __init__(self, client: DaemonClient):
+        self.client = client
+
+    def launch(self, task, work_dir: Path) -> DaemonJobProcess:
+        """Submit a FanOut task to the daemon."""
+        return DaemonJobProcess(self.client, task)
+
+
+# -----------------------------------------------------------------------------
+# Command line
+# -----------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the daemon command line.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog="python -m VfxPipe.nuke.tracking.daemon",
+                                     description="Warm pool of headless Nuke tracking workers.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    serve = subparsers.add_parser("serve", help="Start the daemon and its workers")
+    serve.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of worker processes")
+    serve.add_argument("--max-jobs", type=int, default=DEFAULT_MAX_JOBS,
+                       help="Recycle a worker after this many jobs (0 = never)")
+    serve.add_argument("--max-rss-mb", type=int, default=DEFAULT_MAX_RSS_MB,
+                       help="Recycle a worker whose memory exceeds this (0 = no limit)")
+    serve.add_argument("--port", type=int, default=0, help="Port on localhost (default: any free port)")
+    serve.add_argument("--nuke", help="Nuke executable (default: VFXPIPE_NUKE_EXECUTABLE or this interpreter)")
+    serve.add_argument("--stand-in", action="store_true",
+                       help="Run the workers in this interpreter against the stand-in nuke module "
+                            "(source checkout only, solves are simulated)")
+
+    submit = subparsers.add_parser("submit", help="Run a tracking job and print its result")
+    submit.add_argument("--script", required=True, help="Nuke script")
+    submit.add_argument("--node", required=True, help="CameraTracker node")
+    submit.add_argument("--params", help="JSON file with tracking parameters")
+    submit.add_argument("--export", help="Write the solved tracker and camera to this .nk snippet")
+
+    subparsers.add_parser("status", help="Show the workers and queued jobs")
+    subparsers.add_parser("stop", help="Stop the daemon")
+
+    worker = subparsers.add_parser("worker", help=argparse.SUPPRESS)
+    worker.add_argument("--connect", required=True)
+    worker.add_argument("--token", required=True)
+    worker.add_argument("--slot", type=int, required=True)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "worker":
+        host, port = protocol.parse_address(args.connect)
+        return run_worker(host, port, args.token, args.slot)
+
+    if args.command == "serve":
+        if DaemonClient.find() is not None:
+            print("A tracking daemon is already running")
+            return 1
+        launcher = None
+        if args.stand_in:
+            from VfxPipe.nuke.tracking.fanout import StandInLauncher
+            try:
+                launcher = StandInLauncher()
+            except FileNotFoundError as e:
+                print(f"[VfxPipe] {e}")
+                return 1
+        daemon = TrackingDaemon(workers=args.workers, max_jobs=args.max_jobs, max_rss_mb=args.max_rss_mb,
+                                port=args.port, executable=args.nuke, launcher=launcher)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            daemon.stop()
+        return 0
+
+    client = DaemonClient.find()
+    if client is None:
+        print("No tracking daemon is running")
+        return 1
+
+    if args.command == "status":
+        print(json.dumps(client.status(), indent=2))
+    elif args.command == "stop":
+        client.stop()
+        print("Tracking daemon stopping")
+    else:
+        params = {}
+        if args.params:
+            with open(args.params, "r", encoding="utf-8") as f:
+                params = json.load(f)
+        result = client.run_job(os.path.abspath(args.script), args.node, params,
+                                export=os.path.abspath(args.export) if args.export else None)
+        print(json.dumps(result, indent=2, default=str))
+        return 0 if result.get('ok') else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,420 @@
+"""
+Parallel Auto Track Fan-Out
+
+Runs CameraTracker nodes in parallel, one headless Nuke process per tracker,
+instead of one after another inside the GUI session. The live script is
+snapshotted once; every task runs the Auto Track command line entry point
+(python -m VfxPipe.nuke.tools.auto_track) on the snapshot for a single node
+and exports the solved tracker and its camera as a .nk snippet. Results are
+yielded as tasks complete so the caller can merge each snippet into the live
+script right away (see merge.merge_snippet()).
+
+Processes are started by a launcher. SubprocessLauncher runs `nuke -t` by
+default; pass another executable and arguments to substitute a different
+worker. StandInLauncher runs the workers in this Python interpreter against
+the stand-in nuke module of a source checkout (benchmarks/stubs), whose
+solves are simulated, so the fan-out runs end to end without a Nuke license,
+e.g. in tests:
+
+    fan_out = FanOut(max_workers=2, launcher=StandInLauncher())
+
+Environment variables:
+    VFXPIPE_NUKE_EXECUTABLE: Nuke executable for workers (default: sys.executable,
+                             which is the Nuke binary inside Nuke)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from VfxPipe.utils.logger import getLogger
+
+logger = getLogger("TrackingFanOut")
+
+# Seconds between cancellation checks while waiting for workers
+POLL_INTERVAL = 0.25
+
+# Lines of a failed worker's output kept for the error report
+LOG_TAIL_LINES = 20
+
+# Runs the Auto Track command line inside the worker process. A bootstrap
+# script also works when VfxPipe is imported from a deployment bundle.
+WORKER_BOOTSTRAP = (
+    "import runpy\n"
+    "runpy.run_module('VfxPipe.nuke.tools.auto_track', run_name='__main__')\n"
+)
+
+
+class TrackTask:
+    """
+    One CameraTracker to solve in a worker process.
+
+    Attributes:
+        node: CameraTracker node name
+        script: Script snapshot the worker opens
+        params: Params JSON file shared by all tasks
+        snippet: Where the worker writes the solved tracker and camera
+        summary: Where the worker writes its JSON result summary
+        log: Where the worker's console output goes
+    """
+
+    def __init__(self, node: str, script: Path, params: Path, work_dir: Path):
+        self.node = node
+        self.script = script
+        self.params = params
+        self.snippet = work_dir / f"{node}.nk"
+        self.summary = work_dir / f"{node}.json"
+        self.log = work_dir / f"{node}.log"
+
+    def cli_args(self) -> List[str]:
+        """Arguments of the Auto Track command line for this task."""
+        return [
+            "--script", str(self.script),
+            "--nodes", self.node,
+            "--params", str(self.params),
+            "--no-save",
+            "--export", str(self.snippet),
+            "--summary", str(self.summary),
+        ]
+
+    def __repr__(self):
+        return f"TrackTask({self.node!r})"
+
+
+class TrackResult:
+    """
+    Outcome of a TrackTask.
+
+    Attributes:
+        task: The task
+        returncode: Worker exit code (None if the worker never ran)
+        summary: The node's entry of the worker's result summary, if any
+        duration: Seconds from launch to exit
+        error: Error message when the task failed
+        cancelled: True if the task was cancelled
+    """
+
+    def __init__(self, task: TrackTask, returncode: Optional[int] = None,
+                 summary: Optional[Dict[str, Any]] = None, duration: float = 0.0,
+                 error: Optional[str] = None, cancelled: bool = False):
+        self.task = task
+        self.returncode = returncode
+        self.summary = summary
+        self.duration = duration
+        self.error = error
+        self.cancelled = cancelled
+
+    @property
+    def node(self) -> str:
+        return self.task.node
+
+    @property
+    def ok(self) -> bool:
+        """True if the worker solved the node and wrote its snippet."""
+        return (not self.error and not self.cancelled and self.returncode == 0
+                and (self.summary or {}).get('status') == "done" and self.task.snippet.is_file())
+
+    def __repr__(self):
+        return f"TrackResult({self.node!r}, ok={self.ok})"
+
+
+def _package_root() -> Path:
+    """Directory (or bundle archive) VfxPipe is imported from."""
+    import VfxPipe
+    return Path(VfxPipe.__file__).resolve().parent.parent
+
+
+class SubprocessLauncher:
+    """
+    Starts tracking tasks as subprocesses.
+
+    The command is executable + args + script + the task's command line
+    arguments. script defaults to a bootstrap running the Auto Track entry
+    point, written to the work directory.
+    """
+
+    def __init__(self, executable: Optional[str] = None, args: Optional[List[str]] = None,
+                 script: Optional[str] = None, env: Optional[Dict[str, str]] = None):
+        """
+        Initialize the launcher.
+
+        Args:
+            executable: Program to run (default: VFXPIPE_NUKE_EXECUTABLE or sys.executable)
+            args: Arguments before the script (default: ["-t"], Nuke terminal mode)
+            script: Worker script (default: the Auto Track bootstrap)
+            env: Extra environment variables for the workers
+        """
+        self.executable = executable or os.environ.get("VFXPIPE_NUKE_EXECUTABLE") or sys.executable
+        self.args = list(args) if args is not None else ["-t"]
+        self.script = script
+        self.env = dict(env or {})
+
+    def command(self, task: TrackTask, work_dir: Path) -> List[str]:
+        """
+        Build the command line of a task.
+
+        Args:
+            task: Task to run
+            work_dir: Work directory of the fan-out
+
+        Returns:
+            Command as a list of arguments
+        """
+        script = self.script
+        if script is None:
+            script = work_dir / "track_worker.py"
+            if not script.exists():
+                script.write_text(WORKER_BOOTSTRAP, encoding="utf-8")
+        return [self.executable] + self.args + [str(script)] + task.cli_args()
+
+    def environment(self) -> Dict[str, str]:
+        """
+        Build the worker environment.
+
+        Workers run headless, share the run ID of this session for the run
+        logs, and import the same VfxPipe as this process.
+        """
+        from VfxPipe.utils import runlog
+
+        env = dict(os.environ)
+        env['VFXPIPE_HEADLESS'] = "1"
+        env['VFXPIPE_RUN_ID'] = runlog.get_run_id()
+        python_path = [str(_package_root())]
+        if env.get('PYTHONPATH'):
+            python_path.append(env['PYTHONPATH'])
+        env['PYTHONPATH'] = os.pathsep.join(python_path)
+        env.update(self.env)
+        return env
+
+    def launch(self, task: TrackTask, work_dir: Path) -> subprocess.Popen:
+        """
+        Start the worker process of a task.
+
+        Args:
+            task: Task to run
+            work_dir: Work directory of the fan-out
+
+        Returns:
+            The started process, with its output going to task.log
+        """
+        with open(task.log, "wb") as log:
+            return subprocess.Popen(
+                self.command(task, work_dir),
+                stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                env=self.environment(), cwd=str(work_dir)
+            )
+
+
+def stand_in_modules() -> Path:
+    """Directory of the stand-in nuke module in a VfxPipe source checkout."""
+    return _package_root() / "benchmarks" / "stubs"
+
+
+class StandInLauncher(SubprocessLauncher):
+    """
+    Starts tracking tasks in this Python interpreter instead of Nuke.
+
+    Workers import the stand-in nuke module from stand_in_modules(), which
+    simulates CameraTracker solves. Only available in a source checkout.
+    """
+
+    def __init__(self, script: Optional[str] = None, env: Optional[Dict[str, str]] = None):
+        """
+        Initialize the launcher.
+
+        Args:
+            script: Worker script (default: the Auto Track bootstrap)
+            env: Extra environment variables for the workers
+
+        Raises:
+            FileNotFoundError: If the stand-in modules are missing
+        """
+        stubs = stand_in_modules()
+        if not (stubs / "nuke.py").is_file():
+            raise FileNotFoundError(f"Stand-in nuke module not found in {stubs}")
+        super().__init__(executable=sys.executable, args=[], script=script, env=env)
+
+    def environment(self) -> Dict[str, str]:
+        """Build the worker environment with the stand-in modules first on the path."""
+        env = super().environment()
+        env['PYTHONPATH'] = os.pathsep.join([str(stand_in_modules()), env['PYTHONPATH']])
+        return env
+
+
+def snapshot_script(path: Path) -> Path:
+    """
+    Get a script file with the current state of the live script. Main thread only.
+
+    A saved, unmodified script is used as is. Otherwise the root settings and
+    all top-level nodes are written to path, leaving the live script's name
+    and selection untouched.
+
+    Args:
+        path: Snapshot file to write if needed
+
+    Returns:
+        Script the workers should open
+    """
+    import nuke
+
+    root = nuke.root()
+    script_name = root.name()
+    if script_name and script_name != "Root" and not root.modified() and os.path.isfile(script_name):
+        return Path(script_name)
+
+    path = Path(path)
+    nodes_path = path.with_suffix(".nodes.nk")
+    with root:
+        selected = nuke.selectedNodes()
+        for node in nuke.allNodes():
+            node['selected'].setValue(True)
+        try:
+            nuke.nodeCopy(str(nodes_path))
+        finally:
+            for node in nuke.allNodes():
+                node['selected'].setValue(node in selected)
+
+    root_knobs = root.writeKnobs(nuke.WRITE_NON_DEFAULT_ONLY | nuke.TO_SCRIPT)
+    nodes_text = nodes_path.read_text(encoding="utf-8")
+    path.write_text(f"Root {{\n inputs 0\n{root_knobs}\n}}\n{nodes_text}", encoding="utf-8")
+    nodes_path.unlink()
+    return path
+
+
+def _log_tail(path: Path, lines: int = LOG_TAIL_LINES) -> str:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return ""
+
+
+class FanOut:
+    """
+    Bounded pool of worker processes solving one CameraTracker each.
+
+    Examples:
+        >>> fan_out = FanOut(max_workers=4)
+        >>> for result in fan_out.run(script, ["CameraTracker1", "CameraTracker2"], params):
+        ...     print(result.node, result.ok)
+    """
+
+    def __init__(self, max_workers: int = 2, launcher: Optional[SubprocessLauncher] = None,
+                 work_dir: Optional[Path] = None, keep_files: bool = False):
+        """
+        Initialize the fan-out.
+
+        Args:
+            max_workers: Maximum number of concurrent worker processes
+            launcher: Starts the workers (default: SubprocessLauncher())
+            work_dir: Directory for snapshots, snippets and logs (default: a new
+                      temporary directory)
+            keep_files: Keep the work directory after cleanup()
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.launcher = launcher or SubprocessLauncher()
+        self.keep_files = keep_files or work_dir is not None
+        self.work_dir = Path(work_dir) if work_dir else Path(tempfile.mkdtemp(prefix="vfxpipe_track_"))
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._processes = {}
+
+    def run(self, script: Path, nodes: List[str], params: Dict[str, Any],
+            should_cancel: Optional[Callable[[], bool]] = None) -> Iterator[TrackResult]:
+        """
+        Solve the nodes in parallel, yielding results as tasks complete.
+
+        Args:
+            script: Script the workers open (see snapshot_script())
+            nodes: CameraTracker node names
+            params: Tracking parameters
+            should_cancel: Polled while waiting; returning True cancels the run
+
+        Yields:
+            TrackResult of each node, in completion order
+        """
+        # Workers track in-process; they must not fan out again
+        worker_params = {key: value for key, value in params.items() if key not in ('nodes', 'workers')}
+        params_path = self.work_dir / "params.json"
+        params_path.write_text(json.dumps(worker_params, indent=2, default=str), encoding="utf-8")
+
+        tasks = [TrackTask(node, Path(script), params_path, self.work_dir) for node in nodes]
+        logger.info("Tracking %d node(s) in up to %d worker process(es), work directory: %s",
+                    len(tasks), self.max_workers, self.work_dir)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="TrackFanOut")
+        pending = set()
+        try:
+            pending = {executor.submit(self._run_task, task) for task in tasks}
+            while pending:
+                done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                if should_cancel is not None and should_cancel() and not self._cancelled:
+                    self.cancel()
+        finally:
+            if pending:
+                self.cancel()
+            executor.shutdown(wait=True)
+
+    def cancel(self):
+        """Cancel tasks that have not started and terminate running workers."""
+        with self._lock:
+            self._cancelled = True
+            processes = list(self._processes.values())
+        running = [process for process in processes if process.poll() is None]
+        for process in running:
+            process.terminate()
+        if running:
+            logger.warning("Terminated %d running worker process(es)", len(running))
+
+    def cleanup(self):
+        """Remove the work directory unless files are kept."""
+        if not self.keep_files:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _run_task(self, task: TrackTask) -> TrackResult:
+        """Run one task in a worker process and collect its result."""
+        with self._lock:
+            if self._cancelled:
+                return TrackResult(task, cancelled=True)
+            start_time = time.perf_counter()
+            try:
+                process = self.launcher.launch(task, self.work_dir)
+            except OSError as e:
+                return TrackResult(task, error=f"Could not start worker: {e}")
+            self._processes[task.node] = process
+
+        logger.debug("Started worker for %s (pid %s)", task.node, process.pid)
+        try:
+            returncode = process.wait()
+        finally:
+            with self._lock:
+                self._processes.pop(task.node, None)
+        duration = time.perf_counter() - start_time
+
+        if self._cancelled:
+            return TrackResult(task, returncode, duration=duration, cancelled=True)
+
+        summary = None
+        try:
+            data = json.loads(task.summary.read_text(encoding="utf-8"))
+            summary = next((entry for entry in data.get('nodes', []) if entry.get('node') == task.node), None)
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        result = TrackResult(task, returncode, summary, duration)
+        if not result.ok:
+            reason = (summary or {}).get('error') or f"worker exited with code {returncode}"
+            tail = _log_tail(task.log)
+            result.error = f"{reason}\n{tail}" if tail else reason
+        return result
@@ -0,0 +1,149 @@
+"""
+Tracking Jobs
+
+Code shared by the services that run tracking jobs in their own worker
+processes, the warm daemon (daemon.py) and the render farm coordinator
+(coordinator.py): running one job in a headless Nuke process, measuring the
+worker's memory, and the process-like handle FanOut launchers return for a
+job submitted to a service.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from VfxPipe.nuke.tracking import protocol
+from VfxPipe.utils.logger import getLogger
+
+logger = getLogger("TrackingJobs")
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident memory of this process, if it can be measured."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    try:
+        import resource
+        # Peak rather than current memory; ru_maxrss is KB on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return None
+
+
+def execute_job(job: Dict[str, Any], on_progress: Optional[Callable[..., None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """
+    Run one tracking job in this (headless Nuke) process.
+
+    The current script is cleared first, so a worker can run many jobs.
+
+    Args:
+        job: 'job' message with script, node, params and optional export and
+             summary paths
+        on_progress: Called with (message, percentage, detail) as tracking progresses
+        is_cancelled: Polled between tracking steps; the job stops once it returns True
+
+    Returns:
+        'result' message for the job
+    """
+    import json
+    import nuke
+    from VfxPipe.nuke.tools import auto_track
+
+    start_time = time.perf_counter()
+    result = protocol.message("result", id=job.get('id'), node=job.get('node'), ok=False)
+    try:
+        nuke.scriptClear()
+        summary = auto_track.run_batch(
+            job['script'], [job['node']], job.get('params') or {},
+            save=False, export=job.get('export'), on_progress=on_progress, is_cancelled=is_cancelled
+        )
+        if job.get('summary'):
+            with open(job['summary'], "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2, default=str)
+        result['ok'] = bool(summary['success'])
+        result['summary'] = summary
+        if not result['ok']:
+            result['error'] = summary.get('message')
+    except Exception as e:
+        logger.error(f"Job {job.get('id')} failed: {e}", exc_info=True)
+        result['error'] = f"{e}\n{traceback.format_exc()}"
+    result['duration'] = time.perf_counter() - start_time
+    result['rss'] = rss_bytes()
+    result['pid'] = os.getpid()
+    return result
+
+
+class JobProcess:
+    """
+    Process-like handle of a job run by a tracking service, as FanOut
+    expects from a launcher.
+
+    The job is submitted from a background thread through the client's
+    run_job(); terminate() and kill() cancel it through the client's cancel().
+    Subclasses set the label and service names and may override _submit().
+    """
+
+    # Shown as the process ID and in connection errors
+    label = "job"
+    service = "Tracking service"
+
+    def __init__(self, client, task):
+        self.client = client
+        self.task = task
+        self.pid = f"{self.label} {uuid.uuid4().hex[:8]}"
+        self.job_id = self.pid.split()[-1]
+        self.returncode = None
+        self._done = threading.Event()
+        threading.Thread(target=self._run, name="TrackJob", daemon=True).start()
+
+    def _submit(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the task's job and return its result message."""
+        return self.client.run_job(self.task.script, self.task.node, params,
+                                   export=self.task.snippet, summary=self.task.summary,
+                                   job_id=self.job_id)
+
+    def _run(self):
+        import json
+        try:
+            params = json.loads(Path(self.task.params).read_text(encoding="utf-8"))
+            result = self._submit(params)
+            if not result.get('ok'):
+                Path(self.task.log).write_text(str(result.get('error') or "Job failed"), encoding="utf-8")
+            self.returncode = 0 if result.get('ok') else 1
+        except (OSError, ValueError, protocol.ProtocolError) as e:
+            Path(self.task.log).write_text(f"{self.service} error: {e}", encoding="utf-8")
+            self.returncode = 1
+        finally:
+            self._done.set()
+
+    def poll(self):
+        return self.returncode if self._done.is_set() else None
+
+    def wait(self, timeout=None):
+        if not self._done.wait(timeout):
+            raise subprocess.TimeoutExpired(self.pid, timeout)
+        return self.returncode
+
+    def terminate(self):
+        try:
+            self.client.cancel(self.job_id)
+        except OSError:
+            pass
+
+    kill = terminate
@@ -0,0 +1,128 @@
+"""
+Merging Worker Results
+
+A tracking worker exports its solved CameraTracker and the camera created
+from it as a .nk snippet. merge_snippet() brings that result into the live
+script without replacing the live tracker, so its inputs, outputs and
+position stay as they are: the solved knob values are copied onto the live
+tracker, the pasted copy is deleted, and the camera is kept and re-linked to
+the live tracker.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+from VfxPipe.utils.logger import getLogger
+
+logger = getLogger("TrackingMerge")
+
+# Knobs describing the node itself rather than its solve
+SKIPPED_KNOBS = frozenset(('name', 'xpos', 'ypos', 'selected', 'inputs'))
+
+
+def copy_knobs(source, target) -> int:
+    """
+    Copy the knob values of one node onto another node of the same class.
+
+    Knobs the target cannot take (e.g. read-only or version specific values)
+    are skipped and logged at debug level.
+
+    Args:
+        source: Node to copy from
+        target: Node to copy to
+
+    Returns:
+        Number of knobs copied
+    """
+    target_knobs = target.knobs()
+    copied = 0
+    for name, knob in source.knobs().items():
+        if name in SKIPPED_KNOBS or name not in target_knobs:
+            continue
+        try:
+            target_knobs[name].fromScript(knob.toScript())
+        except Exception as e:
+            logger.debug("Skipped knob %s of %s: %s", name, target.name(), e)
+            continue
+        copied += 1
+    return copied
+
+
+def _relink(node, old_name: str, new_name: str):
+    """Point expressions of a node referencing old_name at new_name instead."""
+    # Whole node names only: CameraTracker1 must not match MyCameraTracker1 or Group.CameraTracker1
+    pattern = re.compile(r'(?<![\w.])' + re.escape(old_name) + r'\.')
+    for knob in node.knobs().values():
+        has_expression = getattr(knob, 'hasExpression', None)
+        if has_expression is None or not has_expression():
+            continue
+        text = knob.toScript()
+        relinked = pattern.sub(lambda match: new_name + ".", text)
+        if relinked != text:
+            knob.fromScript(relinked)
+
+
+def merge_snippet(snippet: Path, tracker_name: str) -> Dict[str, Any]:
+    """
+    Merge a worker's solved tracker and camera into the live script. Main thread only.
+
+    If the merge fails, the pasted nodes are deleted again before the error
+    is raised.
+
+    Args:
+        snippet: .nk snippet exported by the worker
+        tracker_name: Name of the live CameraTracker the snippet solves
+
+    Returns:
+        Dictionary with the merged 'camera' name (None if the snippet had no
+        camera) and the number of 'knobs' copied onto the tracker
+
+    Raises:
+        ValueError: If the live tracker or the solved tracker is missing
+    """
+    import nuke
+
+    tracker = nuke.toNode(tracker_name)
+    if tracker is None:
+        raise ValueError(f"Node '{tracker_name}' not found")
+
+    root = nuke.root()
+    with root:
+        existing = set(nuke.allNodes())
+        for node in nuke.selectedNodes():
+            node['selected'].setValue(False)
+        nuke.nodePaste(str(snippet))
+        pasted = [node for node in nuke.allNodes() if node not in existing]
+
+    solved = next((node for node in pasted if node.Class() == tracker.Class()), None)
+    if solved is None:
+        for node in pasted:
+            nuke.delete(node)
+        raise ValueError(f"No {tracker.Class()} found in {snippet}")
+
+    cameras = [node for node in pasted if node is not solved]
+    try:
+        copied = copy_knobs(solved, tracker)
+        for camera in cameras:
+            _relink(camera, solved.name(), tracker.name())
+        nuke.delete(solved)
+    except Exception:
+        # Leave no half-merged copies behind in the live script
+        for node in pasted:
+            try:
+                nuke.delete(node)
+            except Exception:
+                pass
+        raise
+
+    # Place the cameras below the live tracker, like the in-session pipeline
+    x = tracker.xpos() + int(tracker.screenWidth() / 2)
+    y = tracker.ypos() + tracker.screenWidth()
+    for index, camera in enumerate(cameras):
+        camera.setXYpos(x - int(camera.screenWidth() / 2) + index * 100, y)
+        camera['selected'].setValue(False)
+
+    camera_name = cameras[0].name() if cameras else None
+    logger.debug("Merged %s: %d knob(s), camera %s", tracker_name, copied, camera_name)
+    return {'camera': camera_name, 'knobs': copied}
@@ -0,0 +1,216 @@
+"""
+Tracking Job Protocol
+
+Newline-delimited JSON messages shared by the tracking daemon, its workers
+and their clients. Every message is a JSON object with a 'type' field; one
+message per line, UTF-8 encoded.
+
+Message types:
+    register: worker -> server, sent once a worker process is initialized
+    submit:   client -> server, a tracking job (id, script, node, params, ...)
+    job:      server -> worker, the job to run
+    result:   worker -> server -> client, outcome of a job (id, ok, summary, error)
+    cancel:   client -> server, cancel a job by id
+    status:   client -> server, request a status report (answered with status)
+    stop:     client -> server, shut the server down
+    shutdown: server -> worker, exit after the current job
+    error:    server -> client, a request was rejected
+"""
+
+import json
+import secrets
+import select
+import socket
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+PROTOCOL_VERSION = 1
+
+# Longest accepted line; results carry a summary, never bulk data
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class ProtocolError(Exception):
+    """Raised when a peer sends something that is not a valid message."""
+
+
+def message(message_type: str, **fields) -> Dict[str, Any]:
+    """
+    Build a message.
+
+    Args:
+        message_type: Value of the 'type' field
+        **fields: Other fields
+
+    Returns:
+        Message dictionary
+    """
+    fields['type'] = message_type
+    return fields
+
+
+def encode(msg: Dict[str, Any]) -> bytes:
+    """Encode a message as one JSON line."""
+    return json.dumps(msg, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """
+    Decode one JSON line.
+
+    Raises:
+        ProtocolError: If the line is not a JSON object with a 'type'
+    """
+    try:
+        msg = json.loads(line.decode("utf-8"))
+    except ValueError as e:
+        raise ProtocolError(f"Invalid message: {e}")
+    if not isinstance(msg, dict) or 'type' not in msg:
+        raise ProtocolError("Message must be a JSON object with a 'type'")
+    return msg
+
+
+def token_matches(msg: Dict[str, Any], token: str) -> bool:
+    """
+    Check the access token of a message in constant time.
+
+    Args:
+        msg: Received message
+        token: Expected access token
+
+    Returns:
+        True if the message carries the token
+    """
+    given = msg.get('token')
+    if not isinstance(given, str):
+        return False
+    return secrets.compare_digest(given.encode("utf-8"), token.encode("utf-8"))
+
+
+def parse_address(text: str, default_host: str = "127.0.0.1") -> Tuple[str, int]:
+    """
+    Parse "host:port" (or just "port").
+
+    Args:
+        text: Address text
+        default_host: Host used when only a port is given
+
+    Returns:
+        (host, port) tuple
+    """
+    host, sep, port = text.rpartition(":")
+    return (host if sep and host else default_host), int(port)
+
+
+class Connection:
+    """
+    Message connection over a socket.
+
+    send() may be called from several threads; receive() from one.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.sock.settimeout(None)
+        self._buffer = bytearray()
+        self._send_lock = threading.Lock()
+        self.closed = False
+
+    @property
+    def peer(self) -> str:
+        try:
+            host, port = self.sock.getpeername()[:2]
+            return f"{host}:{port}"
+        except OSError:
+            return "disconnected"
+
+    def send(self, msg: Dict[str, Any]) -> bool:
+        """
+        Send a message.
+
+        Returns:
+            False if the connection is closed
+        """
+        data = encode(msg)
+        with self._send_lock:
+            if self.closed:
+                return False
+            try:
+                self.sock.sendall(data)
+                return True
+            except OSError:
+                self.closed = True
+                return False
+
+    def receive(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next message.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            The message, or None when the peer closed the connection
+
+        Raises:
+            socket.timeout: If the timeout expired
+            ProtocolError: If the peer sent an invalid message
+        """
+        while True:
+            index = self._buffer.find(b"\n")
+            if index >= 0:
+                line = bytes(self._buffer[:index])
+                del self._buffer[:index + 1]
+                return decode(line)
+            if len(self._buffer) > MAX_MESSAGE_BYTES:
+                raise ProtocolError("Message too long")
+
+            # select() keeps the socket blocking for concurrent send() calls
+            if timeout is not None:
+                try:
+                    readable = select.select([self.sock], [], [], timeout)[0]
+                except (OSError, ValueError):
+                    readable = [self.sock]
+                if not readable:
+                    raise socket.timeout("No message received")
+            try:
+                chunk = self.sock.recv(65536)
+            except OSError:
+                chunk = b""
+            if not chunk:
+                self.closed = True
+                return None
+            self._buffer += chunk
+
+    def close(self):
+        """Close the connection."""
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def connect(host: str, port: int, timeout: Optional[float] = None) -> Connection:
+    """
+    Open a connection to a tracking server.
+
+    Args:
+        host: Server host
+        port: Server port
+        timeout: Connection timeout in seconds
+
+    Returns:
+        Connection
+
+    Raises:
+        OSError: If the server cannot be reached
+    """
+    return Connection(socket.create_connection((host, port), timeout=timeout))
@@ -0,0 +1,212 @@
+"""
+Solve Refinement Strategies
+
+Auto Track refines a solve by tightening the CameraTracker's track
+thresholds (minimum length, maximum track error, maximum error), deleting the
+rejected and invalid tracks and updating the solve, until the solve RMSE
+drops below the target. Every iteration costs a full delete-tracks and
+doUpdateSolve cycle, so the strategy choosing the thresholds decides how
+many solves a shot needs.
+
+Deleted tracks do not come back, so thresholds only ever get tighter: a
+strategy proposes the next, tighter set from the RMSE each iteration gave.
+
+    FixedStep:      minLen + 1, maxTrackError - 0.25, maxError - 0.25 per
+                    iteration (the original behavior, the default)
+    SecantBisection: models RMSE against threshold tightness from previous
+                    iterations and jumps toward the target RMSE, never more
+                    than halfway to the tightest sensible thresholds
+
+Strategies are selected by the 'refine_strategy' tracking parameter:
+
+    >>> strategy = create_strategy("bisect", target_rmse=1.0)
+    >>> strategy.next_thresholds(Thresholds(3, 4.0, 4.0), rmse=2.4)
+    Thresholds(min_len=8, max_track_error=2.5, max_error=2.5)
+"""
+
+import abc
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type
+
+DEFAULT_STRATEGY = "fixed"
+
+
+class Thresholds(NamedTuple):
+    """CameraTracker track thresholds applied in one refinement iteration."""
+
+    min_len: int
+    max_track_error: float
+    max_error: float
+
+
+class RefinementStrategy(abc.ABC):
+    """
+    Chooses the thresholds of each refinement iteration.
+
+    Subclasses implement _propose(); history holds the (thresholds, rmse)
+    pair of every iteration so far.
+    """
+
+    name = None
+    label = None
+
+    def __init__(self, target_rmse: float):
+        """
+        Initialize the strategy for one node.
+
+        Args:
+            target_rmse: RMSE the refinement aims below (controlError)
+        """
+        self.target_rmse = target_rmse
+        self.history: List[Tuple[Thresholds, float]] = []
+
+    def next_thresholds(self, thresholds: Thresholds, rmse: float) -> Optional[Thresholds]:
+        """
+        Get the thresholds for the next iteration.
+
+        Args:
+            thresholds: Thresholds of the iteration that just ran
+            rmse: Solve RMSE that iteration gave
+
+        Returns:
+            Next thresholds, or None if no tighter thresholds are worth trying
+        """
+        self.history.append((thresholds, rmse))
+        return self._propose(thresholds, rmse)
+
+    @abc.abstractmethod
+    def _propose(self, thresholds: Thresholds, rmse: float) -> Optional[Thresholds]:
+        """Propose the next thresholds; self.history already includes this iteration."""
+
+
+class FixedStep(RefinementStrategy):
+    """Tightens every threshold by the same step each iteration."""
+
+    name = "fixed"
+    label = "Fixed step"
+
+    def __init__(self, target_rmse: float, min_len_step: int = 1, error_step: float = 0.25):
+        """
+        Initialize the strategy.
+
+        Args:
+            target_rmse: RMSE the refinement aims below
+            min_len_step: Added to the minimum track length each iteration
+            error_step: Subtracted from both error thresholds each iteration
+        """
+        super().__init__(target_rmse)
+        self.min_len_step = min_len_step
+        self.error_step = error_step
+
+    def _propose(self, thresholds: Thresholds, rmse: float) -> Optional[Thresholds]:
+        return Thresholds(thresholds.min_len + self.min_len_step,
+                          thresholds.max_track_error - self.error_step,
+                          thresholds.max_error - self.error_step)
+
+
+class SecantBisection(RefinementStrategy):
+    """
+    Jumps toward the thresholds predicted to reach the target RMSE.
+
+    Thresholds are moved along one tightness axis, from the first
+    iteration's thresholds (0) to the tightest sensible ones (1): error
+    thresholds at the target RMSE, since rejecting tracks already more
+    accurate than the target cannot help, and the minimum length raised by
+    max_min_len_increase. RMSE is modelled against tightness:
+
+    - after one iteration, RMSE is taken as proportional to the error thresholds;
+    - after two or more, the secant through the last two iterations is used;
+    - if tightening did not lower the RMSE, the model is not trusted and the
+      step bisects the remaining range instead.
+
+    The aim is a little below the target (margin) so the jump does not land
+    just short of it. A step is at least min_step, and at most halfway from
+    the current tightness to the tightest thresholds, which keeps an
+    overshoot from deleting most of the tracks in one iteration.
+    """
+
+    name = "bisect"
+    label = "Bisection (fewer solves)"
+
+    def __init__(self, target_rmse: float, margin: float = 0.1, min_step: float = 0.05,
+                 max_min_len_increase: int = 10):
+        """
+        Initialize the strategy.
+
+        Args:
+            target_rmse: RMSE the refinement aims below
+            margin: Fraction below the target RMSE to aim at
+            min_step: Smallest tightness step per iteration
+            max_min_len_increase: Largest total increase of the minimum track length
+        """
+        super().__init__(target_rmse)
+        self.margin = margin
+        self.min_step = min_step
+        self.max_min_len_increase = max_min_len_increase
+        self.start = None
+        self.tightness = 0.0
+        self.points: List[Tuple[float, float]] = []
+
+    def _at(self, tightness: float) -> Thresholds:
+        """Thresholds at a tightness between the first (0) and the tightest (1)."""
+        start = self.start
+        floor = self.target_rmse
+        track_floor = min(floor, start.max_track_error)
+        error_floor = min(floor, start.max_error)
+        return Thresholds(
+            int(round(start.min_len + tightness * self.max_min_len_increase)),
+            start.max_track_error - tightness * (start.max_track_error - track_floor),
+            start.max_error - tightness * (start.max_error - error_floor),
+        )
+
+    def _propose(self, thresholds: Thresholds, rmse: float) -> Optional[Thresholds]:
+        if self.start is None:
+            self.start = thresholds
+        current = self.tightness
+        self.points.append((current, rmse))
+        if current >= 1.0:
+            return None
+
+        aim = self.target_rmse * (1.0 - self.margin)
+        half_way = (current + 1.0) / 2.0
+        proposal = half_way
+        if len(self.points) >= 2:
+            (t0, r0), (t1, r1) = self.points[-2:]
+            slope = (r1 - r0) / (t1 - t0) if t1 > t0 else 0.0
+            if slope < 0:
+                proposal = t1 + (aim - r1) / slope
+        elif rmse > 0:
+            # Proportional model: scale the error threshold by aim / rmse
+            start_error = self.start.max_error
+            error_range = start_error - min(self.target_rmse, start_error)
+            if error_range > 0:
+                proposal = (start_error - start_error * aim / rmse) / error_range
+
+        upper = max(half_way, min(current + self.min_step, 1.0))
+        self.tightness = min(max(proposal, current + self.min_step), upper)
+        return self._at(self.tightness)
+
+
+STRATEGIES: Dict[str, Type[RefinementStrategy]] = {
+    FixedStep.name: FixedStep,
+    SecantBisection.name: SecantBisection,
+}
+
+
+def create_strategy(name: Optional[str], target_rmse: float) -> RefinementStrategy:
+    """
+    Create a refinement strategy by name.
+
+    Args:
+        name: Strategy name (see STRATEGIES); None for DEFAULT_STRATEGY
+        target_rmse: RMSE the refinement aims below
+
+    Returns:
+        New strategy instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    strategy_class = STRATEGIES.get(name or DEFAULT_STRATEGY)
+    if strategy_class is None:
+        raise ValueError(f"Unknown refinement strategy '{name}' (available: {', '.join(STRATEGIES)})")
+    return strategy_class(target_rmse)
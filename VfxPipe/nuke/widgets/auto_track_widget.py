@@ -5,21 +5,9 @@ Provides a Qt-based interface for automated camera tracking in Nuke.
 Allows users to select CameraTracker nodes and configure tracking parameters.
 """
 
-from VfxPipe.utils.host import getPySideVersion
-
-# Dynamically import correct PySide version based on DCC
-_pyside_version = getPySideVersion()
-
-try:
-    if _pyside_version == 2:
-        from PySide2 import QtWidgets, QtCore, QtGui
-    else:
-        from PySide6 import QtWidgets, QtCore, QtGui
-except ImportError as e:
-    raise ImportError(
-        f"PySide{_pyside_version} is required for this DCC but not available. "
-        f"Please install PySide{_pyside_version}. Error: {e}"
-    )
+# Resolves PySide2/PySide6 for the current DCC (see VfxPipe.qt)
+from VfxPipe.qt import QtWidgets, QtCore, QtGui
+from VfxPipe.nuke.tracking import refinement
 
 
 class AutoTrackWidget(QtWidgets.QDialog):
@@ -143,6 +131,15 @@ class AutoTrackWidget(QtWidgets.QDialog):
         self.max_iter_spin.setToolTip("Maximum number of recursive iterations")
         params_layout.addRow("Max Iterations:", self.max_iter_spin)
 
+        self.refine_strategy_combo = QtWidgets.QComboBox()
+        for name, strategy in refinement.STRATEGIES.items():
+            self.refine_strategy_combo.addItem(strategy.label, name)
+        self.refine_strategy_combo.setCurrentIndex(
+            self.refine_strategy_combo.findData(refinement.DEFAULT_STRATEGY))
+        self.refine_strategy_combo.setToolTip("How thresholds are tightened between refinement iterations. "
+                                              "Bisection jumps toward the target RMSE in fewer solves.")
+        params_layout.addRow("Refinement:", self.refine_strategy_combo)
+
         # Camera naming
         self.camera_prefix_edit = QtWidgets.QLineEdit("cam_")
         self.camera_prefix_edit.setToolTip("Prefix for generated camera names")
@@ -154,6 +151,15 @@ class AutoTrackWidget(QtWidgets.QDialog):
         self.link_output_check.setToolTip("If checked, uses expressions. If unchecked, bakes values.")
         params_layout.addRow("Link Output:", self.link_output_check)
 
+        # Parallel execution
+        self.workers_spin = QtWidgets.QSpinBox()
+        self.workers_spin.setRange(0, 32)
+        self.workers_spin.setValue(0)
+        self.workers_spin.setSpecialValueText("Off (this session)")
+        self.workers_spin.setToolTip("Headless Nuke processes tracking nodes in parallel. "
+                                     "0 tracks one node after another in this session.")
+        params_layout.addRow("Parallel Workers:", self.workers_spin)
+
         params_group.setLayout(params_layout)
         main_layout.addWidget(params_group)
 
@@ -300,7 +306,9 @@ class AutoTrackWidget(QtWidgets.QDialog):
             'controlError': self.control_error_spin.value(),
             'max_iter': self.max_iter_spin.value(),
             'camera_prefix': self.camera_prefix_edit.text(),
-            'link_output': self.link_output_check.isChecked()
+            'link_output': self.link_output_check.isChecked(),
+            'workers': self.workers_spin.value(),
+            'refine_strategy': self.refine_strategy_combo.currentData()
         }
 
     def _on_track_clicked(self):
@@ -0,0 +1,71 @@
+"""
+Qt Compatibility Layer
+
+Resolves the PySide binding for the current host (PySide2 or PySide6) once
+and exposes QtCore, QtWidgets and QtGui as lazy module attributes. Nothing
+from Qt is imported until one of them is first accessed, so tools can import
+this module in headless sessions (nuke -t, farm processes) at no cost.
+
+Examples:
+    >>> from VfxPipe import qt
+    >>> qt.is_loaded()
+    False
+    >>> dialog = qt.QtWidgets.QDialog()   # PySide is imported here
+
+    >>> from VfxPipe.qt import QtCore     # also resolves lazily, on import
+"""
+
+import importlib
+import sys
+
+
+# Qt submodules exposed by this layer
+QT_MODULES = ("QtCore", "QtWidgets", "QtGui")
+
+_binding = None
+
+
+def binding_name():
+    """
+    Get the name of the PySide binding used for this host.
+
+    Returns:
+        str: "PySide2" or "PySide6"
+    """
+    global _binding
+    if _binding is None:
+        from VfxPipe.utils.host import getPySideVersion
+        _binding = f"PySide{getPySideVersion()}"
+    return _binding
+
+
+def is_loaded():
+    """
+    Check if any Qt module has been loaded through this layer.
+
+    Returns:
+        bool: True once QtCore, QtWidgets or QtGui has been accessed
+    """
+    module = sys.modules[__name__]
+    return any(name in vars(module) for name in QT_MODULES)
+
+
+def _load(name):
+    """Import a Qt submodule from the resolved binding and memoize it."""
+    binding = binding_name()
+    try:
+        module = importlib.import_module(f"{binding}.{name}")
+    except ImportError as e:
+        raise ImportError(
+            f"{binding} is required for this DCC but not available. "
+            f"Please install {binding}. Error: {e}"
+        )
+    # Later lookups hit the module dict directly and skip __getattr__
+    setattr(sys.modules[__name__], name, module)
+    return module
+
+
+def __getattr__(name):
+    if name in QT_MODULES:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,106 @@
+"""
+On-Disk Cache Utilities
+
+Provides a shared location and small helpers for the persisted caches used by
+VfxPipe (tool manifests, host detection results, ...). Cache files are plain
+JSON so they can be inspected or deleted by hand at any time.
+
+Environment variables:
+    VFXPIPE_CACHE_DIR: Override the cache directory (default: ~/.vfxpipe/cache)
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory used for VfxPipe cache files.
+
+    The directory is not created here; writers create it on demand so that
+    read-only lookups never touch the filesystem more than needed.
+
+    Returns:
+        Path to the cache directory
+    """
+    override = os.environ.get("VFXPIPE_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".vfxpipe" / "cache"
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Build a short, filesystem-safe key from arbitrary values.
+
+    Args:
+        *parts: Values identifying the cache entry (paths, versions, ...)
+
+    Returns:
+        str: 16 character hex digest
+
+    Examples:
+        >>> cache_key("/studio/vfx-demo-pipe", "3.11")
+        '17c9c8b949588e7f'
+    """
+    digest = hashlib.sha1("\0".join(str(p) for p in parts).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def read_json(path: Path, default: Optional[Any] = None) -> Any:
+    """
+    Read a JSON cache file, ignoring missing or corrupt files.
+
+    Args:
+        path: File to read
+        default: Value returned when the file cannot be read
+
+    Returns:
+        Parsed JSON data, or default
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json_atomic(path: Path, data: Any) -> bool:
+    """
+    Write a JSON cache file atomically.
+
+    Data is written to a temporary file in the same directory and renamed
+    over the target, so concurrent Nuke sessions never read a partial file.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+
+    Returns:
+        bool: True if the file was written, False otherwise
+    """
+    import tempfile
+
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent)
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, str(path))
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        print(f"[VfxPipe] WARNING: Could not write cache file {path}: {e}")
+        return False
@@ -3,8 +3,203 @@ Host DCC Detection and Version Utilities
 
 Provides functions to detect the current DCC application and determine
 appropriate Qt/PySide versions for compatibility across different DCC versions.
+
+Detection never imports DCC modules: the host is identified from modules the
+DCC has already loaded (sys.modules), the interpreter executable name and
+environment markers. The result is memoized per process, and PySide versions
+that require querying the DCC are cached on disk per interpreter, so
+importing this module costs next to nothing.
+
+Environment variables:
+    VFXPIPE_DCC: Force the detected DCC ('nuke', 'maya', 'houdini', 'blender'
+                 or 'none' for standalone Python)
+    VFXPIPE_HOST_CACHE: Set to 0 to disable the on-disk host cache
 """
 
+import os
+import sys
+
+
+# Module each DCC loads into sys.modules before any user code runs
+_DCC_MODULES = (
+    ("nuke", "nuke"),
+    ("maya", "maya.cmds"),
+    ("houdini", "hou"),
+    ("blender", "bpy"),
+)
+
+# Interpreter executable name prefixes
+_DCC_EXECUTABLES = (
+    ("nuke", ("nuke",)),
+    ("maya", ("maya", "mayapy", "mayabatch")),
+    ("houdini", ("houdini", "hython", "hbatch", "happrentice")),
+    ("blender", ("blender",)),
+)
+
+# Environment variables set by the DCC inside its own process
+_DCC_ENV_MARKERS = (
+    ("houdini", ("HOUDINI_VERSION",)),
+    ("maya", ("MAYA_LOCATION",)),
+)
+
+
+# DCCs whose version query is expensive enough to be cached on disk
+_DISK_CACHED_DCCS = ("maya", "houdini")
+
+
+def _detect_dcc():
+    """
+    Identify the host DCC without importing anything.
+
+    Returns:
+        tuple: (dcc name or None, detection source or None)
+    """
+    override = os.environ.get("VFXPIPE_DCC", "").strip().lower()
+    if override:
+        return (None if override in ("none", "standalone") else override), "override"
+
+    for dcc, module_name in _DCC_MODULES:
+        if module_name in sys.modules:
+            return dcc, "module"
+
+    executable = os.path.basename(sys.executable or "").lower()
+    for dcc, prefixes in _DCC_EXECUTABLES:
+        if executable.startswith(prefixes):
+            return dcc, "executable"
+
+    # Environment variables can leak into child processes, so confirm the
+    # DCC module is importable before trusting them (a single lookup)
+    for dcc, variables in _DCC_ENV_MARKERS:
+        if any(var in os.environ for var in variables):
+            module_name = dict(_DCC_MODULES)[dcc]
+            try:
+                import importlib.util
+                if importlib.util.find_spec(module_name.split(".")[0]) is not None:
+                    return dcc, "environment"
+            except (ImportError, ValueError):
+                pass
+
+    return None, None
+
+
+def _cache_enabled():
+    value = os.environ.get("VFXPIPE_HOST_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+def _host_cache_path():
+    """Cache file for the running interpreter, keyed on its executable."""
+    from VfxPipe.utils.cache import cache_key, get_cache_dir
+
+    try:
+        stat = os.stat(sys.executable)
+        identity = (sys.executable, stat.st_mtime_ns, stat.st_size)
+    except (OSError, TypeError):
+        identity = (sys.executable,)
+    return get_cache_dir() / f"host-{cache_key(*identity, sys.version)}.json"
+
+
+class HostInfo:
+    """
+    Lazily computed, memoized information about the host application.
+
+    Use get_host_info() to obtain the shared instance.
+
+    Attributes:
+        dcc (str or None): DCC name or None if standalone
+        source (str or None): How the DCC was detected
+            ('override', 'module', 'executable' or 'environment')
+    """
+
+    def __init__(self, dcc, source=None):
+        self.dcc = dcc
+        self.source = source
+        self._pyside_version = None
+
+    @classmethod
+    def detect(cls):
+        """
+        Detect the host application.
+
+        Returns:
+            HostInfo instance
+        """
+        return cls(*_detect_dcc())
+
+    @property
+    def pyside_version(self):
+        """
+        PySide version (2 or 6) for this host, resolved once.
+
+        For Maya and Houdini the value is cached on disk per interpreter,
+        so later sessions skip querying the DCC version.
+
+        Raises:
+            RuntimeError: If DCC is detected but version cannot be determined
+        """
+        if self._pyside_version is None:
+            self._pyside_version = self._resolve_pyside_version()
+        return self._pyside_version
+
+    def _resolve_pyside_version(self):
+        # Nuke exposes its version as module constants, only DCCs that need
+        # an API call to report their version go through the disk cache
+        if self.dcc not in _DISK_CACHED_DCCS:
+            return _query_pyside_version(self.dcc)
+
+        # Imported here so that importing this module stays cheap
+        from VfxPipe.utils.cache import read_json, write_json_atomic
+
+        use_cache = _cache_enabled()
+        cache_path = _host_cache_path() if use_cache else None
+        # Key on the DCC module location too, for interpreters that can
+        # import several DCC installs (e.g. a system Python with Nuke's API)
+        module = sys.modules.get(dict(_DCC_MODULES).get(self.dcc, ""))
+        key = f"{self.dcc}:{getattr(module, '__file__', None) or 'builtin'}"
+        if use_cache:
+            cached = read_json(cache_path, default={})
+            version = cached.get("pyside_version", {}).get(key) if isinstance(cached, dict) else None
+            if version in (2, 6):
+                return version
+
+        version = _query_pyside_version(self.dcc)
+
+        if use_cache:
+            cached = read_json(cache_path, default={})
+            if not isinstance(cached, dict):
+                cached = {}
+            cached.setdefault("pyside_version", {})[key] = version
+            cached["executable"] = sys.executable
+            write_json_atomic(cache_path, cached)
+        return version
+
+    def __repr__(self):
+        return f"HostInfo(dcc={self.dcc!r}, source={self.source!r})"
+
+
+_host_info = None
+
+
+def get_host_info(refresh=False):
+    """
+    Get the memoized host information for this process.
+
+    Args:
+        refresh (bool): Detect the host again instead of using the memoized result
+
+    Returns:
+        HostInfo: Shared host information instance
+
+    Examples:
+        >>> info = get_host_info()
+        >>> if info.dcc == 'nuke':
+        ...     print(f"Nuke with PySide{info.pyside_version}")
+    """
+    global _host_info
+    if _host_info is None or refresh:
+        _host_info = HostInfo.detect()
+    return _host_info
+
 
 def getDcc():
     """
@@ -18,36 +213,7 @@ def getDcc():
         >>> if dcc == 'nuke':
         ...     print("Running in Nuke")
     """
-    # Try Nuke
-    try:
-        import nuke
-        return "nuke"
-    except ImportError:
-        pass
-
-    # Try Maya
-    try:
-        import maya.cmds
-        return "maya"
-    except ImportError:
-        pass
-
-    # Try Houdini
-    try:
-        import hou
-        return "houdini"
-    except ImportError:
-        pass
-
-    # Try Blender
-    try:
-        import bpy
-        return "blender"
-    except ImportError:
-        pass
-
-    # No DCC detected - standalone Python
-    return None
+    return get_host_info().dcc
 
 
 def getPySideVersion(dcc=None):
@@ -61,7 +227,7 @@ def getPySideVersion(dcc=None):
     - Other/Unknown: PySide6 (default)
 
     Args:
-        dcc (str, optional): DCC name. If None, will auto-detect using getDcc()
+        dcc (str, optional): DCC name. If None, uses the memoized host info
 
     Returns:
         int: PySide version (2 or 6)
@@ -76,10 +242,15 @@ def getPySideVersion(dcc=None):
         ... else:
         ...     from PySide6 import QtWidgets
     """
-    # Auto-detect DCC if not provided
+    # Auto-detect DCC if not provided (memoized and cached on disk)
     if dcc is None:
-        dcc = getDcc()
+        return get_host_info().pyside_version
+
+    return _query_pyside_version(dcc)
+
 
+def _query_pyside_version(dcc):
+    """Query the DCC for its version and map it to a PySide version."""
     # Handle Nuke
     if dcc == "nuke":
         try:
@@ -194,9 +365,13 @@ def is_nuke_16_or_newer():
     return version is not None and version[0] >= 16
 
 
-# Convenience constants
-DCC_NAME = getDcc()
-PYSIDE_VERSION = getPySideVersion()
+def __getattr__(name):
+    """Compute the DCC_NAME and PYSIDE_VERSION convenience constants on first access."""
+    if name == "DCC_NAME":
+        return getDcc()
+    if name == "PYSIDE_VERSION":
+        return getPySideVersion()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -8,39 +8,839 @@
 # This file is licensed under the MIT License.
 # See the LICENSE file in the root of this repository for details.
 # -----------------------------------------------------------------------------
+"""
+Logging for VfxPipe tools.
+
+Loggers returned by getLogger() do not write anywhere themselves: they hand
+each record to a bounded queue, and a single background listener thread owns
+the real handlers (console and Nuke Script Editor). A log call from a worker
+thread therefore only resolves the message and enqueues it. When the queue is
+full, records are dropped instead of blocking the caller; the number of drops
+is reported through the log itself and by get_dropped_count().
+
+getLogger() is idempotent: the pipeline is set up once per process (it even
+survives reloading this module) and calling getLogger() again for the same
+name, e.g. after a tool reload, never adds a second handler.
+
+Levels can be set per logger without code changes, either in a JSON config
+file ({"levels": {"AutoTrack": "INFO"}}) or in VFXPIPE_LOG_LEVELS as a comma
+separated list ("AutoTrack=WARNING,VfxPipe.nuke=INFO"). A name also applies
+to its dotted children, "*" sets the default, and entries in the variable
+win over the file. Loggers default to DEBUG.
+
+Environment variables:
+    VFXPIPE_LOG_QUEUE_SIZE: Maximum number of queued records (default: 10000)
+    VFXPIPE_LOG_LEVELS: Per-logger levels, e.g. "AutoTrack=INFO,*=WARNING"
+    VFXPIPE_LOG_CONFIG: Path to a JSON file with a "levels" mapping
+    VFXPIPE_LOG_FLUSH_INTERVAL: Seconds between Script Editor batches (default: 0.2)
+    VFXPIPE_LOG_FLUSH_LINES: Maximum lines per Script Editor batch (default: 200,
+                             0 = no limit)
+    VFXPIPE_RUNLOG_DIR: Also write structured JSONL run logs here (see runlog.py)
+    VFXPIPE_LOG_RING_SIZE: Recent records kept in memory for snapshot()
+                           (default: 1000)
+
+Every logger also feeds a fixed-size in-memory ring buffer of recent records,
+so error reports can include the log history that led up to a failure (see
+snapshot()). Fields set with log_context() (e.g. the node being processed)
+are attached to every record logged inside the block.
+"""
+import atexit
+import collections
+import copy
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s:VFXP:%(name)s: %(message)s'
+DATE_FORMAT = '%H:%M:%S'
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_LEVEL = logging.DEBUG
+DEFAULT_FLUSH_INTERVAL = 0.2
+DEFAULT_FLUSH_LINES = 200
+DEFAULT_RING_SIZE = 1000
+
+# Record attributes copied into ring buffer snapshots when present
+SNAPSHOT_FIELDS = ('node', 'stage', 'iteration', 'rmse', 'duration')
+
+_exception_formatter = logging.Formatter()
+
+
+def _resolved(record):
+    """
+    Copy a record with its message and exception text rendered.
+
+    The copy can be formatted later on another thread: it captures the state
+    of mutable arguments at log time and holds no traceback. The caller's
+    record, which other handlers also receive, is left as it is.
+
+    Args:
+        record (logging.LogRecord): The record to copy.
+
+    Returns:
+        logging.LogRecord: The resolved copy.
+    """
+    record = copy.copy(record)
+    record.message = record.getMessage()
+    record.msg = record.message
+    record.args = None
+    if record.exc_info:
+        record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.exc_info = None
+    return record
+
 
 class NukeHandler(logging.Handler):
     """
     Custom logging handler that outputs log messages to Nuke's Script Editor.
 
-    This handler uses the standard 'print()' function so that messages appear
-    inside Nuke's internal script editor panel.
+    The Script Editor output widget is slow and must only be written from the
+    main thread, so formatted lines are buffered and written in batches by a
+    single nuke.executeInMainThread() callback, at most once per flush
+    interval. Each batch is capped at max_lines; lines over the cap are
+    replaced by one summary line (the console handler still gets all of
+    them). Outside the Nuke GUI batches are printed from the flush thread.
 
     Inherits from:
         logging.Handler
     """
+    def __init__(self, interval=None, max_lines=None):
+        super().__init__()
+        self.interval = interval if interval is not None else _env_number(
+            "VFXPIPE_LOG_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL, float)
+        self.max_lines = max_lines if max_lines is not None else _env_number(
+            "VFXPIPE_LOG_FLUSH_LINES", DEFAULT_FLUSH_LINES, int)
+        self.skipped = 0
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher = None
+
     def emit(self, record):
         """
-        Emit a log record by formatting it and printing to stdout.
+        Format a log record and queue it for the next Script Editor batch.
 
         Args:
             record (logging.LogRecord): The log record to output.
         """
         try:
             msg = self.format(record)
-            print(msg)
         except Exception:
+            return
+        with self._pending_lock:
+            self._pending.append(msg)
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="VfxPipe-log-flush")
+                self._flusher.daemon = True
+                self._flusher.start()
+        self._wakeup.set()
+
+    def _flush_loop(self):
+        """Hand a batch to the main thread at most once per interval."""
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.interval)
+            self._wakeup.clear()
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        try:
+            import nuke
+            if nuke.GUI:
+                nuke.executeInMainThread(self.flush)
+                return
+        except Exception:
+            pass
+        self.flush()
+
+    def _take_batch(self):
+        """
+        Take the pending lines, capped at max_lines.
+
+        Returns:
+            list: Lines to print, with a summary line if some were skipped.
+        """
+        with self._pending_lock:
+            lines, self._pending = self._pending, []
+        if self.max_lines > 0 and len(lines) > self.max_lines:
+            skipped = len(lines) - self.max_lines
+            self.skipped += skipped
+            lines = lines[:self.max_lines]
+            lines.append(f"[VfxPipe] ... {skipped} log line(s) not shown in the Script Editor "
+                         f"(output cap {self.max_lines} lines per {self.interval:g}s)")
+        return lines
+
+    def flush(self):
+        """
+        Print the pending lines as one batch.
+
+        Called on the main thread by the flush callback, and at exit.
+        """
+        lines = self._take_batch()
+        if lines:
+            try:
+                print("\n".join(lines))
+            except Exception:
+                pass
+
+
+class BoundedQueueHandler(logging.Handler):
+    """
+    Queue handler that never blocks the thread that logs.
+
+    Records are put on the queue with put_nowait(). If the queue is full the
+    record is dropped and counted; a warning with the number of dropped
+    records is queued ahead of the next record that fits.
+
+    The prepared copy of each record is also appended to the ring buffer, if
+    one is given, before it is queued. This runs in the thread that logs, so
+    a snapshot taken right after a log call always contains that record,
+    dropped or not, and every record is resolved only once.
+
+    Like _LogListener, it does not build on logging.handlers, whose import
+    (socket, pickle, ...) would add to the import time of every tool.
+
+    Inherits from:
+        logging.Handler
+    """
+    # Marks the shared handler, also on instances from before a module reload
+    vfxpipe_shared = True
+
+    def __init__(self, log_queue, ring=None):
+        super().__init__()
+        self.queue = log_queue
+        self.ring = ring
+        self.dropped = 0
+        self._unreported = 0
+
+    def emit(self, record):
+        """
+        Prepare a record, keep it in the ring buffer and queue it.
+
+        Args:
+            record (logging.LogRecord): The log record.
+        """
+        try:
+            prepared = self.prepare(record)
+            if self.ring is not None:
+                self.ring.append(prepared)
+            self.enqueue(prepared)
+        except Exception:
+            self.handleError(record)
+
+    def prepare(self, record):
+        """
+        Get a copy of the record that can be formatted on another thread.
+
+        Only the message and exception text are rendered here (see
+        _resolved()), which captures the state of mutable arguments at log
+        time. Like the standard QueueHandler, the caller's record is copied
+        rather than modified. Timestamps and layout are formatted by the
+        listener thread.
+
+        Args:
+            record (logging.LogRecord): The record to enqueue.
+
+        Returns:
+            logging.LogRecord: The prepared copy.
+        """
+        return _resolved(record)
+
+    def enqueue(self, record):
+        """
+        Queue a record, or count it as dropped if the queue is full.
+
+        Args:
+            record (logging.LogRecord): The prepared record.
+        """
+        # put_nowait() never blocks, so holding the handler lock is cheap; it
+        # keeps the counters right when several threads log at once
+        with self.lock:
+            if self._unreported:
+                # Report earlier drops ahead of the record that made it through
+                notice = logging.LogRecord(
+                    __name__, logging.WARNING, __file__, 0,
+                    "%d log record(s) dropped, logging queue was full", (self._unreported,), None
+                )
+                try:
+                    self.queue.put_nowait(self.prepare(notice))
+                    self._unreported = 0
+                except queue.Full:
+                    pass
+
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+                self._unreported += 1
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the most recent records in a fixed-size in-memory buffer.
+
+    Appending is O(1) and memory is bounded by the capacity; the oldest
+    records are discarded first. The shared queue handler feeds it the
+    records it has already prepared (see BoundedQueueHandler), in the thread
+    that logs. Appends and snapshots hold the handler lock, since any thread
+    may log while another takes a snapshot.
+
+    Inherits from:
+        logging.Handler
+    """
+    vfxpipe_shared = True
+
+    def __init__(self, capacity=DEFAULT_RING_SIZE):
+        super().__init__()
+        self.records = collections.deque(maxlen=max(1, capacity))
+
+    def emit(self, record):
+        """
+        Store a resolved copy of a record in the buffer.
+
+        Args:
+            record (logging.LogRecord): The log record to keep.
+        """
+        self.append(_resolved(record))
+
+    def append(self, record):
+        """
+        Store a record that is already resolved (see _resolved()).
+
+        Args:
+            record (logging.LogRecord): The resolved record to keep.
+        """
+        with self.lock:
+            self.records.append(record)
+
+    def snapshot(self, node=None, limit=50, max_message=500):
+        """
+        Get a compact copy of the most recent records.
+
+        Args:
+            node (str, optional): Only records carrying this 'node' field.
+            limit (int): Maximum number of records, the newest are kept.
+            max_message (int): Messages are truncated to this many characters.
+
+        Returns:
+            list: Dictionaries in chronological order.
+        """
+        with self.lock:
+            records = list(self.records)
+
+        selected = []
+        for record in reversed(records):
+            if node is not None and getattr(record, 'node', None) != node:
+                continue
+            selected.append(record)
+            if len(selected) >= limit:
+                break
+
+        entries = []
+        for record in reversed(selected):
+            message = record.getMessage()
+            entry = {
+                'time': time.strftime(DATE_FORMAT, time.localtime(record.created))
+                        + f".{int(record.msecs):03d}",
+                'level': record.levelname,
+                'logger': record.name,
+                'msg': message if len(message) <= max_message else message[:max_message] + "...",
+            }
+            for key in SNAPSHOT_FIELDS:
+                value = getattr(record, key, None)
+                if value is not None:
+                    entry[key] = value
+            if record.exc_text:
+                entry['exc'] = record.exc_text.strip().splitlines()[-1]
+            entries.append(entry)
+        return entries
+
+
+class ContextFilter(logging.Filter):
+    """Adds the fields of the active log_context() blocks to each record."""
+
+    vfxpipe_shared = True
+
+    def filter(self, record):
+        for key, value in getattr(_context, 'fields', {}).items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class _LogListener(object):
+    """
+    Background thread passing queued records to the real handlers.
+
+    Works like logging.handlers.QueueListener with respect_handler_level,
+    except that stop() cannot hang on a full queue.
+    """
+
+    _sentinel = None
+
+    def __init__(self, log_queue, *handlers):
+        self.queue = log_queue
+        self.handlers = handlers
+        self._thread = None
+
+    def start(self):
+        """Start the listener thread."""
+        self._thread = threading.Thread(target=self._monitor, name="VfxPipe-log")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def handle(self, record):
+        """
+        Pass a record to each handler whose level it meets.
+
+        Args:
+            record (logging.LogRecord): The prepared record.
+        """
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _monitor(self):
+        while True:
+            record = self.queue.get()
+            if record is self._sentinel:
+                break
+            self.handle(record)
+
+    def stop(self, timeout=5.0):
+        """
+        Process the queued records and stop the listener thread.
+
+        Args:
+            timeout (float): Seconds to wait for the queue to drain.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        try:
+            self.queue.put(self._sentinel, timeout=timeout)
+        except queue.Full:
             pass
+        thread.join(timeout)
+        self._thread = None
+
+
+# Module state is kept across importlib.reload() so the pipeline stays
+# unique per process
+_setup_lock = globals().get('_setup_lock') or threading.Lock()
+_queue_handler = globals().get('_queue_handler')
+_listener = globals().get('_listener')
+_ring_handler = globals().get('_ring_handler')
+_registry = globals().get('_registry') or {}
+_context = globals().get('_context') or threading.local()
+_context_filter = ContextFilter()
+_levels = None
+
+
+def _env_number(name, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _queue_size():
+    return max(1, _env_number("VFXPIPE_LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE, int))
+
+
+def _get_queue_handler():
+    """
+    Get the shared queue handler, starting the listener on first use.
+
+    Returns:
+        BoundedQueueHandler: Handler attached to every VfxPipe logger.
+    """
+    global _queue_handler, _listener, _ring_handler
+
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        _ring_handler = RingBufferHandler(_env_number("VFXPIPE_LOG_RING_SIZE", DEFAULT_RING_SIZE, int))
+        _ring_handler.setLevel(logging.DEBUG)
+
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+        # Console handler
+        ch = logging.StreamHandler()
+        ch.setLevel(logging.DEBUG)
+        ch.setFormatter(formatter)
+
+        # Nuke Script Editor handler
+        nh = NukeHandler()
+        nh.setLevel(logging.DEBUG)
+        nh.setFormatter(formatter)
+
+        handlers = [ch, nh]
+
+        # Optional structured JSONL sink
+        if os.environ.get("VFXPIPE_RUNLOG_DIR"):
+            try:
+                from VfxPipe.utils import runlog
+                handlers.append(runlog.create_handler())
+            except Exception as e:
+                print(f"[VfxPipe] WARNING: Could not open run log: {e}")
+
+        log_queue = queue.Queue(maxsize=_queue_size())
+        _listener = _LogListener(log_queue, *handlers)
+        _listener.start()
+        atexit.register(shutdown)
+
+        _queue_handler = BoundedQueueHandler(log_queue, ring=_ring_handler)
+        _queue_handler.setLevel(logging.DEBUG)
+        return _queue_handler
+
+
+def _parse_level(value):
+    """
+    Convert a level name or number into a logging level.
+
+    Args:
+        value (str or int): Level such as "INFO", "debug" or 20.
+
+    Returns:
+        int or None: The logging level, or None if it is not valid.
+    """
+    if isinstance(value, int):
+        return value
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else None
+
+
+def _parse_level_list(text):
+    """Parse "name=LEVEL,name=LEVEL" into a dictionary."""
+    levels = {}
+    for item in text.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip():
+            levels[name.strip()] = value.strip()
+    return levels
+
+
+def load_level_config():
+    """
+    Read the per-logger levels from VFXPIPE_LOG_CONFIG and VFXPIPE_LOG_LEVELS.
+
+    Invalid entries are reported and ignored.
+
+    Returns:
+        dict: Mapping of logger names ("*" for the default) to levels.
+    """
+    configured = {}
+
+    config_path = os.environ.get("VFXPIPE_LOG_CONFIG")
+    if config_path:
+        try:
+            import json
+            with open(os.path.expanduser(config_path), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            configured.update((data or {}).get("levels") or {})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"[VfxPipe] WARNING: Could not read log config {config_path}: {e}")
+
+    configured.update(_parse_level_list(os.environ.get("VFXPIPE_LOG_LEVELS", "")))
+
+    levels = {}
+    for name, value in configured.items():
+        level = _parse_level(value)
+        if level is None:
+            print(f"[VfxPipe] WARNING: Invalid log level '{value}' for logger '{name}'")
+            continue
+        levels[name] = level
+    return levels
+
+
+def resolve_level(module_name):
+    """
+    Get the configured level for a logger name.
+
+    The most specific match wins: the name itself, then its dotted parents,
+    then the "*" default.
+
+    Args:
+        module_name (str): Logger name.
+
+    Returns:
+        int: Logging level.
+    """
+    global _levels
+    if _levels is None:
+        _levels = load_level_config()
+
+    name = module_name
+    while name:
+        if name in _levels:
+            return _levels[name]
+        name = name.rpartition(".")[0]
+    return _levels.get("*", DEFAULT_LEVEL)
+
+
+def configure_levels(levels=None):
+    """
+    Apply per-logger levels to every logger created by getLogger().
+
+    Args:
+        levels (dict, optional): Mapping of logger names to levels. Re-reads
+            VFXPIPE_LOG_CONFIG and VFXPIPE_LOG_LEVELS when omitted.
+    """
+    global _levels
+    if levels is None:
+        _levels = load_level_config()
+    else:
+        _levels = {}
+        for name, value in levels.items():
+            level = _parse_level(value)
+            if level is not None:
+                _levels[name] = level
+
+    with _setup_lock:
+        loggers = list(_registry.values())
+    for logger in loggers:
+        logger.setLevel(resolve_level(logger.name))
+
+
+def get_registered_loggers():
+    """
+    Get the names of the loggers created by getLogger().
+
+    Returns:
+        list: Sorted logger names.
+    """
+    with _setup_lock:
+        return sorted(_registry)
+
+
+class lazy(object):
+    """
+    Log argument computed only if the record is actually formatted.
+
+    Examples:
+        >>> logger.debug("Parameters: %s", lazy(lambda: json.dumps(params, indent=2)))
+    """
+    __slots__ = ('func',)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __str__(self):
+        return str(self.func())
+
+    __repr__ = __str__
+
+
+class LogThrottle(object):
+    """
+    Rate limiting and sampling for log calls inside hot loops.
+
+    Limits apply per call site (file and line of the caller), so one noisy
+    line does not silence the others. Calls below the logger's level return
+    before any work is done; use %-style arguments (and lazy() for costly
+    values) so nothing is formatted for records that are not emitted.
+    Suppressed records are counted and reported by log_summary().
+
+    Examples:
+        >>> throttle = LogThrottle(logger)
+        >>> for i in range(5000):
+        ...     throttle.every_n(100, logging.DEBUG, "Iteration %d", i)
+        ...     throttle.sample(i, 5000, 100, logging.DEBUG, "Item %d of 5000", i)
+        ...     throttle.at_most(1.0, logging.INFO, "Progress %d%%", i // 50)
+        >>> throttle.log_summary()
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._seen = {}
+        self._last = {}
+        self._suppressed = {}
+
+    def _call_site(self):
+        frame = sys._getframe(2)
+        return frame.f_code.co_filename, frame.f_lineno
+
+    def every_n(self, n, level, msg, *args, **kwargs):
+        """
+        Log 1 in n calls from this call site (the 1st, n+1th, ...).
+
+        Args:
+            n (int): Sampling period.
+            level (int): Logging level.
+            msg (str): %-style message.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        site = self._call_site()
+        with self._lock:
+            count = self._seen.get(site, 0)
+            self._seen[site] = count + 1
+            if n > 1 and count % n:
+                self._suppress(site, msg)
+                return
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def sample(self, index, total, n, level, msg, *args, last=False, **kwargs):
+        """
+        Log item index of a loop over total items if it is the first, the
+        last or a multiple of n, so short loops are still logged at both ends.
+
+        Args:
+            index (int): Zero-based position in the loop.
+            total (int): Number of items the loop runs at most.
+            n (int): Sampling period.
+            level (int): Logging level.
+            msg (str): %-style message.
+            last (bool): The loop stops after this item, before total. Loops
+                that break early pass it so their real last item is logged.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        if not last and index != 0 and index != total - 1 and (n <= 1 or index % n):
+            site = self._call_site()
+            with self._lock:
+                self._suppress(site, msg)
+            return
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def at_most(self, interval, level, msg, *args, **kwargs):
+        """
+        Log at most once per interval from this call site.
+
+        Args:
+            interval (float): Minimum seconds between two records.
+            level (int): Logging level.
+            msg (str): %-style message.
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+        site = self._call_site()
+        now = time.monotonic()
+        with self._lock:
+            last = self._last.get(site)
+            if last is not None and now - last < interval:
+                self._suppress(site, msg)
+                return
+            self._last[site] = now
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def _suppress(self, site, msg):
+        entry = self._suppressed.get(site)
+        if entry is None:
+            self._suppressed[site] = [msg, 1]
+        else:
+            entry[1] += 1
+
+    def suppressed(self):
+        """
+        Get the number of suppressed records per call site.
+
+        Returns:
+            dict: "file:line" mapped to the suppressed count.
+        """
+        with self._lock:
+            return {f"{os.path.basename(f)}:{line}": entry[1]
+                    for (f, line), entry in self._suppressed.items()}
+
+    def log_summary(self, level=logging.INFO, reset=True):
+        """
+        Log how many records each call site suppressed.
+
+        Args:
+            level (int): Level of the summary records.
+            reset (bool): Start counting from zero afterwards.
+        """
+        with self._lock:
+            entries = sorted(self._suppressed.items())
+            if reset:
+                self._seen.clear()
+                self._last.clear()
+                self._suppressed.clear()
+        for (filename, line), (msg, count) in entries:
+            self.logger.log(level, "Suppressed %d record(s) from %s:%d (%s)",
+                            count, os.path.basename(filename), line, msg)
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    Attach fields to every record logged by this thread inside the block.
+
+    Examples:
+        >>> with log_context(node="CameraTracker1"):
+        ...     logger.info("Solving")    # record.node == "CameraTracker1"
+
+    Args:
+        **fields: Record attributes, e.g. node or stage.
+    """
+    previous = getattr(_context, 'fields', {})
+    _context.fields = dict(previous, **fields)
+    try:
+        yield
+    finally:
+        _context.fields = previous
+
+
+def snapshot(node=None, limit=50):
+    """
+    Get the most recent log records of this process from the ring buffer.
+
+    Args:
+        node (str, optional): Only records of this node (see log_context()).
+        limit (int): Maximum number of records.
+
+    Returns:
+        list: Compact record dictionaries, oldest first.
+    """
+    if _ring_handler is None:
+        return []
+    return _ring_handler.snapshot(node=node, limit=limit)
+
+
+def get_dropped_count():
+    """
+    Get the number of records dropped because the logging queue was full.
+
+    Returns:
+        int: Dropped record count for this process.
+    """
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def shutdown():
+    """
+    Flush the logging queue and stop the listener thread.
+
+    Registered with atexit; safe to call more than once.
+    """
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+    if _queue_handler is not None and _queue_handler.dropped:
+        print(f"[VfxPipe] {_queue_handler.dropped} log record(s) were dropped, logging queue was full")
+
 
 def getLogger(module_name):
     """
     Creates and configures a logger instance for the given module name.
 
     The logger is configured with:
-      - A standard stream handler that outputs to the console.
-      - A custom NukeHandler that prints to Nuke's Script Editor.
+      - The shared queue handler; records are written by a background
+        listener to the console and to Nuke's Script Editor.
       - A consistent formatter with time, level, and module info.
+      - Its configured level (see resolve_level(), DEBUG by default).
+
+    Calling it again for the same name returns the same logger unchanged.
 
     Args:
         module_name (str): The name of the module using the logger.
@@ -48,27 +848,33 @@ def getLogger(module_name):
     Returns:
         logging.Logger: A configured logger instance for use.
     """
-    # Create a logger for this module
-    logger = logging.getLogger(module_name)
-    logger.setLevel(logging.DEBUG)  # Set minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-    logger.propagate = False
-    # Create console handler and set its log level
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG)
-
-    # Create formatter and attach it to the handler
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s:VFXP:%(name)s: %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    ch.setFormatter(formatter)
-
-    # Add the handler to the logger
-    logger.addHandler(ch)
-
-    nh = NukeHandler()
-    nh.setLevel(logging.DEBUG)
-    nh.setFormatter(formatter)
-    logger.addHandler(nh)
-
-    return logger
\ No newline at end of file
+    handler = _get_queue_handler()
+    shared = (handler,)
+
+    with _setup_lock:
+        logger = _registry.get(module_name)
+        if logger is not None and all(h in logger.handlers for h in shared):
+            return logger
+
+        # Create a logger for this module
+        logger = logging.getLogger(module_name)
+        logger.propagate = False
+
+        # Drop handlers and filters left behind by older versions of this module
+        for stale in list(logger.handlers):
+            if stale not in shared and (getattr(stale, 'vfxpipe_shared', False)
+                                        or type(stale).__name__ in ('NukeHandler', 'StreamHandler')):
+                logger.removeHandler(stale)
+        for stale in list(logger.filters):
+            if getattr(stale, 'vfxpipe_shared', False):
+                logger.removeFilter(stale)
+
+        # Loggers only enqueue (the queue handler also keeps recent records
+        # in memory); the listener thread owns the real handlers
+        logger.addFilter(_context_filter)
+        for shared_handler in shared:
+            logger.addHandler(shared_handler)
+        _registry[module_name] = logger
+
+    logger.setLevel(resolve_level(module_name))
+    return logger
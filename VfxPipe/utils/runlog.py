@@ -0,0 +1,366 @@
+"""
+Structured Run Logs
+
+Optional JSON Lines sink for the VfxPipe logging pipeline. When
+VFXPIPE_RUNLOG_DIR is set, every log record is also written as one JSON
+object per line, with the structured fields tools attach through
+fields() (node, stage, iteration, rmse, duration, queue_wait) plus the run ID, show,
+host and process.
+
+A run ID ties together the logs of one run across processes: it is read from
+VFXPIPE_RUN_ID, or generated and exported to VFXPIPE_RUN_ID so that child
+processes (nuke -t workers, farm jobs) inherit it.
+
+Files rotate by size and rotated files are gzip compressed. Each process
+writes its own file, since rotation is not safe across processes.
+
+The module is also a small query tool that streams through the logs
+(plain or gzip) without loading whole files:
+
+    python -m VfxPipe.utils.runlog filter --run-id 3f2a... --stage refine
+    python -m VfxPipe.utils.runlog stats --stage solve --field duration --by show
+
+Environment variables:
+    VFXPIPE_RUNLOG_DIR: Directory for the JSONL files (unset = sink disabled)
+    VFXPIPE_RUNLOG_MAX_BYTES: Size at which a file is rotated (default: 50 MB)
+    VFXPIPE_RUNLOG_BACKUPS: Number of rotated files kept per process (default: 10)
+    VFXPIPE_RUN_ID: Correlation ID of the current run
+    VFXPIPE_SHOW: Show name recorded with each event (falls back to SHOW)
+"""
+
+import json
+import logging
+import logging.handlers
+import math
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+# Structured fields tools can attach to a record
+STRUCTURED_FIELDS = ('node', 'stage', 'iteration', 'rmse', 'duration', 'queue_wait')
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUPS = 10
+
+
+def is_enabled() -> bool:
+    """
+    Check if the JSONL sink is enabled.
+
+    Returns:
+        True if VFXPIPE_RUNLOG_DIR is set
+    """
+    return bool(os.environ.get("VFXPIPE_RUNLOG_DIR"))
+
+
+def get_log_dir() -> Optional[Path]:
+    """
+    Get the run log directory.
+
+    Returns:
+        Path from VFXPIPE_RUNLOG_DIR, or None when unset
+    """
+    value = os.environ.get("VFXPIPE_RUNLOG_DIR")
+    return Path(value).expanduser() if value else None
+
+
+def get_run_id() -> str:
+    """
+    Get the correlation ID of the current run, creating it if needed.
+
+    A new ID is exported to VFXPIPE_RUN_ID so child processes share it.
+
+    Returns:
+        Run ID string
+    """
+    run_id = os.environ.get("VFXPIPE_RUN_ID")
+    if not run_id:
+        import uuid
+        run_id = uuid.uuid4().hex[:16]
+        os.environ["VFXPIPE_RUN_ID"] = run_id
+    return run_id
+
+
+def fields(node: Optional[str] = None, stage: Optional[str] = None,
+           iteration: Optional[int] = None, rmse: Optional[float] = None,
+           duration: Optional[float] = None, queue_wait: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Build the 'extra' dictionary for a structured log call.
+
+    duration is the time spent doing the work; queue_wait is the time spent
+    waiting for Nuke's main thread before it started.
+
+    Examples:
+        >>> logger.info("Solve done", extra=fields(node="CameraTracker1", stage="solve", rmse=0.42))
+
+    Returns:
+        Dictionary with the given fields, None values left out
+    """
+    values = {'node': node, 'stage': stage, 'iteration': iteration, 'rmse': rmse,
+              'duration': duration, 'queue_wait': queue_wait}
+    return {key: value for key, value in values.items() if value is not None}
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Formats a record as a single-line JSON object."""
+
+    def __init__(self, run_id: Optional[str] = None):
+        super().__init__()
+        self.run_id = run_id or get_run_id()
+        self.host = socket.gethostname()
+        self.show = os.environ.get("VFXPIPE_SHOW") or os.environ.get("SHOW")
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            'ts': round(record.created, 6),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+            'run_id': self.run_id,
+            'show': self.show,
+            'host': self.host,
+            'pid': record.process,
+            'thread': record.threadName,
+        }
+        for key in STRUCTURED_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                event[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            event['exc'] = record.exc_text
+        return json.dumps(event, default=str, ensure_ascii=False)
+
+
+def _gzip_rotator(source: str, dest: str):
+    """Compress a rotated log file into dest and remove the original."""
+    import gzip
+    import shutil
+
+    with open(source, "rb") as f_in, gzip.open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def create_handler(directory: Optional[Path] = None) -> logging.Handler:
+    """
+    Create the rotating JSONL handler for this process.
+
+    Args:
+        directory: Target directory (default: VFXPIPE_RUNLOG_DIR)
+
+    Returns:
+        RotatingFileHandler writing JSON lines, with gzip compressed backups
+    """
+    directory = Path(directory) if directory else get_log_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"vfxpipe-{socket.gethostname()}-{os.getpid()}.jsonl"
+
+    handler = logging.handlers.RotatingFileHandler(
+        path,
+        maxBytes=_env_int("VFXPIPE_RUNLOG_MAX_BYTES", DEFAULT_MAX_BYTES),
+        backupCount=_env_int("VFXPIPE_RUNLOG_BACKUPS", DEFAULT_BACKUPS),
+        encoding="utf-8",
+        delay=True,
+    )
+    handler.namer = lambda name: name + ".gz"
+    handler.rotator = _gzip_rotator
+    handler.setFormatter(JsonLineFormatter())
+    handler.setLevel(logging.DEBUG)
+    return handler
+
+
+# -----------------------------------------------------------------------------
+# Query tool
+# -----------------------------------------------------------------------------
+
+def _expand_paths(paths: Iterable[str]) -> List[Path]:
+    """Expand directories into their run log files, oldest rotation first."""
+    files = []
+    for path in paths:
+        path = Path(path).expanduser()
+        if path.is_dir():
+            found = [p for p in path.iterdir() if p.is_file() and ".jsonl" in p.name]
+            # vfxpipe-host-pid.jsonl.3.gz, ... .1.gz, then the live file
+            files.extend(sorted(found, key=lambda p: (p.name.split(".jsonl")[0], -_rotation_index(p))))
+        else:
+            files.append(path)
+    return files
+
+
+def _rotation_index(path: Path) -> int:
+    suffix = path.name.split(".jsonl", 1)[1].strip(".")
+    number = suffix.split(".", 1)[0]
+    return int(number) if number.isdigit() else 0
+
+
+def iter_events(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream events from run log files, one line at a time.
+
+    Args:
+        paths: Files or directories (plain or gzip compressed)
+
+    Yields:
+        Event dictionaries; malformed lines are skipped
+    """
+    for path in _expand_paths(paths):
+        try:
+            if path.suffix == ".gz":
+                import gzip
+                handle = gzip.open(path, "rt", encoding="utf-8")
+            else:
+                handle = open(path, "r", encoding="utf-8")
+        except OSError as e:
+            print(f"runlog: cannot read {path}: {e}", file=sys.stderr)
+            continue
+
+        with handle:
+            for line in handle:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    yield event
+
+
+def _matches(event: Dict[str, Any], args) -> bool:
+    if args.run_id and event.get('run_id') != args.run_id:
+        return False
+    if args.node and event.get('node') != args.node:
+        return False
+    if args.stage and event.get('stage') != args.stage:
+        return False
+    if args.show and event.get('show') != args.show:
+        return False
+    if args.level and logging.getLevelName(event.get('level', 'NOTSET')) < args.level:
+        return False
+    for key, value in args.where:
+        if str(event.get(key)) != value:
+            return False
+    return True
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+
+    Args:
+        sorted_values: Sorted numbers
+        fraction: Percentile as a fraction (0.95 for p95)
+
+    Returns:
+        The percentile value
+    """
+    if not sorted_values:
+        return float('nan')
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def _cmd_filter(args) -> int:
+    for event in iter_events(args.paths):
+        if _matches(event, args):
+            sys.stdout.write(json.dumps(event, ensure_ascii=False) + "\n")
+    return 0
+
+
+def _cmd_stats(args) -> int:
+    from array import array
+
+    # Only the numeric values are kept, one compact array per group
+    groups = {}
+    for event in iter_events(args.paths):
+        if not _matches(event, args):
+            continue
+        value = event.get(args.field)
+        if not isinstance(value, (int, float)):
+            continue
+        key = str(event.get(args.by)) if args.by else "all"
+        groups.setdefault(key, array('d')).append(value)
+
+    if not groups:
+        print("No matching events")
+        return 1
+
+    print(f"{args.by or 'group':<24} {'count':>8} {'mean':>10} {'p50':>10} {'p95':>10} {'max':>10}")
+    for key in sorted(groups):
+        values = sorted(groups[key])
+        mean = sum(values) / len(values)
+        print(f"{key:<24} {len(values):>8} {mean:>10.4f} {percentile(values, 0.5):>10.4f} "
+              f"{percentile(values, 0.95):>10.4f} {values[-1]:>10.4f}")
+    return 0
+
+
+def _parse_where(text: str):
+    key, sep, value = text.partition("=")
+    if not sep:
+        raise ValueError(text)
+    return key, value
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the query tool.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m VfxPipe.utils.runlog",
+                                     description="Query VfxPipe structured run logs.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    def add_common(sub):
+        sub.add_argument("paths", nargs="*", help="Run log files or directories (default: VFXPIPE_RUNLOG_DIR)")
+        sub.add_argument("--run-id", help="Only events of this run")
+        sub.add_argument("--node", help="Only events of this node")
+        sub.add_argument("--stage", help="Only events of this stage")
+        sub.add_argument("--show", help="Only events of this show")
+        sub.add_argument("--level", type=lambda v: logging.getLevelName(v.upper()),
+                         help="Minimum level (e.g. WARNING)")
+        sub.add_argument("--where", action="append", default=[], type=_parse_where, metavar="FIELD=VALUE",
+                         help="Only events whose field equals the value (repeatable)")
+
+    add_common(subparsers.add_parser("filter", help="Print matching events as JSON lines"))
+    stats = subparsers.add_parser("stats", help="Aggregate a numeric field (count, mean, p50, p95, max)")
+    add_common(stats)
+    stats.add_argument("--field", default="duration", help="Numeric field to aggregate (default: duration)")
+    stats.add_argument("--by", default="show", help="Field to group by (default: show, '' for no grouping)")
+
+    args = parser.parse_args(argv)
+    if args.level is not None and not isinstance(args.level, int):
+        parser.error(f"invalid level: {args.level}")
+    if not args.paths:
+        log_dir = get_log_dir()
+        if log_dir is None:
+            parser.error("no paths given and VFXPIPE_RUNLOG_DIR is not set")
+        args.paths = [str(log_dir)]
+
+    try:
+        if args.command == "filter":
+            return _cmd_filter(args)
+        return _cmd_stats(args)
+    except BrokenPipeError:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Solve Refinement Benchmark
+
+Counts the update solves each refinement strategy needs to bring a
+CameraTracker below a target RMSE. Auto Track runs headless against the
+stand-in nuke module in benchmarks/stubs, whose simulated solver derives the
+RMSE from the track thresholds (see stubs/nuke.py solve_rmse()), so the
+counts are deterministic and only depend on the strategy.
+
+Usage:
+    python benchmarks/refinement_solves.py
+    python benchmarks/refinement_solves.py --targets 2.0 1.0 0.5 --max-iter 30
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).parent.resolve()
+ROOT_DIR = BENCH_DIR.parent
+STUBS_DIR = BENCH_DIR / "stubs"
+
+DEFAULT_TARGETS = (1.5, 1.0, 0.6)
+
+
+def count_solves(strategy, target_rmse, max_iter=20):
+    """
+    Run Auto Track on one simulated CameraTracker.
+
+    Args:
+        strategy: Refinement strategy name
+        target_rmse: Target RMSE (controlError)
+        max_iter: Refinement iteration limit
+
+    Returns:
+        Result dictionary of the node (see auto_track.run_batch())
+    """
+    import nuke
+    from VfxPipe.nuke.tools import auto_track
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script = Path(temp_dir) / "shot.nk"
+        nuke.scriptClear()
+        nuke.createNode("CameraTracker")
+        nuke.scriptSaveAs(str(script))
+        params = {'refine_strategy': strategy, 'controlError': target_rmse, 'max_iter': max_iter}
+        summary = auto_track.run_batch(script, ["CameraTracker1"], params, save=False)
+    return summary['nodes'][0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count the update solves of each refinement strategy")
+    parser.add_argument("--targets", type=float, nargs="+", default=list(DEFAULT_TARGETS),
+                        help="Target RMSE values")
+    parser.add_argument("--max-iter", type=int, default=20, help="Refinement iteration limit")
+    args = parser.parse_args(argv)
+
+    sys.path[:0] = [str(STUBS_DIR), str(ROOT_DIR)]
+    logging.disable(logging.CRITICAL)
+    from VfxPipe.nuke.tracking import refinement
+
+    names = list(refinement.STRATEGIES)
+    print(f"{'target':>8}" + "".join(f"{name:>18}" for name in names))
+    for target in args.targets:
+        cells = []
+        for name in names:
+            result = count_solves(name, target, args.max_iter)
+            mark = "" if result.get('converged') else "*"
+            cells.append(f"{result['iterations']}{mark} ({result['final_rmse']:.2f})")
+        print(f"{target:>8.2f}" + "".join(f"{cell:>18}" for cell in cells))
+    print("update solves (final RMSE); * = target not reached")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+VfxPipe Startup Benchmarks
+
+Measures the import and startup cost of VfxPipe without a licensed Nuke by
+running against the stand-in modules in benchmarks/stubs. Every sample runs
+in a fresh Python subprocess:
+
+- cold: empty bytecode cache (PYTHONPYCACHEPREFIX) and empty VfxPipe cache
+- warm: bytecode and VfxPipe caches populated by a previous run
+
+Results are compared against benchmarks/baselines.json and the script exits
+with status 1 when a benchmark is slower than its baseline by more than the
+regression threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --repeat 9 --threshold 0.25
+    python benchmarks/run_benchmarks.py --only initialize --json results.json
+    python benchmarks/run_benchmarks.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+BENCH_DIR = Path(__file__).parent.resolve()
+ROOT_DIR = BENCH_DIR.parent
+STUBS_DIR = BENCH_DIR / "stubs"
+DEFAULT_BASELINE = BENCH_DIR / "baselines.json"
+
+# Code run in the subprocess; prints the measured seconds as JSON
+_IMPORT_TEMPLATE = """
+import json, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"seconds": time.perf_counter() - start}}))
+"""
+
+_INITIALIZE_SNIPPET = """
+import contextlib, io, json, os, time
+os.environ["VFXPIPE_DEFERRED_INIT"] = "{deferred}"
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    from VfxPipe.nuke.startup import init
+    init.initialize()
+    seconds = time.perf_counter() - start
+    init.wait_for_background_init(60)
+print(json.dumps({{"seconds": seconds}}))
+"""
+
+BENCHMARKS = {
+    'import_vfxpipe': _IMPORT_TEMPLATE.format(module="VfxPipe"),
+    'import_host': _IMPORT_TEMPLATE.format(module="VfxPipe.utils.host"),
+    'import_auto_track': _IMPORT_TEMPLATE.format(module="VfxPipe.nuke.tools.auto_track"),
+    # Full synchronous startup, and the first stage of deferred startup
+    'initialize': _INITIALIZE_SNIPPET.format(deferred="0"),
+    'initialize_deferred': _INITIALIZE_SNIPPET.format(deferred="1"),
+}
+
+
+def _environment(pycache_dir, cache_dir, extra_env=None):
+    """Build the subprocess environment with stubs on sys.path."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [str(STUBS_DIR), str(ROOT_DIR)] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+    env['PYTHONPYCACHEPREFIX'] = str(pycache_dir)
+    env['VFXPIPE_CACHE_DIR'] = str(cache_dir)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env.pop('VFXPIPE_PROFILE_STARTUP', None)
+    env.update(extra_env or {})
+    return env
+
+
+def _run_once(code, env):
+    """Run a benchmark snippet in a fresh interpreter and return seconds."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env, cwd=str(ROOT_DIR),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark subprocess failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])['seconds']
+
+
+def run_benchmark(name, repeat=5, extra_env=None):
+    """
+    Run a benchmark in cold and warm mode.
+
+    Args:
+        name: Benchmark name (key of BENCHMARKS)
+        repeat: Number of samples per mode
+        extra_env: Additional environment variables for the subprocess
+
+    Returns:
+        Dictionary mapping "<name>.cold" / "<name>.warm" to median seconds
+    """
+    code = BENCHMARKS[name]
+    cold, warm = [], []
+
+    for _ in range(repeat):
+        work_dir = Path(tempfile.mkdtemp(prefix="vfxpipe_bench_"))
+        try:
+            env = _environment(work_dir / "pycache", work_dir / "cache", extra_env)
+            cold.append(_run_once(code, env))
+            warm.append(_run_once(code, env))
+        finally:
+            shutil.rmtree(str(work_dir), ignore_errors=True)
+
+    return {
+        f"{name}.cold": statistics.median(cold),
+        f"{name}.warm": statistics.median(warm),
+    }
+
+
+def compare(results, baselines, threshold):
+    """
+    Compare results against baselines.
+
+    Args:
+        results: Dictionary of benchmark name to seconds
+        baselines: Dictionary of benchmark name to baseline seconds
+        threshold: Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        List of (name, seconds, baseline, ratio, regressed) tuples
+    """
+    rows = []
+    for name, seconds in sorted(results.items()):
+        baseline = baselines.get(name)
+        if not baseline:
+            rows.append((name, seconds, None, None, False))
+            continue
+        ratio = seconds / baseline
+        rows.append((name, seconds, baseline, ratio, ratio > 1.0 + threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="VfxPipe startup benchmarks")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Samples per benchmark and mode (median is reported)")
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.environ.get("VFXPIPE_BENCH_THRESHOLD", "0.25")),
+                        help="Allowed relative slowdown before failing (default: 0.25)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store the results as the new baseline")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS),
+                        help="Run only the given benchmark (repeatable)")
+    parser.add_argument("--qt-import-delay", type=float, default=0.0,
+                        help="Seconds the stand-in PySide import sleeps, to emulate real Qt")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    extra_env = {'VFXPIPE_STUB_QT_IMPORT_DELAY': str(args.qt_import_delay)}
+
+    results = {}
+    for name in args.only or sorted(BENCHMARKS):
+        results.update(run_benchmark(name, repeat=args.repeat, extra_env=extra_env))
+
+    baseline_data = {}
+    if args.baseline.exists():
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline_data = json.load(f)
+    baselines = baseline_data.get('benchmarks', {})
+
+    rows = compare(results, baselines, args.threshold)
+    print(f"{'benchmark':<28} {'median':>10} {'baseline':>10} {'ratio':>7}")
+    for name, seconds, baseline, ratio, regressed in rows:
+        baseline_str = f"{baseline * 1000:8.1f}ms" if baseline else "       n/a"
+        ratio_str = f"{ratio:6.2f}x" if ratio else "    n/a"
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<28} {seconds * 1000:8.1f}ms {baseline_str} {ratio_str}{flag}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'benchmarks': results, 'threshold': args.threshold}, f, indent=2)
+
+    if args.update_baseline:
+        baselines.update({name: round(seconds, 6) for name, seconds in results.items()})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({'python': sys.version.split()[0], 'benchmarks': baselines},
+                      f, indent=2, sort_keys=True)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""Stand-in PySide2.QtCore module for benchmarks."""
+
+from _qtstub import QObject, QThread, QTimer, Signal, make_module_getattr, simulate_import_cost
+
+simulate_import_cost()
+
+Slot = Signal
+__getattr__ = make_module_getattr()
@@ -0,0 +1,5 @@
+"""Stand-in PySide2.QtGui module for benchmarks."""
+
+from _qtstub import make_module_getattr
+
+__getattr__ = make_module_getattr()
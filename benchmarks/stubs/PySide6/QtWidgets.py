@@ -0,0 +1,5 @@
+"""Stand-in PySide6.QtWidgets module for benchmarks."""
+
+from _qtstub import make_module_getattr
+
+__getattr__ = make_module_getattr()
@@ -0,0 +1,3 @@
+"""Stand-in PySide6 package for benchmarks."""
+
+__version__ = "0.0.0-stub"
@@ -0,0 +1,136 @@
+"""
+Shared implementation of the stand-in PySide2/PySide6 modules.
+
+Every Qt class is a permissive placeholder: it accepts any constructor
+arguments and returns a placeholder for any attribute, so widget modules can
+be imported and instantiated without a real Qt installation.
+
+Environment variables:
+    VFXPIPE_STUB_QT_IMPORT_DELAY: Seconds to sleep when a Qt module is first
+                                  imported, to emulate the real PySide cost
+"""
+
+import os
+import threading
+import time
+
+
+def simulate_import_cost():
+    """Sleep for VFXPIPE_STUB_QT_IMPORT_DELAY seconds, if set."""
+    try:
+        delay = float(os.environ.get("VFXPIPE_STUB_QT_IMPORT_DELAY", "0"))
+    except ValueError:
+        delay = 0.0
+    if delay > 0:
+        time.sleep(delay)
+
+
+class Placeholder:
+    """Object that accepts any call and attribute access."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Placeholder()
+
+    def __call__(self, *args, **kwargs):
+        return Placeholder()
+
+    def __bool__(self):
+        return False
+
+    def __int__(self):
+        return 0
+
+    def __or__(self, other):
+        return self
+
+
+class _PlaceholderMeta(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Placeholder()
+
+
+class QObject(Placeholder, metaclass=_PlaceholderMeta):
+    """Base class for all stand-in Qt classes."""
+
+
+class _BoundSignal:
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self._slots = []
+        elif slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args):
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class Signal:
+    """Descriptor emulating Qt signals with synchronous delivery."""
+
+    def __init__(self, *types):
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = f"_signal_{name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        bound = instance.__dict__.get(self._name)
+        if bound is None:
+            bound = instance.__dict__[self._name] = _BoundSignal()
+        return bound
+
+
+class QThread(QObject):
+    """QThread stand-in backed by threading.Thread."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._thread = None
+
+    def run(self):
+        pass
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def isRunning(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, msecs=None):
+        if self._thread is not None:
+            self._thread.join(None if msecs is None else msecs / 1000.0)
+        return True
+
+
+class QTimer(QObject):
+    """QTimer stand-in; singleShot runs the callback immediately."""
+
+    @staticmethod
+    def singleShot(msecs, callback):
+        callback()
+
+
+def make_module_getattr():
+    """Build a module __getattr__ returning placeholder classes."""
+    def __getattr__(name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return type(name, (QObject,), {})
+    return __getattr__
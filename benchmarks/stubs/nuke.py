@@ -0,0 +1,403 @@
+"""
+Stand-in ``nuke`` module for benchmarks.
+
+Implements just enough of the Nuke Python API for VfxPipe startup and tool
+imports to run outside of a licensed Nuke session. Main-thread helpers run
+the callable inline.
+
+Scripts hold an in-memory node graph, enough for the tracking pipeline
+(auto_track, fan-out, daemon and coordinator workers) to run end to end.
+CameraTracker solves are simulated: the solve RMSE only depends on the track
+thresholds (see solve_rmse()), so refinement strategies can be compared by
+the number of solves they need. Scripts and snippets are written in a
+.nk-like format only this stub reads. Modules only the simulation needs are
+imported where they are used: in Nuke the real module is loaded before any
+tool, so the stand-in must not add to the measured import times.
+
+Environment variables:
+    VFXPIPE_STUB_NUKE_VERSION: Version string to report (default: "15.1v3")
+    VFXPIPE_STUB_NUKE_GUI: Set to 0 to emulate a terminal (nuke -t) session
+"""
+
+import os
+import re
+
+NUKE_VERSION_STRING = os.environ.get("VFXPIPE_STUB_NUKE_VERSION", "15.1v3")
+NUKE_VERSION_MAJOR = int(NUKE_VERSION_STRING.split('.')[0])
+NUKE_VERSION_MINOR = int(NUKE_VERSION_STRING.split('.')[1].split('v')[0])
+NUKE_VERSION_RELEASE = int(NUKE_VERSION_STRING.split('v')[-1])
+GUI = os.environ.get("VFXPIPE_STUB_NUKE_GUI", "1") != "0"
+
+
+class Menu:
+    """Menu stand-in recording the commands added to it."""
+
+    def __init__(self, name):
+        self._name = name
+        self._items = {}
+
+    def name(self):
+        return self._name
+
+    def addMenu(self, name, *args, **kwargs):
+        if name not in self._items:
+            self._items[name] = Menu(name)
+        return self._items[name]
+
+    def addCommand(self, name, command=None, shortcut=None, icon=None, tooltip=None, index=-1, **kwargs):
+        self._items.pop(name, None)
+        items = list(self._items.items())
+        if index is None or index < 0 or index > len(items):
+            index = len(items)
+        items.insert(index, (name, command))
+        self._items = dict(items)
+        return command
+
+    def addSeparator(self, *args, **kwargs):
+        return None
+
+    def findItem(self, name):
+        return self._items.get(name)
+
+    def removeItem(self, name):
+        self._items.pop(name, None)
+
+    def items(self):
+        return list(self._items.values())
+
+
+_menus = {}
+
+
+def menu(name):
+    if name not in _menus:
+        _menus[name] = Menu(name)
+    return _menus[name]
+
+
+# Knob values of a new CameraTracker
+CAMERA_TRACKER_DEFAULTS = {
+    'trackStart': 1,
+    'trackStop': 100,
+    'tracks': [],
+    'solveRMSE': 0.0,
+    'minLengthThreshold': 0,
+    'maxRMSEThreshold': 5.0,
+    'maxErrorThreshold': 5.0,
+}
+
+# Tracks created by trackFeatures
+FEATURE_TRACKS = 200
+
+# Node classes created by createNode() under another name
+NODE_CLASSES = {'Camera': "Camera3"}
+
+WRITE_NON_DEFAULT_ONLY = 0x1
+TO_SCRIPT = 0x2
+
+
+def solve_rmse(min_length: int, max_error: float) -> float:
+    """
+    Simulated solve RMSE of a CameraTracker.
+
+    Starts at 3.0 with the default thresholds and improves by 0.15 per frame
+    of minimum track length and by 0.2 per pixel of maximum error removed,
+    down to a floor of 0.2.
+    """
+    return max(0.2, 3.0 - 0.15 * min_length - 0.2 * (5.0 - max_error))
+
+
+class Knob:
+    """Knob holding a value or an expression."""
+
+    def __init__(self, node, name, value=0.0):
+        self.node = node
+        self._name = name
+        self._value = value
+        self._expression = None
+        self._animation = {}
+
+    def name(self):
+        return self._name
+
+    def value(self, *args):
+        return self._value
+
+    def getValue(self, *args):
+        return self._value
+
+    def setValue(self, value, *args):
+        self._value = value
+        return True
+
+    def setValueAt(self, value, time, *args):
+        self._animation[time] = value
+
+    def setAnimated(self, *args):
+        return True
+
+    def clearAnimated(self, *args):
+        self._animation = {}
+
+    def hasExpression(self, *args):
+        return self._expression is not None
+
+    def setExpression(self, expression, *args):
+        self._expression = expression
+        return True
+
+    def toScript(self, quote=True, context=None):
+        if self._expression is not None:
+            return "{" + self._expression + "}"
+        import json
+        return json.dumps(self._value)
+
+    def fromScript(self, text):
+        if text.startswith("{") and text.endswith("}"):
+            self._expression = text[1:-1]
+        else:
+            import json
+            self._expression = None
+            self._value = json.loads(text)
+        return True
+
+    def execute(self):
+        self.node._execute(self._name)
+
+
+class Node:
+    """Node of the stand-in graph. Knobs are created on first access."""
+
+    def __init__(self, node_class, name):
+        self._class = node_class
+        self._name = name
+        self._knobs = {}
+        self._position = (0, 0)
+        self.solves = 0
+        if node_class == "CameraTracker":
+            for knob_name, value in CAMERA_TRACKER_DEFAULTS.items():
+                self._knobs[knob_name] = Knob(self, knob_name, list(value) if isinstance(value, list) else value)
+
+    def __getitem__(self, name):
+        if name not in self._knobs:
+            self._knobs[name] = Knob(self, name, False if name == 'selected' else 0.0)
+        return self._knobs[name]
+
+    def __repr__(self):
+        return f"<{self._class} {self._name}>"
+
+    knob = __getitem__
+
+    def knobs(self):
+        return dict(self._knobs)
+
+    def name(self):
+        return self._name
+
+    def fullName(self):
+        return self._name
+
+    def setName(self, name, *args, **kwargs):
+        _nodes.pop(self._name, None)
+        self._name = _unique_name(name)
+        _nodes[self._name] = self
+
+    def Class(self):
+        return self._class
+
+    def xpos(self):
+        return self._position[0]
+
+    def ypos(self):
+        return self._position[1]
+
+    def setXYpos(self, x, y):
+        self._position = (x, y)
+
+    def screenWidth(self):
+        return 80
+
+    def screenHeight(self):
+        return 18
+
+    def setInput(self, index, node):
+        return True
+
+    def showControlPanel(self, *args):
+        pass
+
+    def _execute(self, knob_name):
+        if self._class != "CameraTracker":
+            return
+        if knob_name == "trackFeatures":
+            self['tracks'].setValue(list(range(FEATURE_TRACKS)))
+        elif knob_name in ("solveCamera", "doUpdateSolve", "updateSolve"):
+            self.solves += 1
+            self['solveRMSE'].setValue(solve_rmse(self['minLengthThreshold'].value(),
+                                                  self['maxErrorThreshold'].value()))
+
+
+class Root(Node):
+    """Root node; entering it as a context is a no-op."""
+
+    def __init__(self):
+        super().__init__("Root", "Root")
+        self.modified_flag = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def modified(self):
+        return self.modified_flag
+
+    def setModified(self, modified):
+        self.modified_flag = bool(modified)
+
+    def writeKnobs(self, flags=0):
+        return ""
+
+
+_root = Root()
+_nodes = {}
+
+
+def _unique_name(name):
+    if name not in _nodes:
+        return name
+    base = re.sub(r"\d+$", "", name)
+    index = 1
+    while f"{base}{index}" in _nodes:
+        index += 1
+    return f"{base}{index}"
+
+
+def _write_nodes(path, nodes):
+    lines = []
+    for node in nodes:
+        lines.append(f"{node.Class()} {{")
+        lines.append(f" name {node.name()}")
+        for name, knob in node.knobs().items():
+            if name != 'selected':
+                lines.append(f" {name} {knob.toScript()}")
+        lines.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _read_nodes(path):
+    """Create the nodes of a script or snippet written by this stub."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    created = []
+    node = None
+    for line in lines:
+        stripped = line.strip()
+        if not line.startswith(" ") and stripped.endswith("{"):
+            node_class = stripped[:-1].strip()
+            node = None if node_class == "Root" else createNode(node_class, inpanel=False)
+            if node is not None:
+                created.append(node)
+        elif stripped == "}":
+            node = None
+        elif node is not None and stripped:
+            name, _, text = stripped.partition(" ")
+            if name == "name":
+                node.setName(text)
+            elif name != "inputs":
+                node[name].fromScript(text)
+    _root.setModified(True)
+    return created
+
+
+def root():
+    return _root
+
+
+def createNode(node_class, knobs="", inpanel=True):
+    name = re.sub(r"\d+$", "", node_class)
+    node = Node(NODE_CLASSES.get(node_class, node_class), _unique_name(f"{name}1"))
+    _nodes[node.name()] = node
+    _root.setModified(True)
+    return node
+
+
+def delete(node):
+    if _nodes.get(node.name()) is node:
+        del _nodes[node.name()]
+        _root.setModified(True)
+
+
+def toNode(name):
+    return _nodes.get(name)
+
+
+def allNodes(filter=None, group=None):
+    return [node for node in _nodes.values() if filter is None or node.Class() == filter]
+
+
+def selectedNodes(filter=None):
+    return [node for node in allNodes(filter) if node['selected'].value()]
+
+
+def nodeCopy(path):
+    _write_nodes(path, selectedNodes())
+    return True
+
+
+def nodePaste(path):
+    for node in selectedNodes():
+        node['selected'].setValue(False)
+    for node in _read_nodes(path):
+        node['selected'].setValue(True)
+
+
+def scriptClear(*args, **kwargs):
+    _nodes.clear()
+    _root._name = "Root"
+    _root.setModified(False)
+
+
+def scriptOpen(path):
+    scriptClear()
+    _read_nodes(path)
+    _root._name = os.path.abspath(path)
+    _root.setModified(False)
+
+
+def scriptSaveAs(path, overwrite=0):
+    _write_nodes(path, allNodes())
+    _root._name = os.path.abspath(path)
+    _root.setModified(False)
+
+
+def scriptSave(path=""):
+    scriptSaveAs(path or _root.name())
+
+
+def executeInMainThread(call, args=(), kwargs=None):
+    call(*args, **(kwargs or {}))
+
+
+def executeInMainThreadWithResult(call, args=(), kwargs=None):
+    return call(*args, **(kwargs or {}))
+
+
+def message(text):
+    print(text)
+
+
+def views():
+    return ["main"]
+
+
+def tcl(*args):
+    # Inputs are not modelled, so a node is its own top node
+    match = re.match(r"full_name \[topnode (\S+)\]$", " ".join(args))
+    return match.group(1) if match else ""
+
+
+def env():
+    return {"gui": GUI}
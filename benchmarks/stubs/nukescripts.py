@@ -0,0 +1 @@
+"""Stand-in ``nukescripts`` module for benchmarks."""
@@ -0,0 +1,6 @@
+"""Stand-in ``ticketSubmitter`` module for benchmarks."""
+
+
+def submit_ticket(exception=None, context=None, show_ui=True):
+    """Print the ticket instead of submitting it."""
+    print(f"[ticketSubmitter] {type(exception).__name__}: {exception} {context}")
@@ -0,0 +1,136 @@
+"""
+VfxPipe Deployment Bundle Builder
+
+Packs the VfxPipe package into a single zipimport archive containing
+precompiled bytecode, one archive per target Python version:
+
+    dist/VfxPipe-cp39.zip
+    dist/VfxPipe-cp310.zip
+    ...
+
+DCC_plugins/nuke/init.py prefers the archive matching the running
+interpreter and falls back to the source tree when none exists. Loading
+from one archive replaces the per-module stat/open round-trips of a source
+tree on network storage with a single open of the archive.
+
+Bytecode is interpreter specific, so every target version is compiled by
+its own interpreter: pass each one with --python.
+
+Usage:
+    python scripts/build_bundle.py
+    python scripts/build_bundle.py --python python3.9 --python python3.10
+    python scripts/build_bundle.py --include-source --output-dir /studio/deploy
+"""
+
+import argparse
+import importlib.util
+import marshal
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).parent.parent.resolve()
+PACKAGE_DIR = ROOT_DIR / "VfxPipe"
+DEFAULT_OUTPUT_DIR = ROOT_DIR / "dist"
+
+
+def bundle_name(version_info=None):
+    """
+    Get the archive file name for a Python version.
+
+    Args:
+        version_info: Version tuple (default: the running interpreter)
+
+    Returns:
+        str: Archive name, e.g. "VfxPipe-cp310.zip"
+    """
+    version_info = version_info or sys.version_info
+    return f"VfxPipe-cp{version_info[0]}{version_info[1]}.zip"
+
+
+def _compile_pyc(source_path, archive_name):
+    """Compile a source file into timestamp-based .pyc bytes."""
+    source = source_path.read_bytes()
+    code = compile(source, archive_name, "exec", dont_inherit=True, optimize=0)
+    stat = source_path.stat()
+    data = bytearray(importlib.util.MAGIC_NUMBER)
+    data.extend((0).to_bytes(4, "little"))  # flags: timestamp based
+    data.extend((int(stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little"))
+    data.extend((stat.st_size & 0xFFFFFFFF).to_bytes(4, "little"))
+    data.extend(marshal.dumps(code))
+    return bytes(data)
+
+
+def build(output_dir, include_source=False):
+    """
+    Build the archive for the running interpreter.
+
+    Args:
+        output_dir: Directory receiving the archive
+        include_source: Also store .py files (better tracebacks, larger archive)
+
+    Returns:
+        Path to the written archive
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    archive_path = output_dir / bundle_name()
+    tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+
+    sources = sorted(
+        p for p in PACKAGE_DIR.rglob("*.py")
+        if "__pycache__" not in p.parts
+    )
+
+    with zipfile.ZipFile(str(tmp_path), "w", zipfile.ZIP_DEFLATED) as archive:
+        for source_path in sources:
+            rel_path = source_path.relative_to(ROOT_DIR).as_posix()
+            # zipimport looks for "module.pyc" next to where "module.py" would be
+            archive.writestr(rel_path[:-3] + ".pyc", _compile_pyc(source_path, rel_path))
+            if include_source:
+                archive.write(str(source_path), rel_path)
+
+    os.replace(str(tmp_path), str(archive_path))
+    print(f"Built {archive_path} ({len(sources)} modules, {archive_path.stat().st_size} bytes)")
+    return archive_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the VfxPipe zipimport bundle")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="Directory receiving the archives (default: dist/)")
+    parser.add_argument("--python", action="append", default=[],
+                        help="Target interpreter to build for (repeatable, default: this one)")
+    parser.add_argument("--include-source", action="store_true",
+                        help="Store .py sources alongside the bytecode")
+    args = parser.parse_args(argv)
+
+    if not args.python:
+        start_time = time.time()
+        build(args.output_dir, include_source=args.include_source)
+        print(f"Done in {time.time() - start_time:.2f}s")
+        return 0
+
+    failed = 0
+    for interpreter in args.python:
+        cmd = [interpreter, str(Path(__file__).resolve()), "--output-dir", str(args.output_dir)]
+        if args.include_source:
+            cmd.append("--include-source")
+        try:
+            result = subprocess.run(cmd)
+        except OSError as e:
+            print(f"Could not run {interpreter}: {e}")
+            failed += 1
+            continue
+        if result.returncode != 0:
+            print(f"Build failed for {interpreter}")
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
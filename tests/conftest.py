@@ -0,0 +1,64 @@
+"""
+Test configuration.
+
+Tests run outside of Nuke against the stand-in modules in benchmarks/stubs,
+which also simulate CameraTracker solves (see benchmarks/stubs/nuke.py).
+"""
+
+import atexit
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+STUBS_DIR = ROOT_DIR / "benchmarks" / "stubs"
+
+for path in (str(ROOT_DIR), str(STUBS_DIR)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Tracking logs every step at DEBUG; keep test output to warnings and errors
+os.environ.setdefault("VFXPIPE_LOG_LEVELS", "*=WARNING")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def log_listener():
+    """Stop the log listener while pytest's captured streams are still open."""
+    yield
+    from VfxPipe.utils import logger
+
+    logger.shutdown()
+    atexit.unregister(logger.shutdown)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Private VfxPipe cache directory, inherited by worker processes."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("VFXPIPE_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def empty_script():
+    """Start and end every test with an empty stand-in script."""
+    import nuke
+
+    nuke.scriptClear()
+    yield
+    nuke.scriptClear()
+
+
+@pytest.fixture
+def shot_script(tmp_path):
+    """Saved script with three CameraTrackers; returns its path."""
+    import nuke
+
+    for _ in range(3):
+        nuke.createNode("CameraTracker")
+    path = tmp_path / "shot.nk"
+    nuke.scriptSaveAs(str(path))
+    nuke.scriptClear()
+    return path
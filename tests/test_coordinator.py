@@ -0,0 +1,28 @@
+"""Tests for the multi-host tracking coordinator."""
+
+from VfxPipe.nuke.tracking.coordinator import LocalFarm
+from VfxPipe.nuke.tracking.fanout import StandInLauncher
+
+
+def test_local_farm_runs_a_job(shot_script, tmp_path):
+    progress = []
+    farm = LocalFarm(agents=1, launcher=StandInLauncher(), log_dir=tmp_path / "farm")
+    client = farm.start()
+    processes = list(farm.processes)
+    try:
+        result = client.run_job(None, "CameraTracker2", {'controlError': 1.0, 'max_iter': 20},
+                                script_data=shot_script.read_text(encoding="utf-8"),
+                                on_progress=progress.append)
+        status = client.status()
+    finally:
+        farm.stop()
+
+    assert result['ok'], result.get('error')
+    assert result['agent'] == "local-0"
+    node = result['summary']['nodes'][0]
+    assert (node['node'], node['status'], node['iterations']) == ("CameraTracker2", "done", 8)
+    assert "cam_CameraTracker2" in result['snippet']
+    assert progress and all(msg.get('agent') == "local-0" for msg in progress)
+    assert [agent['jobs'] for agent in status['agents']] == [1]
+    # Agents exit when the coordinator stops
+    assert [process.returncode for process in processes] == [0]
@@ -0,0 +1,137 @@
+"""Tests for the warm tracking worker daemon."""
+
+import threading
+import time
+
+import pytest
+
+from VfxPipe.nuke.tracking.daemon import DaemonClient, TrackingDaemon
+from VfxPipe.nuke.tracking.fanout import StandInLauncher
+
+PARAMS = {'controlError': 1.0, 'max_iter': 20}
+
+# Stand-in worker whose script loading misbehaves as TEST_WORKER_MODE says:
+# "slow" hangs, "die" exits, "die-once" exits on the first job of the daemon
+WORKER = """
+import os, runpy, sys, time
+import nuke
+
+mode = os.environ.get("TEST_WORKER_MODE", "")
+marker = os.environ.get("TEST_WORKER_MARKER", "")
+script_open = nuke.scriptOpen
+
+def misbehaving_script_open(path):
+    if mode == "slow":
+        time.sleep(60)
+    if mode == "die" or (mode == "die-once" and not os.path.exists(marker)):
+        open(marker or os.devnull, "w").close()
+        os._exit(3)
+    return script_open(path)
+
+nuke.scriptOpen = misbehaving_script_open
+sys.argv = sys.argv[1:]
+runpy.run_module("VfxPipe.nuke.tracking.daemon", run_name="__main__")
+"""
+
+
+class _TestWorkerLauncher(StandInLauncher):
+    """Stand-in launcher running WORKER in front of the daemon's worker script."""
+
+    def __init__(self, env):
+        super().__init__(env=env)
+        self.args = ["-c", WORKER]
+
+
+def _wait_until(condition, timeout=60):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise TimeoutError("Condition not met in time")
+        time.sleep(0.05)
+
+
+def _ready_pids(daemon):
+    return [worker['pid'] for worker in daemon.status()['workers'] if worker['ready']]
+
+
+@pytest.fixture
+def start_daemon(tmp_path):
+    """Start a one-worker daemon in a thread; returns (daemon, client)."""
+    started = []
+
+    def start(launcher=None, **kwargs):
+        daemon = TrackingDaemon(workers=1, launcher=launcher or StandInLauncher(),
+                                log_dir=tmp_path / "daemon", **kwargs)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        started.append((daemon, thread))
+        _wait_until(lambda: _ready_pids(daemon))
+        return daemon, DaemonClient(daemon.host, daemon.port, daemon.token)
+
+    yield start
+    for daemon, thread in started:
+        daemon.stop()
+        thread.join(30)
+
+
+def test_daemon_runs_a_job(shot_script, start_daemon):
+    daemon, client = start_daemon()
+    [pid] = _ready_pids(daemon)
+
+    result = client.run_job(shot_script, "CameraTracker2", PARAMS)
+
+    assert result['ok'], result.get('error')
+    assert result['pid'] == pid
+    node = result['summary']['nodes'][0]
+    assert (node['node'], node['status'], node['iterations']) == ("CameraTracker2", "done", 8)
+    assert [worker['jobs'] for worker in daemon.status()['workers']] == [1]
+
+
+def test_worker_is_recycled_after_max_jobs(shot_script, start_daemon):
+    daemon, client = start_daemon(max_jobs=1)
+
+    first = client.run_job(shot_script, "CameraTracker1", PARAMS)
+    second = client.run_job(shot_script, "CameraTracker2", PARAMS)
+
+    assert first['ok'] and second['ok']
+    assert first['pid'] != second['pid']
+
+
+def test_cancelling_a_running_job_kills_its_worker(shot_script, start_daemon):
+    daemon, client = start_daemon(launcher=_TestWorkerLauncher({'TEST_WORKER_MODE': "slow"}))
+    [worker] = daemon._workers
+    process = worker.process
+    results = []
+    thread = threading.Thread(target=lambda: results.append(
+        client.run_job(shot_script, "CameraTracker1", PARAMS, job_id="slow-job")))
+    thread.start()
+    _wait_until(lambda: daemon.status()['workers'][0]['job'] == "slow-job")
+
+    client.cancel("slow-job")
+    thread.join(30)
+
+    [result] = results
+    assert (result['ok'], result['cancelled']) == (False, True)
+    assert process.wait(timeout=10) != 0
+    # The slot gets a new worker
+    _wait_until(lambda: _ready_pids(daemon) and _ready_pids(daemon) != [process.pid])
+
+
+def test_job_is_retried_once_when_its_worker_dies(shot_script, start_daemon, tmp_path):
+    env = {'TEST_WORKER_MODE': "die-once", 'TEST_WORKER_MARKER': str(tmp_path / "died")}
+    daemon, client = start_daemon(launcher=_TestWorkerLauncher(env))
+    [first_pid] = _ready_pids(daemon)
+
+    result = client.run_job(shot_script, "CameraTracker1", PARAMS)
+
+    assert result['ok'], result.get('error')
+    assert result['pid'] != first_pid
+
+
+def test_job_fails_when_its_worker_dies_twice(shot_script, start_daemon):
+    daemon, client = start_daemon(launcher=_TestWorkerLauncher({'TEST_WORKER_MODE': "die"}))
+
+    result = client.run_job(shot_script, "CameraTracker1", PARAMS)
+
+    assert not result['ok']
+    assert result['error'] == "Worker process died"
@@ -0,0 +1,48 @@
+"""Tests for tools registered through packaging entry points."""
+
+from VfxPipe.nuke.startup import entry_points
+
+
+def _install(site_dir, dist_name, tools):
+    info_dir = site_dir / f"{dist_name}-1.0.dist-info"
+    info_dir.mkdir(parents=True)
+    (info_dir / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {dist_name}\nVersion: 1.0\n\n",
+                                       encoding="utf-8")
+    lines = [f"[{entry_points.ENTRY_POINT_GROUP}]"] + [f"{name} = {value}" for name, value in tools.items()]
+    (info_dir / "entry_points.txt").write_text("[console_scripts]\nx = y:z\n\n" + "\n".join(lines) + "\n",
+                                               encoding="utf-8")
+
+
+def test_scan_reads_installed_distributions(tmp_path, monkeypatch):
+    _install(tmp_path / "site", "show-tools", {'shot_publish': "showtools.nuke.shot_publish",
+                                               'plate_check': "showtools.nuke.plates:register_tool [qc]"})
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+
+    tools = entry_points.scan_entry_points()
+
+    assert [(tool['name'], tool['module'], tool['register'], tool['dist']) for tool in tools] == [
+        ("plate_check", "showtools.nuke.plates", "register_tool", "show-tools"),
+        ("shot_publish", "showtools.nuke.shot_publish", "register", "show-tools"),
+    ]
+
+
+def test_first_installation_of_a_distribution_wins(tmp_path, monkeypatch):
+    _install(tmp_path / "old", "show-tools", {'shot_publish': "old.shot_publish"})
+    _install(tmp_path / "new", "show-tools", {'shot_publish': "new.shot_publish"})
+    monkeypatch.syspath_prepend(str(tmp_path / "old"))
+    monkeypatch.syspath_prepend(str(tmp_path / "new"))
+
+    [tool] = entry_points.scan_entry_points()
+
+    assert tool['module'] == "new.shot_publish"
+
+
+def test_cached_only_never_scans(tmp_path, monkeypatch):
+    _install(tmp_path / "site", "show-tools", {'shot_publish': "showtools.nuke.shot_publish"})
+    monkeypatch.syspath_prepend(str(tmp_path / "site"))
+
+    # Nothing cached yet: the first stage of startup gets no entry point tools
+    assert entry_points.find_entry_point_tools(cached_only=True) == []
+    assert [tool.name for tool in entry_points.find_entry_point_tools()] == ["shot_publish"]
+    # The scan above built the cache
+    assert [tool.name for tool in entry_points.find_entry_point_tools(cached_only=True)] == ["shot_publish"]
@@ -0,0 +1,34 @@
+"""Tests for the parallel Auto Track fan-out."""
+
+import nuke
+
+from VfxPipe.nuke.tracking.fanout import FanOut, StandInLauncher, snapshot_script
+from VfxPipe.nuke.tracking.merge import merge_snippet
+
+
+def test_fan_out_two_nodes_and_merge(shot_script, tmp_path):
+    nuke.scriptOpen(str(shot_script))
+    nuke.toNode("CameraTracker3")['solveRMSE'].setValue(9.0)
+    # Unsaved changes: the workers get a snapshot of the live script
+    nuke.root().setModified(True)
+    snapshot = snapshot_script(tmp_path / "snapshot.nk")
+    assert snapshot != shot_script
+
+    fan_out = FanOut(max_workers=2, launcher=StandInLauncher())
+    params = {'controlError': 1.0, 'max_iter': 20, 'refine_strategy': "bisect"}
+    try:
+        results = list(fan_out.run(snapshot, ["CameraTracker1", "CameraTracker2"], params))
+        assert sorted(result.node for result in results) == ["CameraTracker1", "CameraTracker2"]
+        for result in results:
+            assert result.ok, result.error
+            assert result.summary['iterations'] == 3
+            merged = merge_snippet(result.task.snippet, result.node)
+            assert merged['camera'] == f"cam_{result.node}"
+    finally:
+        fan_out.cleanup()
+
+    for name in ("CameraTracker1", "CameraTracker2"):
+        assert nuke.toNode(name)['solveRMSE'].value() < 1.0
+        assert nuke.toNode(f"cam_{name}").Class() == "Camera3"
+    assert nuke.toNode("CameraTracker3")['solveRMSE'].value() == 9.0
+    assert len(nuke.allNodes("CameraTracker")) == 3
@@ -0,0 +1,138 @@
+"""Tests for the VfxPipe logging helpers."""
+
+import logging
+import queue
+import sys
+import threading
+
+import pytest
+
+from VfxPipe.utils import logger as logger_module
+from VfxPipe.utils.logger import BoundedQueueHandler, LogThrottle, RingBufferHandler
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def plain_logger():
+    logger = logging.getLogger("VfxPipeTests.throttle")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    yield logger, handler
+    logger.removeHandler(handler)
+
+
+def test_sample_keeps_first_and_last_of_a_short_loop(plain_logger):
+    logger, handler = plain_logger
+    throttle = LogThrottle(logger)
+    for i in range(5):
+        throttle.sample(i, 5, 10, logging.DEBUG, "Iteration %d", i + 1)
+    assert handler.messages == ["Iteration 1", "Iteration 5"]
+    assert list(throttle.suppressed().values()) == [3]
+
+
+def test_sample_every_n_in_a_long_loop(plain_logger):
+    logger, handler = plain_logger
+    throttle = LogThrottle(logger)
+    for i in range(25):
+        throttle.sample(i, 25, 10, logging.DEBUG, "Iteration %d", i + 1)
+    assert handler.messages == ["Iteration 1", "Iteration 11", "Iteration 21", "Iteration 25"]
+
+
+def test_sample_logs_the_last_item_of_a_loop_that_stops_early(plain_logger):
+    logger, handler = plain_logger
+    throttle = LogThrottle(logger)
+    rmse = [3.0, 2.5, 2.0, 1.5, 1.0, 0.5]
+    for i, value in enumerate(rmse):
+        throttle.sample(i, 20, 10, logging.DEBUG, "Iteration %d", i + 1, last=value < 1.0)
+        if value < 1.0:
+            break
+    assert handler.messages == ["Iteration 1", "Iteration 6"]
+
+
+def _record(msg, *args, exc_info=None):
+    return logging.LogRecord("VfxPipeTests", logging.ERROR, __file__, 1, msg, args, exc_info)
+
+
+def test_queue_handler_leaves_the_callers_record_alone():
+    handler = BoundedQueueHandler(queue.Queue())
+    values = [1]
+    try:
+        raise ValueError("bad knob")
+    except ValueError:
+        record = _record("values %s", values, exc_info=sys.exc_info())
+    handler.handle(record)
+    values.append(2)
+
+    queued = handler.queue.get_nowait()
+    assert queued is not record
+    assert (queued.getMessage(), queued.exc_info) == ("values [1]", None)
+    assert "ValueError: bad knob" in queued.exc_text
+    assert (record.msg, record.args, record.exc_text) == ("values %s", (values,), None)
+    assert record.exc_info is not None
+
+
+def test_queue_handler_counts_every_drop():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+    threads = [threading.Thread(target=lambda: [handler.handle(_record("x")) for _ in range(500)])
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert handler.dropped == 8 * 500 - 1
+    assert handler._unreported == handler.dropped
+
+
+def test_ring_buffer_keeps_exception_text():
+    handler = RingBufferHandler(10)
+    try:
+        raise ValueError("bad knob")
+    except ValueError:
+        handler.handle(_record("Solve failed", exc_info=sys.exc_info()))
+    [entry] = handler.snapshot()
+    assert (entry['msg'], entry['exc']) == ("Solve failed", "ValueError: bad knob")
+
+
+def test_ring_buffer_snapshot_while_other_threads_log():
+    handler = RingBufferHandler(100)
+    stop = threading.Event()
+
+    def log():
+        while not stop.is_set():
+            handler.handle(_record("x"))
+
+    threads = [threading.Thread(target=log) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(50):
+            assert len(handler.snapshot(limit=100)) <= 100
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def test_queue_handler_feeds_the_ring_one_resolved_copy(monkeypatch):
+    calls = []
+    resolved = logger_module._resolved
+    monkeypatch.setattr(logger_module, '_resolved', lambda record: calls.append(record) or resolved(record))
+    ring = RingBufferHandler(10)
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), ring=ring)
+    handler.handle(_record("first %d", 1))
+    handler.handle(_record("second %d", 2))
+    assert len(calls) == 2
+    # The queued copy is the one in the ring, and dropped records are kept
+    assert handler.queue.get_nowait() is ring.records[0]
+    assert [entry['msg'] for entry in ring.snapshot()] == ["first 1", "second 2"]
+    assert handler.dropped == 1
@@ -0,0 +1,88 @@
+"""Tests for merging worker snippets into the live script."""
+
+import nuke
+import pytest
+
+from VfxPipe.nuke.tracking import merge
+
+
+def test_relink_only_rewrites_whole_node_names():
+    camera = nuke.createNode("Camera")
+    camera['focal'].setExpression("CameraTracker2.focalLength")
+    camera['haperture'].setExpression("MyCameraTracker2.aperture.x")
+    camera['vaperture'].setExpression("Group1.CameraTracker2.aperture.y")
+    camera['translate'].setExpression("CameraTracker2.camTranslate + CameraTracker2_ref.x")
+
+    merge._relink(camera, "CameraTracker2", "CameraTracker1")
+
+    assert camera['focal'].toScript() == "{CameraTracker1.focalLength}"
+    assert camera['haperture'].toScript() == "{MyCameraTracker2.aperture.x}"
+    assert camera['vaperture'].toScript() == "{Group1.CameraTracker2.aperture.y}"
+    assert camera['translate'].toScript() == "{CameraTracker1.camTranslate + CameraTracker2_ref.x}"
+
+
+def test_merge_snippet_keeps_the_live_tracker(tmp_path):
+    # Worker side: a solved tracker and a camera linked to it
+    solved = nuke.createNode("CameraTracker")
+    solved['solveRMSE'].setValue(0.4)
+    camera = nuke.createNode("Camera")
+    camera.setName("cam_CameraTracker1")
+    camera['focal'].setExpression("CameraTracker1.focalLength")
+    for node in (solved, camera):
+        node['selected'].setValue(True)
+    snippet = tmp_path / "CameraTracker1.nk"
+    nuke.nodeCopy(str(snippet))
+    nuke.scriptClear()
+
+    live = nuke.createNode("CameraTracker")
+    result = merge.merge_snippet(snippet, "CameraTracker1")
+
+    assert nuke.toNode("CameraTracker1") is live
+    assert live['solveRMSE'].value() == 0.4
+    assert result['camera'] == "cam_CameraTracker1"
+    assert nuke.toNode(result['camera'])['focal'].toScript() == "{CameraTracker1.focalLength}"
+    assert [node.Class() for node in nuke.allNodes()] == ["CameraTracker", "Camera3"]
+
+
+def _solved_snippet(tmp_path):
+    solved = nuke.createNode("CameraTracker")
+    solved['solveRMSE'].setValue(0.4)
+    camera = nuke.createNode("Camera")
+    camera['focal'].setExpression("CameraTracker1.focalLength")
+    for node in (solved, camera):
+        node['selected'].setValue(True)
+    snippet = tmp_path / "CameraTracker1.nk"
+    nuke.nodeCopy(str(snippet))
+    nuke.scriptClear()
+    return snippet
+
+
+def test_copy_knobs_skips_knobs_it_cannot_set():
+    source = nuke.createNode("CameraTracker")
+    source['solveRMSE'].setValue(0.4)
+    source['maxErrorThreshold'].setValue(2.5)
+    target = nuke.createNode("CameraTracker")
+
+    def read_only(script):
+        raise TypeError("read-only knob")
+
+    target['maxErrorThreshold'].fromScript = read_only
+    copied = merge.copy_knobs(source, target)
+
+    assert target['solveRMSE'].value() == 0.4
+    assert target['maxErrorThreshold'].value() == 5.0
+    assert copied == len(set(source.knobs()) - merge.SKIPPED_KNOBS) - 1
+
+
+def test_failed_merge_deletes_the_pasted_nodes(tmp_path, monkeypatch):
+    snippet = _solved_snippet(tmp_path)
+    live = nuke.createNode("CameraTracker")
+
+    def broken_relink(node, old_name, new_name):
+        raise RuntimeError("relink failed")
+
+    monkeypatch.setattr(merge, '_relink', broken_relink)
+    with pytest.raises(RuntimeError):
+        merge.merge_snippet(snippet, "CameraTracker1")
+
+    assert nuke.allNodes() == [live]
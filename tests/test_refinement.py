@@ -0,0 +1,120 @@
+"""Tests for the solve refinement strategies."""
+
+import pytest
+
+from VfxPipe.nuke.tools import auto_track
+from VfxPipe.nuke.tracking import refinement
+from VfxPipe.nuke.tracking.refinement import FixedStep, SecantBisection, Thresholds
+
+
+def test_fixed_step_tightens_every_threshold():
+    strategy = FixedStep(target_rmse=1.0)
+    assert strategy.next_thresholds(Thresholds(3, 4.0, 4.0), rmse=2.0) == Thresholds(4, 3.75, 3.75)
+    assert len(strategy.history) == 1
+
+
+def test_secant_bisection_stays_between_start_and_tightest():
+    strategy = SecantBisection(target_rmse=1.0)
+    start = Thresholds(3, 4.0, 4.0)
+    thresholds = strategy.next_thresholds(start, rmse=3.0)
+    assert start.min_len <= thresholds.min_len <= start.min_len + strategy.max_min_len_increase
+    assert 1.0 <= thresholds.max_error < start.max_error
+    # Never more than halfway to the tightest thresholds in one step
+    assert strategy.tightness <= 0.5
+
+
+def test_secant_bisection_stops_at_tightest_thresholds():
+    strategy = SecantBisection(target_rmse=1.0)
+    thresholds = Thresholds(3, 4.0, 4.0)
+    for _ in range(100):
+        thresholds = strategy.next_thresholds(thresholds, rmse=3.0)
+        if thresholds is None:
+            break
+    assert thresholds is None
+    assert strategy.tightness == 1.0
+
+
+def test_strategy_without_propose_cannot_be_created():
+    class Incomplete(refinement.RefinementStrategy):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete(target_rmse=1.0)
+
+
+def test_create_strategy():
+    assert isinstance(refinement.create_strategy(None, 1.0), FixedStep)
+    assert isinstance(refinement.create_strategy("bisect", 1.0), SecantBisection)
+    with pytest.raises(ValueError):
+        refinement.create_strategy("newton", 1.0)
+
+
+@pytest.mark.parametrize("target", [1.5, 1.0, 0.6])
+def test_update_solves_on_simulated_solver(shot_script, target):
+    solves = {}
+    for strategy in ("fixed", "bisect"):
+        params = {'refine_strategy': strategy, 'controlError': target, 'max_iter': 20}
+        summary = auto_track.run_batch(shot_script, ["CameraTracker1"], params, save=False)
+        result = summary['nodes'][0]
+        assert result['converged']
+        assert result['final_rmse'] < target
+        solves[strategy] = result['iterations']
+    assert solves['bisect'] <= solves['fixed']
+
+
+def _refine(strategy, rmse_at, start=Thresholds(3, 4.0, 4.0), max_iter=20):
+    """
+    Run the Auto Track refinement loop against a stand-in solve.
+
+    Returns:
+        (solves, final RMSE, tightness after each bisection step)
+    """
+    thresholds = start
+    steps = []
+    for solves in range(1, max_iter + 1):
+        rmse = rmse_at(thresholds)
+        if rmse < strategy.target_rmse:
+            return solves, rmse, steps
+        before = getattr(strategy, 'tightness', None)
+        thresholds = strategy.next_thresholds(thresholds, rmse)
+        if before is not None:
+            steps.append((before, strategy.tightness))
+        if thresholds is None:
+            break
+    return max_iter, rmse, steps
+
+
+def _plateau_rmse(thresholds):
+    # Barely improves at first, then drops steeply as the error thresholds tighten
+    return 0.3 + 2.7 * (thresholds.max_error / 4.0) ** 4
+
+
+def _overshoot_rmse(thresholds):
+    # Tightening past max_error 2.0 deletes good tracks and makes the solve worse
+    return 0.6 + 0.5 * abs(thresholds.max_error - 2.0) ** 1.5 + 0.02 * thresholds.min_len
+
+
+@pytest.mark.parametrize("rmse_at, target", [
+    (_plateau_rmse, 1.0),
+    (_plateau_rmse, 0.5),
+    (_overshoot_rmse, 1.0),
+])
+def test_bisection_on_non_linear_solves(rmse_at, target):
+    fixed_solves, fixed_rmse, _ = _refine(FixedStep(target), rmse_at)
+    bisect_solves, bisect_rmse, steps = _refine(SecantBisection(target), rmse_at)
+
+    assert fixed_rmse < target
+    assert bisect_rmse < target
+    assert bisect_solves <= fixed_solves
+    for before, after in steps:
+        assert after <= (before + 1.0) / 2.0 + 1e-9
+
+
+def test_bisection_caps_a_long_jump_halfway():
+    # RMSE far above the target: the proportional model asks for more than the
+    # remaining range, and the step is cut to half of it
+    strategy = SecantBisection(target_rmse=1.0)
+    strategy.next_thresholds(Thresholds(3, 4.0, 4.0), rmse=3.0)
+    assert strategy.tightness == 0.5
+    strategy.next_thresholds(strategy._at(0.5), rmse=2.9)
+    assert strategy.tightness == 0.75